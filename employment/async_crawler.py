@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+비동기 채용공고 크롤러 - asyncio/aiohttp 기반 JobCrawler/DetailedJobCrawler 대체 백엔드
+키워드 × 출처별 목록 요청을 동시에 보내고, 고정 sleep 대신 도메인별 토큰 버킷으로 요청 속도 제한
+출처 안의 페이지는 list_window개씩 요청하고 마지막 페이지에서 중단 (동기 FetchEngine.crawl_list와 같은 규칙)
+반환하는 공고 dict는 기존 크롤러와 같으므로 analyze_jobs/save_results를 그대로 사용 가능
+"""
+
+import asyncio
+import time
+from collections import Counter
+from typing import List, Dict, Optional, Tuple
+
+import aiohttp
+
+from crawler import JobCrawler
+from crawler_detailed import DetailedJobCrawler
+from dedup import dedup_jobs
+from pipeline import SOURCES
+
+# 도메인별 (초당 요청 수, 버스트 크기)
+RATE_LIMITS = {
+    'saramin.co.kr': (2.0, 4),
+    'jobkorea.co.kr': (2.0, 4),
+    'wanted.co.kr': (4.0, 8),
+}
+DEFAULT_RATE_LIMIT = (2.0, 4)  # RATE_LIMITS에 없는 도메인 (새로 추가한 어댑터)
+
+
+class TokenBucket:
+    """asyncio용 토큰 버킷 - 초당 rate개 토큰 충전, 최대 capacity개 보관"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        """토큰 하나를 얻을 때까지 대기"""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class AsyncJobCrawler:
+    def __init__(self, rate_limits: Optional[Dict] = None, max_connections: int = 30,
+                 base_urls: Optional[Dict[str, str]] = None):
+        self.rate_limits = rate_limits or RATE_LIMITS
+        self.max_connections = max_connections
+        # 파싱은 기존 크롤러 로직 재사용
+        self.list_crawler = JobCrawler()
+        self.detail_crawler = DetailedJobCrawler()
+        self.headers = dict(self.detail_crawler.headers)
+        for domain, base_url in (base_urls or {}).items():
+            self.set_base_url(domain, base_url)
+        self.stats = Counter()
+
+    def set_base_url(self, domain: str, base_url: str):
+        """도메인의 요청 주소 변경 (로컬 가짜 서버 벤치마크용)"""
+        for crawler in (self.list_crawler, self.detail_crawler):
+            for adapter in crawler.adapters.values():
+                if adapter.domain == domain:
+                    adapter.base_url = base_url
+
+    async def _fetch(self, session: aiohttp.ClientSession, buckets: Dict[str, TokenBucket],
+                     domain: str, url: str, as_json: bool = False):
+        """토큰을 얻은 뒤 요청, 실패 시 None 반환"""
+        if domain not in buckets:
+            buckets[domain] = TokenBucket(*DEFAULT_RATE_LIMIT)
+        await buckets[domain].acquire()
+        self.stats['requests'] += 1
+        try:
+            async with session.get(url) as response:
+                if response.status != 200:
+                    self.stats['errors'] += 1
+                    print(f"  [{domain}] 응답 오류 ({response.status}): {url}")
+                    return None
+                if as_json:
+                    return await response.json(content_type=None)
+                return await response.text()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.stats['errors'] += 1
+            print(f"  [{domain}] 오류 발생 - {e}")
+            return None
+
+    def _session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(limit=self.max_connections)
+        timeout = aiohttp.ClientTimeout(total=10)
+        return aiohttp.ClientSession(headers=self.headers, connector=connector, timeout=timeout)
+
+    def _buckets(self) -> Dict[str, TokenBucket]:
+        return {domain: TokenBucket(rate, capacity) for domain, (rate, capacity) in self.rate_limits.items()}
+
+    # ------------------------------------------------------------------
+    # 목록 크롤링 (JobCrawler 호환)
+    # ------------------------------------------------------------------
+
+    async def _list_page(self, session, buckets, adapter, keyword: str, page: int, url: str) -> Tuple[List[Dict], bool]:
+        """어댑터의 목록 URL 하나 요청 + 파싱 → (공고 목록, 마지막 페이지 여부)
+
+        실패하면 빈 목록 - 한 페이지 오류가 gather 전체를 멈추지 않도록
+        """
+        try:
+            body = await self._fetch(session, buckets, adapter.domain, url, as_json=adapter.list_format == 'json')
+            if body is None:
+                return [], False
+            jobs, item_count = adapter.parse_list(body)
+            last = adapter.is_last_page(body, item_count)
+        except Exception as e:
+            self.stats['errors'] += 1
+            print(f"  [{adapter.name}] '{keyword}' 페이지 {page}: 오류 - {e}")
+            return [], False
+        print(f"  [{adapter.name}] '{keyword}' 페이지 {page}: {item_count}개")
+        return jobs, last
+
+    async def _list_source(self, session, buckets, adapter, keyword: str, pages: int, limit: int) -> List[Dict]:
+        """출처 하나의 목록 - list_window개씩 동시에 요청하고 마지막 페이지에서 중단 (같은 묶음의 뒤 페이지는 버림)"""
+        urls = adapter.list_urls(keyword, pages, limit)
+        window = max(1, adapter.list_window)
+        jobs = []
+        for start in range(0, len(urls), window):
+            results = await asyncio.gather(*(
+                self._list_page(session, buckets, adapter, keyword, page, url)
+                for page, url in enumerate(urls[start:start + window], start + 1)
+            ))
+            for page_jobs, last in results:
+                jobs.extend(page_jobs)
+                if last:
+                    return jobs
+        return jobs
+
+    def _list_tasks(self, session, buckets, adapters, keywords: List[str], pages: int, limit: int) -> List:
+        """키워드 × 출처마다 목록 코루틴 하나 (출처 안의 페이지는 순서대로, 키워드/출처끼리는 동시에)"""
+        return [
+            self._list_source(session, buckets, adapter, keyword, pages, limit)
+            for keyword in keywords
+            for adapter in adapters
+        ]
+
+    async def _crawl(self, keywords: List[str], pages: int, wanted_limit: int) -> List[Dict]:
+        buckets = self._buckets()
+        async with self._session() as session:
+            tasks = self._list_tasks(session, buckets, self.list_crawler.adapters.values(),
+                                     keywords, pages, wanted_limit)
+            # gather는 입력 순서대로 결과를 돌려주므로 동기 크롤러와 같은 순서 유지
+            results = await asyncio.gather(*tasks)
+        return [job for page_jobs in results for job in page_jobs]
+
+    def crawl(self, keywords: List[str], pages: int = 3, wanted_limit: int = 30) -> List[Dict]:
+        """모든 키워드 × 출처 동시 수집 (JobCrawler.crawl_* 결과와 같은 형식)"""
+        self.stats = Counter()
+        return asyncio.run(self._crawl(keywords, pages, wanted_limit))
+
+    # ------------------------------------------------------------------
+    # 목록 + 상세 크롤링 (DetailedJobCrawler 호환)
+    # ------------------------------------------------------------------
+
+    async def _detail(self, session, buckets, job: Dict) -> Dict:
+        c = self.detail_crawler
+        adapter = c.engine.adapter_for(job)
+        url = adapter.detail_url(job) if adapter else None
+        if not url:
+            return job
+        try:
+            body = await self._fetch(session, buckets, adapter.domain, url, as_json=adapter.detail_format == 'json')
+            if body is None:
+                job['error'] = '상세 요청 실패'
+                return job
+            job.update(adapter.parse_detail(body))
+            c.add_requirements(job)
+        except Exception as e:
+            job['error'] = str(e)
+        return job
+
+    async def _crawl_with_details(self, keywords: List[str], saramin_pages: int, wanted_limit: int) -> List[Dict]:
+        buckets = self._buckets()
+        adapters = [self.detail_crawler.adapters[source] for source in SOURCES]
+        async with self._session() as session:
+            tasks = self._list_tasks(session, buckets, adapters, keywords, saramin_pages, wanted_limit)
+            results = await asyncio.gather(*tasks)
+            listing = [job for page_jobs in results for job in page_jobs]
+
+            # 키워드가 겹쳐 다시 나온 공고(같은 공고 ID)와 출처 간 유사 중복은 상세 요청 전에 제외
+            jobs = dedup_jobs(listing)
+            print(f"\n상세 정보 수집 중... ({len(jobs)}개, 중복 {len(listing) - len(jobs)}개 제외)")
+            await asyncio.gather(*(self._detail(session, buckets, job) for job in jobs))
+        return jobs
+
+    def crawl_with_details(self, keywords: List[str], saramin_pages: int = 3, wanted_limit: int = 30) -> List[Dict]:
+        """목록 + 상세 동시 수집 (DetailedJobCrawler.crawl_with_details 결과와 같은 형식)"""
+        self.stats = Counter()
+        return asyncio.run(self._crawl_with_details(keywords, saramin_pages, wanted_limit))
+
+
+def main():
+    crawler = AsyncJobCrawler()
+
+    keywords = ['데이터 엔지니어', '백엔드 개발자', 'backend developer', 'data engineer']
+
+    print("="*60)
+    print("🔍 비동기 채용공고 크롤링 시작")
+    print("="*60)
+
+    start = time.perf_counter()
+    all_jobs = crawler.crawl(keywords, pages=3, wanted_limit=200)
+    elapsed = time.perf_counter() - start
+    print(f"\n수집 완료: {len(all_jobs)}개, {elapsed:.1f}초 (요청 {crawler.stats['requests']}회, 오류 {crawler.stats['errors']}회)")
+
+    # 유사 중복 제거 (정규화 회사명 + 제목 MinHash/LSH, 출처 간 중복 포함)
+    unique_jobs = dedup_jobs(all_jobs)
+
+    print(f"\n중복 제거 후: {len(unique_jobs)}개 (원본: {len(all_jobs)}개)")
+
+    result = crawler.list_crawler.analyze_jobs(unique_jobs)
+    crawler.list_crawler.save_results(unique_jobs, result, output_dir='/home/junhyun/job_crawler')
+
+    print("\n" + "="*60)
+    print("✅ 크롤링 및 분석 완료!")
+    print("="*60)
+
+
+if __name__ == '__main__':
+    main()
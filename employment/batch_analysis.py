@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+대용량 배치 분석 - 누적된 공고(수만 건)를 프로세스 풀로 나눠 분석하고 Counter를 병합
+
+- 코퍼스를 샤드로 나눠 ProcessPoolExecutor에서 집계, 샤드별 Counter를 메인 프로세스에서 합침
+- 자격요건+우대사항 기술 추출 결과는 내용 해시(+ 기술 사전 해시) 기준으로 SQLite에 캐시
+  → 내용이 바뀌지 않은 공고는 다시 스캔하지 않음 (캐시 조회/저장은 메인 프로세스에서만)
+- 결과 형식은 analyze_detailed_jobs와 동일
+
+사용법: python batch_analysis.py jobs_full_*.json jobs_*.jsonl jobs_*.parquet [--workers 4] [--cache extraction_cache.sqlite]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from crawler_detailed import TECH_MATCHER, DetailedJobCrawler
+from job_record import read_parquet
+
+DEFAULT_CACHE = 'extraction_cache.sqlite'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS extractions (
+    content_hash TEXT PRIMARY KEY,
+    techs TEXT NOT NULL
+);
+"""
+
+
+def qualification_text(job: Dict) -> str:
+    return f"{job.get('qualifications', '')} {job.get('preferred', '')}"
+
+
+def content_hash(text: str) -> str:
+    """추출 대상 텍스트 + 기술 사전 해시 (사전이 바뀌면 캐시 키도 바뀜)"""
+    return hashlib.sha1(f"{TECH_MATCHER.fingerprint}\x1f{text}".encode('utf-8')).hexdigest()
+
+
+class ExtractionCache:
+    """내용 해시 → 추출된 기술 목록"""
+
+    def __init__(self, path: str = DEFAULT_CACHE):
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def get_many(self, hashes: Iterable[str]) -> Dict[str, List[str]]:
+        hashes = list(set(hashes))
+        found = {}
+        # SQLite 변수 개수 제한 때문에 나눠서 조회
+        for i in range(0, len(hashes), 500):
+            chunk = hashes[i:i + 500]
+            placeholders = ','.join('?' * len(chunk))
+            for key, techs in self.conn.execute(
+                f"SELECT content_hash, techs FROM extractions WHERE content_hash IN ({placeholders})", chunk
+            ):
+                found[key] = json.loads(techs)
+        return found
+
+    def put_many(self, extracted: Dict[str, List[str]]):
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO extractions VALUES (?, ?)",
+            [(key, json.dumps(techs, ensure_ascii=False)) for key, techs in extracted.items()],
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+# ----------------------------------------------------------------------
+# 워커 (프로세스 풀에서 실행되므로 모듈 최상위 함수)
+# ----------------------------------------------------------------------
+
+def analyze_shard(shard: List[Tuple[Dict, Optional[List[str]]]]) -> Tuple[Dict[str, Counter], Dict[str, List[str]]]:
+    """(공고 요약, 캐시된 추출 결과 또는 None) 목록 → (샤드 Counter들, 새로 추출한 결과)"""
+    counters = {name: Counter() for name in ('total', 'by_source', 'techs', 'qual_techs', 'companies', 'experience')}
+    extracted = {}
+
+    for job, qual_techs in shard:
+        if qual_techs is None:
+            qual_techs = extracted.get(job['hash'])
+            if qual_techs is None:
+                qual_techs = extracted[job['hash']] = TECH_MATCHER.find(job['qual_text'])
+
+        counters['total']['jobs'] += 1
+        counters['total']['with_details'] += job['has_detail']
+        counters['by_source'][job['source']] += 1
+        counters['techs'].update(job['detail_tech_stack'])
+        counters['qual_techs'].update(qual_techs)
+        if job['company']:
+            counters['companies'][job['company']] += 1
+        if job['experience_years']:
+            counters['experience'][job['experience_years']] += 1
+
+    return counters, extracted
+
+
+def _summary(job: Dict) -> Dict:
+    """워커로 보낼 최소 필드 (피클 비용 절감)"""
+    qual_text = qualification_text(job)
+    return {
+        'hash': content_hash(qual_text),
+        'qual_text': qual_text,
+        'source': job.get('source', ''),
+        'company': job.get('company', ''),
+        'experience_years': job.get('experience_years', ''),
+        'detail_tech_stack': job.get('detail_tech_stack', []),
+        'has_detail': bool(job.get('qualifications') or job.get('full_description')),
+    }
+
+
+def analyze_parallel(jobs: List[Dict], workers: Optional[int] = None, cache: Optional[ExtractionCache] = None,
+                     shard_size: int = 2000) -> Dict:
+    """공고 목록을 샤드로 나눠 병렬 집계 → analyze_detailed_jobs와 같은 형식의 결과"""
+    summaries = [_summary(job) for job in jobs]
+    cached = cache.get_many(s['hash'] for s in summaries) if cache else {}
+    items = []
+    for s in summaries:
+        if s['hash'] in cached:
+            s['qual_text'] = ''  # 캐시 적중 공고는 텍스트를 워커로 보내지 않음
+        items.append((s, cached.get(s['hash'])))
+
+    shards = [items[i:i + shard_size] for i in range(0, len(items), shard_size)]
+    totals = {name: Counter() for name in ('total', 'by_source', 'techs', 'qual_techs', 'companies', 'experience')}
+    new_extractions = {}
+
+    if workers == 1 or len(shards) <= 1:
+        for counters, extracted in map(analyze_shard, shards):
+            _merge(totals, counters, new_extractions, extracted)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for counters, extracted in pool.map(analyze_shard, shards):
+                _merge(totals, counters, new_extractions, extracted)
+
+    if cache and new_extractions:
+        cache.put_many(new_extractions)
+
+    print(f"  추출 캐시: 적중 {sum(1 for _, techs in items if techs is not None)}건 / "
+          f"새로 추출 {len(new_extractions)}건 ({len(shards)}개 샤드)")
+
+    return {
+        'total_jobs': totals['total']['jobs'],
+        'jobs_with_details': totals['total']['with_details'],
+        'by_source': dict(totals['by_source']),
+        'tech_frequency': dict(totals['techs'].most_common(40)),
+        'qualification_tech_frequency': dict(totals['qual_techs'].most_common(30)),
+        'top_companies': totals['companies'].most_common(20),
+        'experience_distribution': totals['experience'].most_common(10),
+    }
+
+
+def _merge(totals: Dict[str, Counter], counters: Dict[str, Counter], new_extractions: Dict, extracted: Dict):
+    for name, counter in counters.items():
+        totals[name].update(counter)
+    new_extractions.update(extracted)
+
+
+# Parquet에서 분석에 필요한 컬럼만 읽음
+ANALYSIS_COLUMNS = ['source', 'company', 'experience_years', 'qualifications', 'preferred',
+                    'full_description', 'detail_tech_stack']
+
+
+def load_corpus(paths: List[str]) -> List[Dict]:
+    """jobs_full_*.json(배열) / jobs_*.jsonl(한 줄 한 공고) / jobs_*.parquet 파일들 읽기"""
+    jobs = []
+    parquet_paths = [path for path in paths if path.endswith('.parquet')]
+    if parquet_paths:
+        jobs.extend(read_parquet(parquet_paths, columns=ANALYSIS_COLUMNS).to_pylist())
+    for path in paths:
+        if path.endswith('.parquet'):
+            continue
+        with open(path, encoding='utf-8') as f:
+            if path.endswith('.jsonl'):
+                jobs.extend(json.loads(line) for line in f if line.strip())
+            else:
+                jobs.extend(json.load(f))
+    return jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description='누적 공고 배치 분석 (프로세스 풀)')
+    parser.add_argument('files', nargs='+', help='jobs_full_*.json / jobs_*.jsonl / jobs_*.parquet')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='프로세스 수 (1이면 단일 프로세스)')
+    parser.add_argument('--shard-size', type=int, default=2000)
+    parser.add_argument('--cache', default=DEFAULT_CACHE, help=f'추출 캐시 경로 (기본: {DEFAULT_CACHE})')
+    parser.add_argument('--no-cache', action='store_true')
+    args = parser.parse_args()
+
+    jobs = load_corpus(sorted(args.files))
+    print(f"📂 {len(args.files)}개 파일, {len(jobs)}개 공고 분석 (workers={args.workers})")
+
+    cache = None if args.no_cache else ExtractionCache(args.cache)
+    start = time.perf_counter()
+    result = analyze_parallel(jobs, workers=args.workers, cache=cache, shard_size=args.shard_size)
+    print(f"  분석 시간: {time.perf_counter() - start:.2f}초")
+    if cache:
+        cache.close()
+
+    DetailedJobCrawler.print_analysis(result)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+비동기 백엔드 벤치마크 - JobCrawler(동기, 고정 sleep) vs AsyncJobCrawler(토큰 버킷) 목록 수집 처리량 비교
+로컬 가짜 서버를 사용하므로 실제 사이트에 요청하지 않음
+
+사용법: python benchmarks/bench_async_crawl.py [--keywords 2] [--pages 2] [--latency 0.05]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from async_crawler import AsyncJobCrawler
+from crawler import JobCrawler
+from stub_server import StubServer
+
+KEYWORDS = ['데이터 엔지니어', '백엔드 개발자', 'backend developer', 'data engineer']
+
+
+def run_sync(base_url: str, keywords, pages: int, wanted_limit: int):
+    """기존 main()의 수집 루프 재현 (키워드 간 2초 sleep 포함)"""
+    crawler = JobCrawler()
+    crawler.engine.set_base_url(base_url)
+    jobs = []
+    for keyword in keywords:
+        jobs.extend(crawler.crawl_saramin(keyword, pages=pages))
+        jobs.extend(crawler.crawl_jobkorea(keyword, pages=pages))
+        jobs.extend(crawler.crawl_wanted(keyword, limit=wanted_limit))
+        time.sleep(2)
+    return jobs
+
+
+def run_async(base_url: str, keywords, pages: int, wanted_limit: int):
+    domains = ('saramin.co.kr', 'jobkorea.co.kr', 'wanted.co.kr')
+    crawler = AsyncJobCrawler(base_urls={domain: base_url for domain in domains})
+    return crawler.crawl(keywords, pages=pages, wanted_limit=wanted_limit)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='비동기 목록 수집 처리량 벤치마크')
+    parser.add_argument('--keywords', type=int, default=2, help=f'사용할 키워드 수 (최대 {len(KEYWORDS)})')
+    parser.add_argument('--pages', type=int, default=2)
+    parser.add_argument('--wanted-limit', type=int, default=30)
+    parser.add_argument('--latency', type=float, default=0.05, help='가짜 서버 응답 지연(초)')
+    args = parser.parse_args()
+    keywords = KEYWORDS[:args.keywords]
+
+    results = {}
+    with StubServer(latency=args.latency) as server:
+        for mode, runner in (('sync', run_sync), ('async', run_async)):
+            before = server.request_count
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                jobs = runner(server.base_url, keywords, args.pages, args.wanted_limit)
+            elapsed = time.perf_counter() - start
+            results[mode] = (elapsed, len(jobs), server.request_count - before)
+
+    print("=" * 60)
+    print(f"📊 목록 수집 벤치마크 (키워드 {len(keywords)}개 × 페이지 {args.pages}, 지연 {args.latency * 1000:.0f}ms)")
+    print("=" * 60)
+    for mode, (elapsed, count, requests) in results.items():
+        print(f"  {mode:5} | {elapsed:6.2f}s | 요청 {requests:3}회 | 공고 {count:4}개 | {count / elapsed:7.1f} 공고/s")
+    print(f"\n  처리량 향상: {results['sync'][0] / results['async'][0]:.1f}배")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+상세 수집 벤치마크 - 기존 순차 루프 vs 병렬 fetch_details 처리량 비교
+로컬 스텁 서버를 사용하므로 실제 사이트에 요청하지 않음
+
+사용법: python benchmarks/bench_detail_fetch.py [--jobs 200] [--latency 0.05] [--workers 8]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawler_detailed import DetailedJobCrawler
+from stub_server import StubServer
+
+
+def make_jobs(base_url: str, count: int):
+    """사람인/원티드 공고를 반씩 섞은 목록"""
+    jobs = []
+    for i in range(count):
+        if i % 2 == 0:
+            rec_idx = str(52000000 + i)
+            jobs.append({
+                'source': '사람인',
+                'title': f'데이터 엔지니어 {i}',
+                'company': f'회사{i}',
+                'rec_idx': rec_idx,
+                'link': f"{base_url}/zf_user/jobs/relay/view?rec_idx={rec_idx}",
+                'conditions': [],
+            })
+        else:
+            jobs.append({
+                'source': '원티드',
+                'title': f'Data Engineer {i}',
+                'company': f'회사{i}',
+                'job_id': 300000 + i,
+                'link': f"https://www.wanted.co.kr/wd/{300000 + i}",
+                'conditions': [],
+            })
+    return jobs
+
+
+def run_sequential(crawler: DetailedJobCrawler, jobs, delay: float):
+    """기존 crawl_with_details의 순차 루프 재현 (요청마다 고정 sleep)"""
+    for job in jobs:
+        crawler.get_detail(job)
+        time.sleep(delay)
+    return jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description='상세 수집 처리량 벤치마크')
+    parser.add_argument('--jobs', type=int, default=200)
+    parser.add_argument('--latency', type=float, default=0.05, help='스텁 서버 응답 지연(초)')
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--per-host', type=int, default=4)
+    parser.add_argument('--min-interval', type=float, default=0.1)
+    parser.add_argument('--sleep', type=float, default=0.3, help='순차 루프의 요청 간격(초)')
+    args = parser.parse_args()
+
+    with StubServer(latency=args.latency) as server:
+        results = {}
+        for mode in ('sequential', 'concurrent'):
+            crawler = DetailedJobCrawler(
+                max_workers=args.workers, per_host=args.per_host, min_interval=args.min_interval
+            )
+            crawler.engine.set_base_url(server.base_url)
+            jobs = make_jobs(server.base_url, args.jobs)
+
+            start = time.perf_counter()
+            if mode == 'sequential':
+                run_sequential(crawler, jobs, args.sleep)
+            else:
+                crawler.fetch_details(jobs)
+            elapsed = time.perf_counter() - start
+
+            with_details = sum(1 for j in jobs if j.get('qualifications'))
+            results[mode] = (elapsed, with_details)
+
+    print("\n" + "=" * 60)
+    print(f"📊 상세 수집 벤치마크 ({args.jobs}건, 지연 {args.latency * 1000:.0f}ms)")
+    print("=" * 60)
+    for mode, (elapsed, with_details) in results.items():
+        print(f"  {mode:11} | {elapsed:7.2f}s | {args.jobs / elapsed:7.1f} 건/s | 상세 {with_details}건")
+    speedup = results['sequential'][0] / results['concurrent'][0]
+    print(f"\n  처리량 향상: {speedup:.1f}배")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+HTML 파싱 벤치마크 - 파서 백엔드(lxml / bs4)별 초당 처리 페이지 수
+fixtures 디렉터리의 저장된 HTML을 사용 (saramin_list_*.html, jobkorea_list_*.html, saramin_detail_*.html)
+디렉터리가 비어 있으면 stub_server의 페이지 생성기로 만든 HTML 사용 (--save로 저장 가능)
+
+사용법: python benchmarks/bench_html_parse.py [--fixtures DIR] [--repeat 5] [--save]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from html_parser import PARSERS, lxml
+from stub_server import jobkorea_list_html, saramin_detail_html, saramin_list_html
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# 페이지 종류 → 파서 메서드
+KINDS = {
+    'saramin_list': 'saramin_list',
+    'jobkorea_list': 'jobkorea_list',
+    'saramin_detail': 'saramin_detail',
+}
+
+
+def generated_fixtures():
+    return {
+        'saramin_list': [saramin_list_html(page) for page in range(1, 6)],
+        'jobkorea_list': [jobkorea_list_html(page) for page in range(1, 6)],
+        'saramin_detail': [saramin_detail_html(str(50001000 + i)) for i in range(20)],
+    }
+
+
+def load_fixtures(directory: str):
+    fixtures = {}
+    for kind in KINDS:
+        pages = []
+        for path in sorted(glob.glob(os.path.join(directory, f'{kind}_*.html'))):
+            with open(path, encoding='utf-8') as f:
+                pages.append(f.read())
+        if pages:
+            fixtures[kind] = pages
+    return fixtures
+
+
+def save_fixtures(directory: str, fixtures):
+    os.makedirs(directory, exist_ok=True)
+    for kind, pages in fixtures.items():
+        for i, html in enumerate(pages, 1):
+            with open(os.path.join(directory, f'{kind}_{i:03d}.html'), 'w', encoding='utf-8') as f:
+                f.write(html)
+
+
+def bench(func, pages, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for html in pages:
+            func(html)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTML 파서 백엔드 벤치마크')
+    parser.add_argument('--fixtures', default=FIXTURE_DIR, help='저장된 HTML 디렉터리')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--save', action='store_true', help='생성한 HTML을 fixtures 디렉터리에 저장')
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.fixtures)
+    source = args.fixtures
+    if not fixtures:
+        fixtures = generated_fixtures()
+        source = 'stub_server 생성 페이지'
+        if args.save:
+            save_fixtures(args.fixtures, fixtures)
+            print(f"💾 fixtures 저장: {args.fixtures}")
+
+    backends = {name: cls() for name, cls in PARSERS.items() if name != 'lxml' or lxml is not None}
+
+    # 백엔드 간 결과가 같은지 먼저 확인
+    for kind, method in KINDS.items():
+        results = {name: [getattr(p, method)(html) for html in fixtures.get(kind, [])] for name, p in backends.items()}
+        if len({repr(r) for r in results.values()}) > 1:
+            print(f"⚠️  {kind}: 백엔드별 파싱 결과가 다름")
+
+    print("=" * 60)
+    print(f"📊 HTML 파싱 벤치마크 ({source})")
+    print("=" * 60)
+    for kind, method in KINDS.items():
+        pages = fixtures.get(kind)
+        if not pages:
+            continue
+        size_kb = sum(len(html) for html in pages) / 1024
+        print(f"\n[{kind}] {len(pages)}페이지, {size_kb:,.0f}KB")
+        times = {}
+        for name, backend in backends.items():
+            times[name] = bench(getattr(backend, method), pages, args.repeat)
+            print(f"  {name:5} | {times[name] * 1000:8.1f}ms | {len(pages) / times[name]:8.0f} 페이지/s")
+        if 'lxml' in times:
+            print(f"  속도 향상: {times['bs4'] / times['lxml']:.1f}배")
+
+
+if __name__ == '__main__':
+    main()
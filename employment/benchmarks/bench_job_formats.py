@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+공고 저장 형식 로드 벤치마크 - CSV / 전체 JSON / Parquet 로드 시간과 메모리(RSS)
+저장된 jobs_full_*.json을 N배 복제해 '한 달치 이력' 크기 코퍼스를 만든 뒤
+_dump_job_files로 세 형식을 모두 저장하고, 형식별로 새 프로세스에서 로드해 측정
+
+사용법: python benchmarks/bench_job_formats.py [--file jobs_full_xxx.json] [--copies 60]
+"""
+
+import argparse
+import glob
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+# 형식별 로드 방법 (자식 프로세스에서 실행)
+LOADERS = {
+    'csv (pandas)': 'csv',
+    'json (list[dict])': 'json',
+    'parquet (Table 전체)': 'parquet',
+    'parquet (list[Job])': 'parquet-jobs',
+    'parquet (분석 컬럼 스캔)': 'parquet-scan',
+}
+
+
+def _rss_mb() -> float:
+    """최대 RSS (MB) - ru_maxrss는 fork한 부모의 최댓값을 물려받으므로 /proc의 VmHWM 우선"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def child(kind: str, path: str):
+    """형식 하나 로드 후 '시간(초) RSS증가(MB) 건수' 출력"""
+    if kind == 'csv':
+        import pandas as pd
+    else:
+        import job_record
+        import pyarrow
+        import pyarrow.compute as pc
+        import pyarrow.dataset  # read_table이 처음 호출될 때 지연 import하는 모듈 (측정에서 제외)
+        job_record._require_pyarrow()
+        pc.value_counts(pyarrow.array(['warmup']))
+    base_rss = _rss_mb()
+    start = time.perf_counter()
+
+    if kind == 'csv':
+        count = len(pd.read_csv(path, encoding='utf-8-sig'))
+    elif kind == 'json':
+        with open(path, encoding='utf-8') as f:
+            count = len(json.load(f))
+    elif kind == 'parquet':
+        count = job_record.read_parquet(path).num_rows
+    elif kind == 'parquet-jobs':
+        count = len(job_record.load_jobs(path))
+    else:
+        # 분석에 필요한 컬럼만 읽고 기술 빈도까지 컬럼 연산으로 계산
+        table = job_record.read_parquet(path, columns=['source', 'company', 'detail_tech_stack'])
+        pc.value_counts(pc.list_flatten(table.column('detail_tech_stack')))
+        pc.value_counts(table.column('company'))
+        count = table.num_rows
+
+    print(f"{time.perf_counter() - start} {_rss_mb() - base_rss} {count}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='공고 저장 형식 로드 벤치마크')
+    parser.add_argument('--file', help='jobs_full_*.json 경로 (기본: 가장 최근 파일)')
+    parser.add_argument('--copies', type=int, default=60, help='복제 배수 (기본 60 ≈ 하루 2회 × 30일)')
+    parser.add_argument('--child', nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(*args.child)
+        return
+
+    import job_record
+    if not job_record.HAS_PYARROW:
+        print("pyarrow가 설치되어 있지 않습니다: pip install pyarrow")
+        return
+    from crawler_detailed import DetailedJobCrawler
+
+    path = args.file or sorted(glob.glob(os.path.join(BASE_DIR, 'jobs_full_*.json')))[-1]
+    with open(path, encoding='utf-8') as f:
+        jobs = json.load(f)
+    corpus = [dict(job) for _ in range(args.copies) for job in jobs]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        DetailedJobCrawler()._dump_job_files(corpus, tmp, 'bench')
+        files = {
+            'csv': os.path.join(tmp, 'jobs_detailed_bench.csv'),
+            'json': os.path.join(tmp, 'jobs_full_bench.json'),
+            'parquet': os.path.join(tmp, 'jobs_bench.parquet'),
+        }
+
+        print("=" * 70)
+        print(f"📊 공고 저장 형식 로드 벤치마크 ({len(corpus):,}건 = {len(jobs)}건 × {args.copies})")
+        print("=" * 70)
+        for name, file_path in files.items():
+            print(f"  {name:8} 파일 크기: {os.path.getsize(file_path) / 1024 / 1024:7.1f}MB")
+        print()
+
+        for label, kind in LOADERS.items():
+            file_path = files[kind.split('-')[0]]
+            out = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--child', kind, file_path],
+                capture_output=True, text=True, check=True, cwd=BASE_DIR,
+            ).stdout.split()
+            elapsed, rss, count = float(out[0]), float(out[1]), int(out[2])
+            print(f"  {label:24} | {elapsed * 1000:8.1f}ms | RSS +{rss:7.1f}MB | {count:,}건")
+
+    print("\n  * CSV는 본문을 500자로 자른 요약본이라 전체 데이터가 아님")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+오프라인 벤치마크 모음 - 녹화한 응답(recorder.py)을 재생 서버(replay_server.py)로 돌려
+전체 흐름과 단계별 처리량/메모리를 측정하고 결과를 JSON으로 저장 (버전 간 비교용)
+
+측정 항목 (항목마다 새 프로세스에서 실행해 최대 RSS를 따로 측정)
+- detail_crawl: DetailedJobCrawler.crawl_with_details (목록 + 중복 제거 + 상세)
+- list_crawl  : crawler.run_crawl (JobCrawler.main 흐름: 목록 + 중복 제거 + 분석 + 저장, 키워드 간 sleep 제외)
+- parse_lxml / parse_bs4: 녹화 응답을 어댑터로 파싱
+- extract     : 상세 공고의 경력/학력/연봉 + 기술스택 추출
+
+녹화가 없으면 stub_server 합성 녹화를 만들어 사용 (실제 사이트 응답은 recorder.py로 녹화)
+이전 결과 파일과 비교해 처리량 감소/메모리 증가가 threshold 이상이면 표시
+
+사용법: python benchmarks/bench_suite.py [--recording DIR] [--latency 0.02] [--error-rate 0.02] [--compare FILE]
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+from recorder import RECORDING_DIR, record_stub
+from replay_server import ReplayServer, load_recording
+
+RESULT_DIR = os.path.join(BENCH_DIR, 'results')
+CASES = ['detail_crawl', 'list_crawl', 'parse_lxml', 'parse_bs4', 'extract']
+
+# 비교 지표 → 높을수록 좋은지
+COMPARE_METRICS = {'pages_per_sec': True, 'postings_per_sec': True, 'peak_rss_mb': False}
+
+
+def _rss_mb() -> float:
+    """최대 RSS (MB) - /proc의 VmHWM 우선 (bench_job_formats와 동일)"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+# ----------------------------------------------------------------------
+# 자식 프로세스: 항목 하나 실행
+# ----------------------------------------------------------------------
+
+def _recorded_bodies(recording: str):
+    """(출처, 종류, 본문) - json 응답은 디코드해서 반환"""
+    manifest, responses = load_recording(recording)
+    bodies = []
+    for key, entry in manifest['responses'].items():
+        body = responses[key][2].decode('utf-8')
+        bodies.append((entry['source'], entry['kind'], json.loads(body) if 'json' in entry['content_type'] else body))
+    return manifest, bodies
+
+
+def _parse_all(adapters, bodies):
+    """녹화 응답 전체 파싱 → (목록 공고 수, 상세 공고 목록)"""
+    listed, details = 0, []
+    for source, kind, body in bodies:
+        adapter = adapters[source]
+        if kind == 'list':
+            listed += len(adapter.parse_list(body)[0])
+        else:
+            details.append(dict(adapter.parse_detail(body), source=source))
+    return listed, details
+
+
+def run_case(case: str, recording: str, base_url: str, args) -> dict:
+    """항목 하나 측정 → {seconds, pages, postings}"""
+    manifest = load_recording(recording)[0]
+    keywords = manifest['keywords']
+
+    if case == 'detail_crawl':
+        from crawler_detailed import DetailedJobCrawler
+        crawler = DetailedJobCrawler(max_workers=args.workers, per_host=args.per_host, min_interval=args.min_interval)
+        crawler.engine.set_base_url(base_url)
+        start = time.perf_counter()
+        jobs = crawler.crawl_with_details(keywords, saramin_pages=manifest['pages'],
+                                          wanted_limit=manifest['wanted_limit'])
+        seconds = time.perf_counter() - start
+        detailed = sum(1 for job in jobs if job.get('qualifications') or job.get('full_description'))
+        return {'seconds': seconds, 'postings': len(jobs),
+                'detail_coverage': round(detailed / len(jobs), 3) if jobs else 0,
+                'engine': dict(crawler.engine.stats)}
+
+    if case == 'list_crawl':
+        from crawler import run_crawl
+        with tempfile.TemporaryDirectory() as tmp:
+            start = time.perf_counter()
+            jobs, _ = run_crawl(keywords, tmp, pages=manifest['pages'], wanted_limit=manifest['wanted_limit'],
+                                keyword_delay=0, base_url=base_url, min_interval=args.min_interval)
+            return {'seconds': time.perf_counter() - start, 'postings': len(jobs)}
+
+    from crawler_detailed import DetailedJobCrawler
+    _, bodies = _recorded_bodies(recording)
+
+    if case.startswith('parse_'):
+        from html_parser import PARSERS
+        from sources import build_adapters
+        crawler = DetailedJobCrawler()
+        adapters = build_adapters(PARSERS[case.split('_', 1)[1]](), crawler.extract_tech_stack)
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            listed, details = _parse_all(adapters, bodies)
+        return {'seconds': time.perf_counter() - start, 'pages': len(bodies) * args.repeat,
+                'postings': (listed + len(details)) * args.repeat}
+
+    if case == 'extract':
+        crawler = DetailedJobCrawler()
+        _, details = _parse_all(crawler.adapters, bodies)
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for job in details:
+                crawler.add_requirements(dict(job))
+                crawler.extract_tech_stack(f"{job.get('qualifications', '')} {job.get('preferred', '')}")
+        return {'seconds': time.perf_counter() - start, 'postings': len(details) * args.repeat}
+
+    raise ValueError(f"알 수 없는 항목: {case}")
+
+
+def child(case: str, recording: str, base_url: str, args):
+    """항목 실행 후 결과 JSON 한 줄 출력 (측정 중 출력은 버림)"""
+    base_rss = _rss_mb()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = run_case(case, recording, base_url, args)
+    result.update(peak_rss_mb=round(_rss_mb(), 1), rss_growth_mb=round(_rss_mb() - base_rss, 1))
+    print(json.dumps(result))
+
+
+# ----------------------------------------------------------------------
+# 부모 프로세스: 재생 서버 + 항목별 자식 실행 + 저장/비교
+# ----------------------------------------------------------------------
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=BASE_DIR, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+
+def _child_args(args) -> list:
+    return ['--repeat', str(args.repeat), '--workers', str(args.workers), '--per-host', str(args.per_host),
+            '--min-interval', str(args.min_interval)]
+
+
+def run_suite(args, recording: str) -> dict:
+    results = {}
+    with ReplayServer(recording, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                      error_status=args.error_status, seed=args.seed,
+                      retry_after=args.retry_after) as server:
+        for case in args.cases:
+            before = dict(server.stats)
+            out = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--child', case, recording, server.base_url,
+                 *_child_args(args)],
+                capture_output=True, text=True, cwd=BASE_DIR,
+            )
+            if out.returncode != 0:
+                print(f"  {case:14} | 실패\n{out.stderr[-2000:]}")
+                continue
+            result = json.loads(out.stdout.strip().splitlines()[-1])
+            served = {key: server.stats[key] - before.get(key, 0) for key in server.stats}
+            if served.get('requests'):
+                result['pages'] = served['requests']
+                result['server'] = served
+            seconds = result['seconds']
+            result['pages_per_sec'] = round(result.get('pages', 0) / seconds, 1) if seconds else 0
+            result['postings_per_sec'] = round(result['postings'] / seconds, 1) if seconds else 0
+            result['seconds'] = round(seconds, 3)
+            results[case] = result
+            print(f"  {case:14} | {seconds:7.2f}s | {result['pages_per_sec']:8.1f} 페이지/s | "
+                  f"{result['postings_per_sec']:9.1f} 공고/s | 최대 RSS {result['peak_rss_mb']:6.1f}MB"
+                  + (f" | 상세 {result['detail_coverage']:.0%}" if 'detail_coverage' in result else ''))
+    return results
+
+
+def compare(results: dict, previous: dict, threshold: float):
+    """이전 결과 대비 변화율 출력 (나빠진 쪽으로 threshold 이상이면 ⚠️)"""
+    print(f"\n📈 이전 결과 대비 ({previous['meta'].get('timestamp')}, {previous['meta'].get('git') or '-'})")
+    for case, result in results.items():
+        old = previous['results'].get(case)
+        if not old:
+            continue
+        parts = []
+        for metric, higher_is_better in COMPARE_METRICS.items():
+            if not old.get(metric) or metric not in result:
+                continue
+            change = (result[metric] - old[metric]) / old[metric]
+            worse = -change if higher_is_better else change
+            flag = ' ⚠️' if worse >= threshold else ''
+            parts.append(f"{metric} {change:+.1%}{flag}")
+        print(f"  {case:14} | {' | '.join(parts)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='녹화 응답 재생 기반 오프라인 벤치마크')
+    parser.add_argument('--recording', help='녹화 디렉터리 (기본: recordings/live, 없으면 합성 녹화)')
+    parser.add_argument('--cases', nargs='+', choices=CASES, default=CASES)
+    parser.add_argument('--latency', type=float, default=0.02, help='재생 서버 응답 지연(초)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='추가 지연 0~jitter초 난수')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='오류 응답 주입 비율 (0~1)')
+    parser.add_argument('--error-status', type=int, default=503, help='주입할 오류 상태 코드 (0이면 연결 종료)')
+    parser.add_argument('--retry-after', type=int, default=0, help='주입한 429/503에 붙일 Retry-After(초)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=20, help='파싱/추출 반복 횟수')
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--per-host', type=int, default=4)
+    parser.add_argument('--min-interval', type=float, default=0.0, help='출처별 요청 간격(초)')
+    parser.add_argument('--out', help='결과 JSON 경로 (기본: results/bench_<시각>.json)')
+    parser.add_argument('--compare', help='비교할 이전 결과 JSON (기본: results의 가장 최근 파일)')
+    parser.add_argument('--threshold', type=float, default=0.1, help='회귀로 표시할 변화율')
+    parser.add_argument('--child', nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(*args.child, args)
+        return
+
+    recording = args.recording
+    if not recording:
+        recording = os.path.join(RECORDING_DIR, 'live')
+        if not os.path.exists(os.path.join(recording, 'manifest.json')):
+            recording = os.path.join(RECORDING_DIR, 'stub')
+            if not os.path.exists(os.path.join(recording, 'manifest.json')):
+                print("녹화가 없어 stub_server 합성 녹화 생성 중...")
+                with contextlib.redirect_stdout(io.StringIO()):
+                    record_stub(recording, ['데이터 엔지니어', '백엔드 개발자'])
+    manifest = load_recording(recording)[0]
+
+    print("=" * 78)
+    print(f"📊 오프라인 벤치마크 ({os.path.relpath(recording, BASE_DIR)}, 응답 {len(manifest['responses'])}개, "
+          f"지연 {args.latency * 1000:.0f}ms, 오류 {args.error_rate:.0%})")
+    print("=" * 78)
+    results = run_suite(args, recording)
+
+    os.makedirs(RESULT_DIR, exist_ok=True)
+    previous_path = args.compare or (sorted(glob.glob(os.path.join(RESULT_DIR, 'bench_*.json'))) or [None])[-1]
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    report = {
+        'meta': {
+            'timestamp': timestamp,
+            'git': _git_revision(),
+            'python': platform.python_version(),
+            'recording': os.path.relpath(recording, BASE_DIR),
+            'synthetic': manifest.get('synthetic', False),
+            'latency': args.latency, 'jitter': args.jitter,
+            'error_rate': args.error_rate, 'error_status': args.error_status, 'retry_after': args.retry_after,
+            'workers': args.workers, 'per_host': args.per_host, 'min_interval': args.min_interval,
+            'repeat': args.repeat,
+        },
+        'results': results,
+    }
+    out_path = args.out or os.path.join(RESULT_DIR, f"bench_{timestamp}.json")
+    with open(out_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n📁 결과 저장: {out_path}")
+
+    if previous_path and os.path.abspath(previous_path) != os.path.abspath(out_path):
+        with open(previous_path, encoding='utf-8') as f:
+            compare(results, json.load(f), args.threshold)
+
+
+if __name__ == '__main__':
+    main()
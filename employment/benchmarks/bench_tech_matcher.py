@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+기술스택 추출 마이크로 벤치마크 - 기존 별칭별 substring 검색 vs TechMatcher(컴파일된 정규식)
+저장된 jobs_full_*.json 코퍼스를 사용, matcher가 legacy보다 느리면 실패(종료 코드 1)
+짧은 별칭 오탐이 줄었는지도 함께 출력
+
+사용법: python benchmarks/bench_tech_matcher.py [--file jobs_full_xxx.json] [--repeat 5]
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from collections import Counter
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from crawler_detailed import TECH_KEYWORDS, TECH_MATCHER
+
+
+def legacy_extract(text: str):
+    """변경 전 extract_tech_stack 구현"""
+    found_techs = []
+    text_lower = text.lower()
+    for tech, keywords in TECH_KEYWORDS.items():
+        for keyword in keywords:
+            if keyword.lower() in text_lower:
+                found_techs.append(tech)
+                break
+    return list(set(found_techs))
+
+
+def job_text(job):
+    return f"{job.get('qualifications', '')} {job.get('preferred', '')} {job.get('responsibilities', '')} {job.get('full_description', '')}"
+
+
+def bench(func, texts, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='기술스택 추출 벤치마크')
+    parser.add_argument('--file', help='jobs_full_*.json 경로 (기본: 가장 최근 파일)')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    path = args.file or sorted(glob.glob(os.path.join(BASE_DIR, 'jobs_full_*.json')))[-1]
+    with open(path, encoding='utf-8') as f:
+        jobs = json.load(f)
+    texts = [job_text(job) for job in jobs]
+    total_chars = sum(len(t) for t in texts)
+
+    legacy_time = bench(legacy_extract, texts, args.repeat)
+    matcher_time = bench(TECH_MATCHER.find, texts, args.repeat)
+
+    print("=" * 60)
+    print(f"📊 기술스택 추출 벤치마크 ({os.path.basename(path)}: {len(texts)}건, {total_chars:,}자)")
+    print("=" * 60)
+    print(f"  legacy  | {legacy_time * 1000:7.1f}ms | {total_chars / legacy_time / 1e6:5.2f} M자/s")
+    print(f"  matcher | {matcher_time * 1000:7.1f}ms | {total_chars / matcher_time / 1e6:5.2f} M자/s")
+    print(f"\n  속도 향상: {legacy_time / matcher_time:.2f}배")
+
+    # 짧은 별칭 오탐 비교 (원티드 공고)
+    wanted = [job_text(j) for j in jobs if j.get('source') == '원티드']
+    legacy_counts = Counter(t for text in wanted for t in legacy_extract(text))
+    matcher_counts = Counter(t for text in wanted for t in TECH_MATCHER.find(text))
+    print(f"\n🔍 원티드 {len(wanted)}건 기준 등장 수 변화 (legacy → matcher)")
+    changed = sorted(set(legacy_counts) | set(matcher_counts),
+                     key=lambda t: legacy_counts[t] - matcher_counts[t], reverse=True)
+    for tech in changed[:10]:
+        if legacy_counts[tech] != matcher_counts[tech]:
+            print(f"  {tech:15} {legacy_counts[tech]:4} → {matcher_counts[tech]:4}")
+
+    if matcher_time >= legacy_time:
+        raise SystemExit(f"❌ matcher가 legacy보다 느림 ({matcher_time * 1000:.1f}ms ≥ {legacy_time * 1000:.1f}ms)")
+
+
+if __name__ == '__main__':
+    main()
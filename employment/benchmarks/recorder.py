@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+응답 녹화 - 사람인/잡코리아/원티드 실제 응답을 한 번 받아 디렉터리에 저장 (replay_server.py로 재생)
+
+녹화 디렉터리 구조
+- manifest.json: 녹화 설정(키워드, 페이지 수, 원티드 건수)과 요청 경로 → 응답 파일/상태/Content-Type/출처/종류(list·detail)
+- responses/NNNNN.html|json: 응답 본문
+
+요청 경로(path?query)를 키로 저장하므로 재생할 때는 엔진의 set_base_url로 모든 출처를 재생 서버 하나에 보내면 됨
+--stub을 주면 실제 사이트 대신 stub_server를 녹화 (네트워크 없이 벤치마크용 합성 녹화 생성)
+
+사용법: python benchmarks/recorder.py --out benchmarks/recordings/live [--keywords 2] [--pages 1] [--details 10]
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from crawler_detailed import DEFAULT_KEYWORDS, DetailedJobCrawler
+from pipeline import SOURCES
+
+RECORDING_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'recordings')
+
+
+def request_key(url: str) -> str:
+    """녹화/재생 키 - 호스트를 뺀 path?query"""
+    parts = urlsplit(url)
+    return parts.path + ('?' + parts.query if parts.query else '')
+
+
+class Recorder:
+    """FetchEngine의 요청을 가로채 200 응답을 저장"""
+
+    def __init__(self, out_dir: str):
+        self.out_dir = out_dir
+        self.responses = {}
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(out_dir, 'responses'), exist_ok=True)
+
+    def attach(self, engine):
+        """engine._get을 녹화하는 함수로 교체"""
+        get = engine._get
+        list_paths = {
+            name: urlsplit(adapter.list_urls('x', 1, 1)[0]).path for name, adapter in engine.adapters.items()
+        }
+
+        def recording_get(adapter, url):
+            response = get(adapter, url)
+            if response.status_code == 200:
+                kind = 'list' if urlsplit(url).path == list_paths[adapter.name] else 'detail'
+                self.save(url, response, adapter.name, kind)
+            return response
+
+        engine._get = recording_get
+
+    def save(self, url: str, response, source: str, kind: str):
+        key = request_key(url)
+        content_type = response.headers.get('Content-Type', 'text/html; charset=utf-8')
+        with self._lock:
+            if key in self.responses:
+                return
+            ext = 'json' if 'json' in content_type else 'html'
+            filename = f"responses/{len(self.responses):05d}.{ext}"
+            self.responses[key] = {
+                'file': filename, 'status': 200, 'content_type': content_type, 'source': source, 'kind': kind,
+            }
+        with open(os.path.join(self.out_dir, filename), 'wb') as f:
+            f.write(response.content)
+
+    def write_manifest(self, **settings):
+        manifest = dict(settings, created=datetime.now().isoformat(timespec='seconds'), responses=self.responses)
+        with open(os.path.join(self.out_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=1)
+
+
+def record(out_dir: str, keywords: List[str], pages: int = 1, wanted_limit: int = 50, details: int = 10,
+           base_url: Optional[str] = None, min_interval: float = 1.0) -> Dict:
+    """키워드 × 출처 목록과 출처마다 앞쪽 details개 공고의 상세를 녹화 → manifest"""
+    crawler = DetailedJobCrawler(max_workers=2, per_host=1, min_interval=min_interval)
+    if base_url:
+        crawler.engine.set_base_url(base_url)
+    recorder = Recorder(out_dir)
+    recorder.attach(crawler.engine)
+
+    for keyword in keywords:
+        for source in SOURCES:
+            jobs = crawler.crawl_list(source, keyword, pages=pages, limit=wanted_limit)
+            crawler.fetch_details(jobs[:details], label=f"[{source}] 상세 ")
+
+    recorder.write_manifest(keywords=keywords, pages=pages, wanted_limit=wanted_limit, details=details,
+                            synthetic=bool(base_url))
+    return recorder.responses
+
+
+def record_stub(out_dir: str, keywords: List[str], pages: int = 1, wanted_limit: int = 50, details: int = 10) -> Dict:
+    """stub_server 응답을 녹화 (합성 녹화)"""
+    from stub_server import StubServer
+    with StubServer(latency=0) as server:
+        return record(out_dir, keywords, pages, wanted_limit, details, base_url=server.base_url, min_interval=0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='채용 사이트 응답 녹화 (벤치마크 재생용)')
+    parser.add_argument('--out', default=os.path.join(RECORDING_DIR, 'live'), help='녹화 디렉터리')
+    parser.add_argument('--keywords', type=int, default=2, help=f'사용할 키워드 수 (최대 {len(DEFAULT_KEYWORDS)})')
+    parser.add_argument('--pages', type=int, default=1, help='사람인/잡코리아 페이지 수')
+    parser.add_argument('--wanted-limit', type=int, default=50, help='원티드 키워드당 공고 수')
+    parser.add_argument('--details', type=int, default=10, help='키워드 × 출처마다 상세를 녹화할 공고 수')
+    parser.add_argument('--min-interval', type=float, default=1.0, help='같은 출처 요청 간격(초)')
+    parser.add_argument('--stub', action='store_true', help='실제 사이트 대신 stub_server 녹화')
+    args = parser.parse_args()
+
+    keywords = DEFAULT_KEYWORDS[:args.keywords]
+    if args.stub:
+        responses = record_stub(args.out, keywords, args.pages, args.wanted_limit, args.details)
+    else:
+        responses = record(args.out, keywords, args.pages, args.wanted_limit, args.details,
+                           min_interval=args.min_interval)
+
+    kinds = Counter((entry['source'], entry['kind']) for entry in responses.values())
+    print(f"\n📼 녹화 완료: {args.out} (응답 {len(responses)}개)")
+    for (source, kind), count in sorted(kinds.items()):
+        print(f"   - {source} {kind}: {count}개")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+녹화 재생 서버 - recorder.py로 저장한 응답을 로컬 HTTP 서버로 다시 내려줌 (응답 지연/오류 주입 가능)
+
+- 요청 경로(path?query)가 녹화에 있으면 그 응답
+- 없으면 같은 경로 모양(숫자를 뺀 path)의 녹화 응답 중 하나로 대체 (상세를 일부만 녹화해도 전체 흐름 재생 가능)
+- latency(+ 0~jitter 난수)만큼 늦게 응답, error_rate 확률로 error_status 응답 (0이면 응답 없이 연결 종료)
+- retry_after를 주면 주입한 429/503 응답에 Retry-After 헤더(초)를 붙임 (적응형 요청 제한 확인용)
+
+사용법: python benchmarks/replay_server.py --recording benchmarks/recordings/live [--latency 0.05] [--error-rate 0.02]
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import threading
+import time
+import zlib
+from collections import Counter, defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+DIGITS = re.compile(r'\d+')
+
+
+def route(key: str) -> str:
+    """대체 응답을 고를 때 쓰는 경로 모양 ('/api/v4/jobs/123' → '/api/v4/jobs/#')"""
+    return DIGITS.sub('#', urlsplit(key).path)
+
+
+def load_recording(recording_dir: str):
+    """manifest + 응답 본문 → (manifest, 키 → (상태, Content-Type, 본문))"""
+    with open(os.path.join(recording_dir, 'manifest.json'), encoding='utf-8') as f:
+        manifest = json.load(f)
+    responses = {}
+    for key, entry in manifest['responses'].items():
+        with open(os.path.join(recording_dir, entry['file']), 'rb') as f:
+            responses[key] = (entry['status'], entry['content_type'], f.read())
+    return manifest, responses
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        with server.stats_lock:
+            server.stats['requests'] += 1
+            delay = server.latency + (server.rng.random() * server.jitter if server.jitter else 0)
+            inject_error = server.error_rate and server.rng.random() < server.error_rate
+        if delay:
+            time.sleep(delay)
+
+        if inject_error:
+            with server.stats_lock:
+                server.stats['injected_errors'] += 1
+            if not server.error_status:
+                self.close_connection = True
+                return
+            headers = {}
+            if server.retry_after and server.error_status in (429, 503):
+                headers['Retry-After'] = str(server.retry_after)
+            return self._send(server.error_status, b'injected error', 'text/plain', headers)
+
+        response = server.responses.get(self.path)
+        if response is None:
+            candidates = server.routes.get(route(self.path))
+            if not candidates:
+                with server.stats_lock:
+                    server.stats['missing'] += 1
+                return self._send(404, b'not recorded', 'text/plain')
+            with server.stats_lock:
+                server.stats['substituted'] += 1
+            response = server.responses[candidates[zlib.crc32(self.path.encode()) % len(candidates)]]
+
+        status, content_type, body = response
+        self._send(status, body, content_type)
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Optional[Dict[str, str]] = None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class ReplayServer:
+    """백그라운드 스레드에서 도는 재생 서버 (with 문으로 사용)"""
+
+    def __init__(self, recording_dir: str, latency: float = 0.05, jitter: float = 0.0,
+                 error_rate: float = 0.0, error_status: int = 503, seed: int = 0, port: int = 0,
+                 retry_after: int = 0):
+        self.manifest, responses = load_recording(recording_dir)
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', port), ReplayHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.responses = responses
+        self.httpd.routes = defaultdict(list)
+        for key in sorted(responses):
+            self.httpd.routes[route(key)].append(key)
+        self.httpd.latency = latency
+        self.httpd.jitter = jitter
+        self.httpd.error_rate = error_rate
+        self.httpd.error_status = error_status
+        self.httpd.retry_after = retry_after
+        self.httpd.rng = random.Random(seed)
+        self.httpd.stats = Counter()
+        self.httpd.stats_lock = threading.Lock()
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def stats(self) -> Counter:
+        return self.httpd.stats
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='녹화 응답 재생 서버')
+    parser.add_argument('--recording', required=True, help='recorder.py 녹화 디렉터리')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.05, help='응답 지연(초)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='추가 지연 0~jitter초 난수')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='오류 응답 비율 (0~1)')
+    parser.add_argument('--error-status', type=int, default=503, help='주입할 오류 상태 코드 (0이면 연결 종료)')
+    parser.add_argument('--retry-after', type=int, default=0, help='주입한 429/503에 붙일 Retry-After(초, 0이면 없음)')
+    args = parser.parse_args()
+
+    with ReplayServer(args.recording, args.latency, args.jitter, args.error_rate, args.error_status,
+                      port=args.port, retry_after=args.retry_after) as server:
+        print(f"재생 서버 실행 중: {server.base_url} (응답 {len(server.httpd.responses)}개, Ctrl+C 종료)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            print(f"\n요청 통계: {dict(server.stats)}")
+
+
+if __name__ == '__main__':
+    main()
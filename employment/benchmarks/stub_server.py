@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+벤치마크용 로컬 스텁 서버 - 사람인/잡코리아/원티드 응답 구조를 흉내내는 HTTP 서버
+실제 사이트에 요청하지 않고 크롤러 처리량을 측정하기 위해 사용
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+
+def saramin_list_html(page: int, per_page: int = 40) -> str:
+    """사람인 검색 결과 페이지 HTML"""
+    items = []
+    for i in range(per_page):
+        rec_idx = 50000000 + page * 1000 + i
+        items.append(
+            f'<div class="item_recruit">'
+            f'<h2 class="job_tit"><a href="/zf_user/jobs/relay/view?rec_idx={rec_idx}">데이터 엔지니어 채용 {rec_idx}</a></h2>'
+            f'<strong class="corp_name"><a href="#">(주)테스트컴퍼니{i % 17}</a></strong>'
+            f'<div class="job_condition"><span>서울 강남구</span><span>경력 3년↑</span><span>대졸↑</span><span>정규직</span></div>'
+            f'<div class="job_sector">Python, Spark, Airflow</div>'
+            f'</div>'
+        )
+    return f'<html><body><div class="content">{"".join(items)}</div></body></html>'
+
+
+def jobkorea_list_html(page: int, per_page: int = 20) -> str:
+    """잡코리아 검색 결과 페이지 HTML"""
+    items = []
+    for i in range(per_page):
+        gi_no = 46000000 + page * 1000 + i
+        items.append(
+            f'<li class="list-post">'
+            f'<div class="post-list-corp"><a class="name" href="#">테스트기업{i % 11}</a></div>'
+            f'<div class="post-list-info"><a class="title" href="/Recruit/GI_Read/{gi_no}">백엔드 개발자 {gi_no}</a>'
+            f'<p class="option"><span>경력3년↑</span><span>서울</span><span>정규직</span></p></div>'
+            f'</li>'
+        )
+    return f'<html><body><div class="list-default"><ul>{"".join(items)}</ul></div></body></html>'
+
+
+def saramin_detail_html(rec_idx: str) -> str:
+    """사람인 상세 공고 페이지 HTML"""
+    sections = [
+        ('주요업무', '데이터 파이프라인 설계 및 운영\nAirflow 기반 배치 워크플로우 개발\nKafka 스트리밍 처리'),
+        ('자격요건', '경력 3년 이상\nPython, SQL 능숙자\nSpark 또는 Hadoop 경험'),
+        ('우대사항', 'AWS, Kubernetes 운영 경험\nTerraform 사용 경험'),
+        ('복리후생', '유연근무제\n점심 식대 지원'),
+    ]
+    body = ''.join(
+        f'<div class="jv_cont"><h3 class="jv_header">{title}</h3>'
+        f'<div class="jv_detail">{content.replace(chr(10), "<br>")}</div></div>'
+        for title, content in sections
+    )
+    filler = '<p>회사 소개 및 기타 안내 문구입니다.</p>' * 50
+    return (
+        f'<html><body><div class="wrap_jv_cont" data-rec="{rec_idx}">{body}</div>'
+        f'<div class="career">경력 3~7년</div><div class="education">대졸 이상</div>'
+        f'<div class="salary">회사내규에 따름</div>{filler}</body></html>'
+    )
+
+
+def jobkorea_detail_html(gno: str) -> str:
+    """잡코리아 상세요강 프레임 페이지 HTML (섹션 마크업 없이 제목 줄로 구분)"""
+    body = (
+        '<p>■ 주요업무</p><p>- 주문/결제 API 서버 개발</p><p>- MSA 전환 및 운영</p>'
+        '<p>■ 자격요건</p><p>- 백엔드 개발 경력 3년 이상</p><p>- Java, Spring Boot 능숙자</p><p>- MySQL 사용 경험</p>'
+        '<p>■ 우대사항</p><p>- Kafka, Redis 운영 경험</p><p>- AWS 환경 경험</p>'
+        '<p>■ 복리후생</p><p>- 4대보험, 연차</p>'
+    )
+    return f'<html><body><div class="detailed-summary-contents" data-gno="{gno}">{body}</div></body></html>'
+
+
+def wanted_list_json(offset: int, limit: int, total: int = 300) -> dict:
+    """원티드 목록 API 응답 (검색 결과 total개, 남은 공고가 있으면 links.next에 다음 offset 주소)"""
+    count = max(0, min(limit, total - offset))
+    data = [
+        {'id': 200000 + offset + i, 'position': f'Data Engineer {offset + i}',
+         'company': {'name': f'테스트랩{(offset + i) % 13}'}}
+        for i in range(count)
+    ]
+    next_link = f"/api/v4/jobs?offset={offset + limit}&limit={limit}" if offset + count < total else None
+    return {'data': data, 'links': {'next': next_link}}
+
+
+def wanted_detail_json(job_id: str) -> dict:
+    """원티드 상세 API 응답 (섹션은 job.detail 아래 dict)"""
+    return {
+        'job': {
+            'id': int(job_id),
+            'detail': {
+                'intro': '데이터 팀에서 함께할 엔지니어를 찾습니다.',
+                'main_tasks': '• 데이터 플랫폼 구축\n• 대용량 데이터 파이프라인 개발',
+                'requirements': '• 데이터 엔지니어링 경력 3년 이상\n• Python, Scala 중 하나 이상 능숙\n• Spark, Kafka 경험',
+                'preferred_points': '• AWS, GCP 클라우드 경험\n• Airflow, dbt 사용 경험',
+                'benefits': '• 자율 출퇴근',
+            },
+            'skill_tags': [{'title': 'Python'}, {'title': 'Spark'}],
+        }
+    }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str):
+        # 본문 해시를 ETag로 내려주고, If-None-Match가 같으면 304로 응답
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        if status == 200 and self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        if status == 200:
+            self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        with server.stats_lock:
+            server.request_count += 1
+        if server.latency:
+            time.sleep(server.latency)
+
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+
+        if parsed.path == '/zf_user/search/recruit':
+            page = int(query.get('recruitPage', ['1'])[0])
+            body = saramin_list_html(page).encode('utf-8')
+            return self._send(200, body, 'text/html; charset=utf-8')
+
+        if parsed.path == '/Search/':
+            page = int(query.get('Page_No', ['1'])[0])
+            body = jobkorea_list_html(page).encode('utf-8')
+            return self._send(200, body, 'text/html; charset=utf-8')
+
+        if parsed.path == '/zf_user/jobs/relay/view':
+            rec_idx = query.get('rec_idx', ['0'])[0]
+            body = saramin_detail_html(rec_idx).encode('utf-8')
+            return self._send(200, body, 'text/html; charset=utf-8')
+
+        if parsed.path == '/Recruit/GI_Read_Comt_Ifrm':
+            gno = query.get('Gno', ['0'])[0]
+            body = jobkorea_detail_html(gno).encode('utf-8')
+            return self._send(200, body, 'text/html; charset=utf-8')
+
+        if parsed.path == '/api/v4/jobs':
+            offset = int(query.get('offset', ['0'])[0])
+            limit = int(query.get('limit', ['20'])[0])
+            body = json.dumps(wanted_list_json(offset, limit), ensure_ascii=False).encode('utf-8')
+            return self._send(200, body, 'application/json; charset=utf-8')
+
+        match = re.match(r'^/api/v4/jobs/(\d+)$', parsed.path)
+        if match:
+            body = json.dumps(wanted_detail_json(match.group(1)), ensure_ascii=False).encode('utf-8')
+            return self._send(200, body, 'application/json; charset=utf-8')
+
+        self._send(404, b'not found', 'text/plain')
+
+
+class StubServer:
+    """백그라운드 스레드에서 도는 스텁 서버 (with 문으로 사용)"""
+
+    def __init__(self, latency: float = 0.05, port: int = 0):
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', port), StubHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.latency = latency
+        self.httpd.request_count = 0
+        self.httpd.stats_lock = threading.Lock()
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def request_count(self) -> int:
+        return self.httpd.request_count
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+if __name__ == '__main__':
+    with StubServer() as server:
+        print(f"스텁 서버 실행 중: {server.base_url} (Ctrl+C 종료)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+"""
+공고 변경 추적 - 실행마다 공고 상세 내용의 해시를 비교해 변경/마감/재등록 이벤트 기록
+
+- 내용 해시: 자격요건/우대사항/주요업무/복지/연봉/기술스택 등 상세 필드(TRACKED_FIELDS)별 해시 + 전체 해시
+- 스냅샷: 바뀐 필드만 버전으로 저장 (줄 단위 델타, KEYFRAME_EVERY 버전마다 전체 텍스트)
+  → 실행마다 전체 사본을 쌓지 않고 바뀐 만큼만 저장, history로 임의 버전 복원
+- 비교: 실행 끝에 이번 실행에서 본 공고와 저장된 상태를 키 기준 해시 맵으로 한 번씩만 훑음 (O(공고 수))
+  · new: 처음 본 공고 / changed: 필드 해시가 바뀐 공고 / reopened: 마감 처리됐다가 다시 보인 공고
+  · closed: 이번 실행에서 목록을 끝까지 훑은 출처인데 expire_days 동안 목록에서 안 보인 공고
+    (finish_run의 expire_sources, 크롤러는 SeenIndex.complete_sources를 넘김 - 조기 중단한 출처는 판단하지 않음)
+  (상세 수집에 실패했거나 seen_index에 저장된 상세를 재사용한 공고는 보인 것으로만 처리하고 내용은 비교하지 않음)
+
+사용법:
+    python change_tracker.py import jobs_full_*.json [--db changes.sqlite]   # 이전 실행 파일로 이력 채우기
+    python change_tracker.py events [--type changed] [--run 3] [--limit 50]
+    python change_tracker.py history saramin:52351669 [--field qualifications]
+    python change_tracker.py stats
+"""
+
+import argparse
+import difflib
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+import zlib
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from seen_index import has_detail, posting_key
+
+DEFAULT_DB = 'changes.sqlite'
+
+# 변경을 추적하는 상세 필드 (경력/연봉 구조화 값은 이 텍스트에서 나오므로 제외)
+TRACKED_FIELDS = [
+    'qualifications', 'preferred', 'responsibilities', 'benefits', 'salary',
+    'detail_tech_stack', 'experience_years', 'education', 'full_description',
+]
+
+KEYFRAME_EVERY = 8  # 이 버전 수마다 델타 대신 전체 텍스트 저장 (복원 시 적용할 델타 수 상한)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tracker_runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    label TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    sources TEXT,
+    counts TEXT
+);
+
+CREATE TABLE IF NOT EXISTS posting_state (
+    key TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    company TEXT NOT NULL DEFAULT '',
+    title TEXT NOT NULL DEFAULT '',
+    content_hash TEXT,
+    field_hashes TEXT,
+    field_versions TEXT,
+    current BLOB,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    closed_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_posting_state_source ON posting_state(source, closed_at);
+
+CREATE TABLE IF NOT EXISTS field_versions (
+    key TEXT NOT NULL,
+    field TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    run_id INTEGER NOT NULL REFERENCES tracker_runs(run_id),
+    keyframe INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (key, field, version)
+);
+
+CREATE TABLE IF NOT EXISTS change_events (
+    event_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id INTEGER NOT NULL REFERENCES tracker_runs(run_id),
+    key TEXT NOT NULL,
+    event TEXT NOT NULL,
+    fields TEXT,
+    at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_change_events_run ON change_events(run_id, event);
+CREATE INDEX IF NOT EXISTS idx_change_events_key ON change_events(key);
+"""
+
+WHITESPACE = re.compile(r'[ \t\r\f\v]+')
+
+
+def field_text(value) -> str:
+    """비교/저장용 필드 텍스트 (줄 끝 공백 정리, 기술스택 목록은 정렬해 한 줄에 하나씩)"""
+    if isinstance(value, dict):
+        value = '\n'.join(str(v) for v in value.values() if v)
+    elif isinstance(value, (list, tuple)):
+        value = '\n'.join(sorted({str(v) for v in value if v}))
+    lines = (WHITESPACE.sub(' ', line).strip() for line in str(value or '').splitlines())
+    return '\n'.join(line for line in lines if line)
+
+
+def field_hashes(job: Dict) -> Dict[str, str]:
+    """필드별 내용 해시 (빈 필드는 제외)"""
+    hashes = {}
+    for field in TRACKED_FIELDS:
+        text = field_text(job.get(field))
+        if text:
+            hashes[field] = hashlib.blake2b(text.encode('utf-8'), digest_size=12).hexdigest()
+    return hashes
+
+
+def content_hash(hashes: Dict[str, str]) -> str:
+    """필드 해시를 묶은 공고 전체 해시"""
+    raw = '\x1f'.join(f"{field}={hashes[field]}" for field in sorted(hashes))
+    return hashlib.blake2b(raw.encode('utf-8'), digest_size=12).hexdigest()
+
+
+# ----------------------------------------------------------------------
+# 줄 단위 델타
+# ----------------------------------------------------------------------
+
+def make_delta(old: str, new: str) -> List:
+    """old → new 델타: [시작, 끝] = old 줄 범위 복사, 문자열 = 새 줄"""
+    old_lines, new_lines = old.split('\n'), new.split('\n')
+    ops = []
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            ops.append([i1, i2])
+        elif j2 > j1:
+            ops.append('\n'.join(new_lines[j1:j2]))
+    return ops
+
+
+def apply_delta(old: str, ops: List) -> str:
+    old_lines = old.split('\n')
+    lines = []
+    for op in ops:
+        if isinstance(op, list):
+            lines.extend(old_lines[op[0]:op[1]])
+        else:
+            lines.extend(op.split('\n'))
+    return '\n'.join(lines)
+
+
+def _pack(value) -> bytes:
+    return zlib.compress(json.dumps(value, ensure_ascii=False).encode('utf-8'))
+
+
+def _unpack(data: bytes):
+    return json.loads(zlib.decompress(data).decode('utf-8'))
+
+
+def has_fresh_detail(job: Dict) -> bool:
+    """이번 실행에서 상세를 새로 받은 공고 (재사용한 상세는 이전 내용이라 비교하면 변경을 놓침)"""
+    return has_detail(job) and not job.get('detail_reused')
+
+
+class ChangeTracker:
+    def __init__(self, path: str = DEFAULT_DB, expire_days: float = 3):
+        self.path = path
+        self.expire_days = expire_days
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self.run_id = None
+        self.run_started = None
+        self._seen = {}
+        self._sources = set()
+
+    # ------------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------------
+
+    def start_run(self, label: Optional[str] = None, started_at: Optional[float] = None) -> int:
+        self.run_started = started_at or time.time()
+        label = label or datetime.fromtimestamp(self.run_started).strftime('%Y%m%d_%H%M%S')
+        cur = self.conn.execute("INSERT INTO tracker_runs (label, started_at) VALUES (?, ?)",
+                                (label, self.run_started))
+        self.conn.commit()
+        self.run_id = cur.lastrowid
+        self._seen = {}
+        self._sources = set()
+        return self.run_id
+
+    def observe(self, jobs: Iterable[Dict]):
+        """이번 실행에서 본 공고 (같은 공고가 여러 번 오면 새로 수집한 상세가 있는 쪽 사용)"""
+        for job in jobs:
+            key = posting_key(job)
+            if not key:
+                continue
+            self._sources.add(key.split(':', 1)[0])
+            if key not in self._seen or has_fresh_detail(job):
+                self._seen[key] = job
+
+    def observe_file(self, jobs_path: str):
+        """파이프라인 JSONL 파일을 한 줄씩 읽어 observe"""
+        with open(jobs_path, encoding='utf-8') as f:
+            self.observe(json.loads(line) for line in f if line.strip())
+
+    def finish_run(self, expire_sources: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """저장된 상태와 비교해 이벤트/델타 기록 → 이벤트 종류별 건수
+
+        expire_sources: 마감 판단할 출처 (None이면 이번 실행에서 본 모든 출처 - 전체 목록 파일을 가져올 때)
+        """
+        expire_sources = self._sources if expire_sources is None else set(expire_sources)
+        now = self.run_started
+        counts = Counter()
+        events, versions, states = [], [], []
+
+        # 이번 실행에서 수집한 출처의 저장된 상태를 한 번 훑으면서 키 맵으로 비교
+        stored = {}
+        for source in self._sources:
+            for row in self.conn.execute(
+                """SELECT key, content_hash, field_hashes, field_versions, current, first_seen, last_seen, closed_at
+                   FROM posting_state WHERE source = ?""", (source,)
+            ):
+                stored[row[0]] = row
+
+        for key, job in self._seen.items():
+            row = stored.pop(key, None)
+            if row is None:
+                hashes, state = self._new_state(key, job, versions)
+                states.append((key, job, content_hash(hashes) if hashes else None, hashes, state, now, now, None))
+                events.append((self.run_id, key, 'new', None, now))
+                counts['new'] += 1
+                continue
+
+            _, old_hash, old_hashes, old_versions, current, first_seen, _, closed_at = row
+            old_hashes = json.loads(old_hashes or '{}')
+            old_versions = json.loads(old_versions or '{}')
+            current = _unpack(current) if current else {}
+            if closed_at is not None:
+                events.append((self.run_id, key, 'reopened', None, now))
+                counts['reopened'] += 1
+
+            hashes = old_hashes
+            if has_fresh_detail(job):
+                hashes = field_hashes(job)
+                changed = sorted(f for f in set(hashes) | set(old_hashes) if hashes.get(f) != old_hashes.get(f))
+                if changed:
+                    for field in changed:
+                        text = field_text(job.get(field))
+                        old_versions[field] = self._add_version(key, field, old_versions.get(field, 0),
+                                                                current.get(field, ''), text, versions)
+                        current[field] = text
+                    if old_hash is not None:
+                        events.append((self.run_id, key, 'changed', json.dumps(changed), now))
+                        counts['changed'] += 1
+            states.append((key, job, content_hash(hashes) if hashes else old_hash, hashes,
+                           (old_versions, current), first_seen, now, None))
+
+        # 남은 저장 상태 = 이번 실행 출처에서 안 보인 공고 (끝까지 훑은 출처만 마감)
+        expire_before = now - self.expire_days * 86400
+        closed = [(now, key) for key, row in stored.items()
+                  if row[7] is None and row[6] < expire_before and key.split(':', 1)[0] in expire_sources]
+        events.extend((self.run_id, key, 'closed', None, now) for _, key in closed)
+        counts['closed'] = len(closed)
+
+        with self.conn:
+            self.conn.executemany(
+                """INSERT INTO field_versions (key, field, version, run_id, keyframe, data)
+                   VALUES (?, ?, ?, ?, ?, ?)""", versions)
+            self.conn.executemany(
+                """
+                INSERT INTO posting_state (key, source, company, title, content_hash, field_hashes, field_versions,
+                                           current, first_seen, last_seen, closed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, NULL)
+                ON CONFLICT(key) DO UPDATE SET
+                    company = excluded.company, title = excluded.title,
+                    content_hash = excluded.content_hash, field_hashes = excluded.field_hashes,
+                    field_versions = excluded.field_versions, current = excluded.current,
+                    last_seen = excluded.last_seen, closed_at = NULL
+                """,
+                [(key, key.split(':', 1)[0], job.get('company', ''), job.get('title', ''), chash,
+                  json.dumps(hashes), json.dumps(state[0]), _pack(state[1]), first_seen, last_seen)
+                 for key, job, chash, hashes, state, first_seen, last_seen, _ in states],
+            )
+            self.conn.executemany("UPDATE posting_state SET closed_at = ? WHERE key = ?", closed)
+            self.conn.executemany(
+                "INSERT INTO change_events (run_id, key, event, fields, at) VALUES (?, ?, ?, ?, ?)", events)
+            self.conn.execute(
+                "UPDATE tracker_runs SET sources = ?, counts = ? WHERE run_id = ?",
+                (json.dumps(sorted(self._sources)), json.dumps(counts), self.run_id),
+            )
+        self._seen = {}
+        return {k: counts[k] for k in ('new', 'changed', 'closed', 'reopened')}
+
+    def _new_state(self, key: str, job: Dict, versions: List) -> Tuple[Dict, Tuple[Dict, Dict]]:
+        """처음 본 공고 → (필드 해시, (필드별 버전, 현재 텍스트)) - 상세가 없으면 빈 상태"""
+        if not has_detail(job):
+            return {}, ({}, {})
+        hashes = field_hashes(job)
+        field_version, current = {}, {}
+        for field in hashes:
+            current[field] = field_text(job.get(field))
+            field_version[field] = self._add_version(key, field, 0, '', current[field], versions)
+        return hashes, (field_version, current)
+
+    def _add_version(self, key: str, field: str, last: int, old: str, new: str, versions: List) -> int:
+        """필드 새 버전 추가 → 버전 번호 (첫 버전/KEYFRAME_EVERY마다 전체, 나머지는 델타)"""
+        version = last + 1
+        keyframe = (version - 1) % KEYFRAME_EVERY == 0
+        data = _pack(new if keyframe else make_delta(old, new))
+        versions.append((key, field, version, self.run_id, int(keyframe), data))
+        return version
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def field_history(self, key: str, field: str) -> List[Tuple[int, str, str]]:
+        """필드의 모든 버전 복원 → [(버전, 실행 라벨, 텍스트)]"""
+        history, text = [], ''
+        for version, label, keyframe, data in self.conn.execute(
+            """SELECT v.version, r.label, v.keyframe, v.data FROM field_versions v
+               JOIN tracker_runs r ON r.run_id = v.run_id
+               WHERE v.key = ? AND v.field = ? ORDER BY v.version""", (key, field)
+        ):
+            value = _unpack(data)
+            text = value if keyframe else apply_delta(text, value)
+            history.append((version, label, text))
+        return history
+
+    def field_at(self, key: str, field: str, version: int) -> Optional[str]:
+        """필드의 특정 버전만 복원 (가장 가까운 전체 버전부터 델타 적용)"""
+        rows = self.conn.execute(
+            """SELECT keyframe, data FROM field_versions WHERE key = ? AND field = ? AND version <= ?
+               AND version >= (SELECT MAX(version) FROM field_versions
+                               WHERE key = ? AND field = ? AND version <= ? AND keyframe = 1)
+               ORDER BY version""", (key, field, version, key, field, version)
+        ).fetchall()
+        if not rows:
+            return None
+        text = ''
+        for keyframe, data in rows:
+            value = _unpack(data)
+            text = value if keyframe else apply_delta(text, value)
+        return text
+
+    def events(self, event: Optional[str] = None, run_id: Optional[int] = None, limit: int = 50) -> List[tuple]:
+        """이벤트 목록 (최근 순) → (실행 라벨, 이벤트, 키, 회사, 제목, 바뀐 필드)"""
+        clauses, params = [], []
+        if event:
+            clauses.append("e.event = ?")
+            params.append(event)
+        if run_id is not None:
+            clauses.append("e.run_id = ?")
+            params.append(run_id)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        return self.conn.execute(
+            f"""SELECT r.label, e.event, e.key, s.company, s.title, e.fields FROM change_events e
+                JOIN tracker_runs r ON r.run_id = e.run_id LEFT JOIN posting_state s ON s.key = e.key
+                {where} ORDER BY e.event_id DESC LIMIT ?""", (*params, limit)
+        ).fetchall()
+
+    def storage(self) -> Dict[str, int]:
+        """저장 크기 - 델타/전체 버전 바이트와 전체 텍스트를 실행마다 저장했을 때의 추정치"""
+        keyframe_bytes, delta_bytes = self.conn.execute(
+            """SELECT COALESCE(SUM(CASE WHEN keyframe THEN LENGTH(data) END), 0),
+                      COALESCE(SUM(CASE WHEN NOT keyframe THEN LENGTH(data) END), 0) FROM field_versions"""
+        ).fetchone()
+        versions = self.conn.execute("SELECT COUNT(*) FROM field_versions").fetchone()[0]
+        runs = self.conn.execute("SELECT COUNT(*) FROM tracker_runs").fetchone()[0]
+        current_bytes = self.conn.execute("SELECT COALESCE(SUM(LENGTH(current)), 0) FROM posting_state").fetchone()[0]
+        return {'runs': runs, 'versions': versions, 'keyframe_bytes': keyframe_bytes, 'delta_bytes': delta_bytes,
+                'full_copy_estimate': current_bytes * runs}
+
+    # ------------------------------------------------------------------
+    # 기존 파일 가져오기
+    # ------------------------------------------------------------------
+
+    def import_json(self, path: str) -> Optional[Dict[str, int]]:
+        """jobs_full_*.json 하나를 실행 1회로 비교 (파일명의 타임스탬프를 실행 시각으로 사용)"""
+        match = re.search(r'(\d{8}_\d{6})', os.path.basename(path))
+        label = match.group(1) if match else os.path.basename(path)
+        if self.conn.execute("SELECT 1 FROM tracker_runs WHERE label = ?", (label,)).fetchone():
+            print(f"  이미 가져온 실행: {label}")
+            return None
+        started_at = datetime.strptime(label, '%Y%m%d_%H%M%S').timestamp() if match else None
+
+        with open(path, encoding='utf-8') as f:
+            jobs = json.load(f)
+        self.start_run(label=label, started_at=started_at)
+        self.observe(jobs)
+        return self.finish_run()
+
+    def close(self):
+        self.conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='공고 변경 추적 (변경/마감/재등록 이벤트 + 델타 이력)')
+    parser.add_argument('--db', default=DEFAULT_DB, help=f'DB 경로 (기본: {DEFAULT_DB})')
+    sub = parser.add_subparsers(dest='command', required=True)
+    import_parser = sub.add_parser('import', help='jobs_full_*.json을 시간 순으로 비교해 이력 채우기')
+    import_parser.add_argument('files', nargs='+')
+    events_parser = sub.add_parser('events', help='변경 이벤트 목록')
+    events_parser.add_argument('--type', choices=['new', 'changed', 'closed', 'reopened'], help='이벤트 종류')
+    events_parser.add_argument('--run', type=int, help='실행 번호')
+    events_parser.add_argument('--limit', type=int, default=50)
+    history_parser = sub.add_parser('history', help='공고 필드의 버전별 내용')
+    history_parser.add_argument('key', help="공고 키 (예: saramin:52351669)")
+    history_parser.add_argument('--field', default='qualifications', choices=TRACKED_FIELDS)
+    sub.add_parser('stats', help='실행별 이벤트 수와 저장 크기')
+    args = parser.parse_args()
+
+    tracker = ChangeTracker(args.db)
+
+    if args.command == 'import':
+        for path in sorted(args.files):
+            counts = tracker.import_json(path)
+            if counts:
+                print(f"📥 {path}: 신규 {counts['new']}개 / 변경 {counts['changed']}개 / "
+                      f"마감 {counts['closed']}개 / 재등록 {counts['reopened']}개")
+    elif args.command == 'events':
+        rows = tracker.events(args.type, args.run, args.limit)
+        for label, event, key, company, title, fields in rows:
+            changed = f" ({', '.join(json.loads(fields))})" if fields else ''
+            print(f"  {label} | {event:8} | {key} | {company} | {(title or '')[:40]}{changed}")
+        print(f"\n{len(rows)}개 이벤트")
+    elif args.command == 'history':
+        history = tracker.field_history(args.key, args.field)
+        for version, label, text in history:
+            print(f"\n── v{version} ({label}) " + '─' * 40)
+            print(text)
+        if not history:
+            print(f"기록 없음: {args.key} {args.field}")
+    elif args.command == 'stats':
+        for run_id, label, counts in tracker.conn.execute(
+            "SELECT run_id, label, counts FROM tracker_runs ORDER BY run_id"
+        ):
+            counts = json.loads(counts or '{}')
+            print(f"  run {run_id:3} | {label} | " + ', '.join(f"{k} {v}" for k, v in sorted(counts.items())))
+        storage = tracker.storage()
+        print(f"\n버전 {storage['versions']}개 - 전체 {storage['keyframe_bytes']:,}B + 델타 {storage['delta_bytes']:,}B "
+              f"(실행마다 전체 저장 시 약 {storage['full_copy_estimate']:,}B)")
+
+    tracker.close()
+
+
+if __name__ == '__main__':
+    main()
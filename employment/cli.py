@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+채용공고 크롤러 CLI - 크롤링/분석/리포트/검색을 하위 명령 하나로 실행
+
+- crawl  : 상세 크롤링 1회 (crawler_detailed.run_crawl), --list-only면 목록만 (crawler.run_crawl)
+- analyze: JobStore DB 집계 출력, --trend면 주별 기술 추이 (pandas는 이 경로에서만 import)
+- report : DB 집계 테이블로 분석 JSON + 마크다운 리포트 (--html이면 대시보드, --files면 CSV/전체 JSON/Parquet도)
+- search : 검색 인덱스에서 BM25 검색 + 패싯 필터
+
+하위 명령에 필요한 모듈만 실행 시점에 import (requests/lxml은 crawl, pandas는 analyze --trend에서만)
+시작 시간 확인: python -X importtime cli.py search kafka 2> importtime.txt
+
+사용법:
+    python cli.py crawl [--keywords 데이터 엔지니어] [--sources 원티드] [--pages 3] [--output-dir .]
+    python cli.py analyze [--db jobs.sqlite] [--run 3] [--trend]
+    python cli.py report [--db jobs.sqlite] [--run 3] [--out .] [--html] [--files]
+    python cli.py search kafka --company 토스 --max-years 5 [--index search_index.sqlite]
+"""
+
+import argparse
+import os
+import time
+
+SOURCE_CHOICES = ['사람인', '잡코리아', '원티드']  # pipeline.SOURCES (파싱 단계에서 import하지 않도록 복사)
+
+
+def cmd_crawl(args):
+    from crawler_detailed import DEFAULT_KEYWORDS, DEFAULT_OUTPUT_DIR
+
+    keywords = args.keywords or DEFAULT_KEYWORDS
+    output_dir = args.output_dir or DEFAULT_OUTPUT_DIR
+    os.makedirs(output_dir, exist_ok=True)
+    options = dict(max_workers=args.workers, per_host=args.per_host, min_interval=args.min_interval)
+
+    if args.list_only:
+        from crawler import run_crawl
+        run_crawl(keywords, output_dir, pages=args.pages, wanted_limit=args.wanted_limit,
+                  per_source=args.per_host, min_interval=args.min_interval)
+    else:
+        from crawler_detailed import run_crawl
+        run_crawl(keywords, output_dir, sources=args.sources or SOURCE_CHOICES, saramin_pages=args.pages,
+                  wanted_limit=args.wanted_limit, batch_size=args.batch_size, parser=args.parser, **options)
+
+
+def cmd_analyze(args):
+    from crawler_detailed import DetailedJobCrawler
+    from job_store import JobStore
+
+    store = JobStore(args.db)
+    DetailedJobCrawler.print_analysis(store.aggregate(args.run))
+    store.close()
+
+    if args.trend:
+        from history_analytics import HistoryAnalytics
+        analytics = HistoryAnalytics.from_store(args.db)
+        print(f"\n📊 전주 대비 변화 (언급 비율 %p):")
+        wow = analytics.week_over_week(args.top)
+        print(wow.round(1).to_string() if len(wow) else "   (2주 이상 이력 필요)")
+        print(f"\n🔗 함께 요구되는 기술 쌍:")
+        print(analytics.top_pairs(args.top).to_string(index=False))
+
+
+def cmd_report(args):
+    from crawler_detailed import DetailedJobCrawler
+    from job_store import JobStore
+
+    store = JobStore(args.db)
+    run_id = args.run if args.run is not None else store.latest_run_id()
+    # 리포트는 집계 테이블 + 샘플 공고만 사용 (전체 공고는 --files일 때만 불러옴)
+    result = store.aggregate(run_id)
+    jobs = store.load_jobs(run_id) if args.files else store.sample_jobs(run_id)
+
+    os.makedirs(args.out, exist_ok=True)
+    print(f"📝 리포트 생성: run {run_id}, 공고 {result['total_jobs']}개")
+    DetailedJobCrawler.save_detailed_results(jobs, result, output_dir=args.out, dump_files=args.files)
+    if args.html:
+        from dashboard import write_dashboard
+        print(f"📊 대시보드 저장: {write_dashboard(store, os.path.join(args.out, 'dashboard.html'), run_id)}")
+    store.close()
+
+
+def cmd_search(args):
+    from search_index import SearchIndex, print_results
+
+    index = SearchIndex(args.index)
+    start = time.perf_counter()
+    results = index.search(' '.join(args.query), source=args.source, company=args.company, tech=args.tech,
+                           max_years=args.max_years, years=args.years, limit=args.limit)
+    print_results(results, scored=bool(args.query), elapsed=time.perf_counter() - start)
+    index.close()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description='채용공고 크롤러 (크롤링/분석/리포트/검색)')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    crawl = sub.add_parser('crawl', help='채용공고 크롤링 (기본: 상세 + DB/검색 인덱스 저장)')
+    crawl.add_argument('--keywords', nargs='+', help='검색 키워드 (기본: crawler_detailed.DEFAULT_KEYWORDS)')
+    crawl.add_argument('--sources', nargs='+', choices=SOURCE_CHOICES, help='수집할 출처 (기본: 전체)')
+    crawl.add_argument('--pages', type=int, default=3, help='사람인/잡코리아 페이지 수')
+    crawl.add_argument('--wanted-limit', type=int, default=200, help='원티드 키워드당 공고 수')
+    crawl.add_argument('--batch-size', type=int, default=20, help='상세 수집/저장 배치 크기')
+    crawl.add_argument('--output-dir', help='결과 디렉터리 (기본: crawler_detailed.DEFAULT_OUTPUT_DIR)')
+    crawl.add_argument('--workers', type=int, default=8, help='동시 요청 워커 수')
+    crawl.add_argument('--per-host', type=int, default=4, help='출처별 동시 요청 수')
+    crawl.add_argument('--min-interval', type=float, default=0.1, help='출처별 요청 시작 간격(초)')
+    crawl.add_argument('--parser', choices=['lxml', 'bs4'], default='lxml', help='HTML 파서')
+    crawl.add_argument('--list-only', action='store_true', help='상세 없이 목록만 수집 (crawler.py)')
+    crawl.set_defaults(func=cmd_crawl)
+
+    analyze = sub.add_parser('analyze', help='DB에 저장된 공고 집계')
+    analyze.add_argument('--db', default='jobs.sqlite', help='JobStore DB 경로 (기본: jobs.sqlite)')
+    analyze.add_argument('--run', type=int, help='실행 번호 (기본: 전체 공고)')
+    analyze.add_argument('--trend', action='store_true', help='주별 기술 추이/기술 쌍도 출력 (pandas 필요)')
+    analyze.add_argument('--top', type=int, default=15)
+    analyze.set_defaults(func=cmd_analyze)
+
+    report = sub.add_parser('report', help='DB의 공고로 분석 JSON + 마크다운 리포트 생성')
+    report.add_argument('--db', default='jobs.sqlite', help='JobStore DB 경로 (기본: jobs.sqlite)')
+    report.add_argument('--run', type=int, help='실행 번호 (기본: 가장 최근 실행)')
+    report.add_argument('--out', default='.', help='저장 디렉터리')
+    report.add_argument('--files', action='store_true', help='공고 CSV/전체 JSON/Parquet도 저장')
+    report.add_argument('--html', action='store_true', help='추이 차트가 있는 HTML 대시보드도 저장')
+    report.set_defaults(func=cmd_report)
+
+    search = sub.add_parser('search', help='공고 검색 (search_index.py search와 동일)')
+    search.add_argument('query', nargs='*', help='검색어 (생략하면 필터만)')
+    search.add_argument('--index', default='search_index.sqlite', help='검색 인덱스 경로')
+    search.add_argument('--source', choices=SOURCE_CHOICES, help='출처')
+    search.add_argument('--company', help='회사명 (앞부분 일치, 법인 표기 무시)')
+    search.add_argument('--tech', help='기술스택 (예: Kafka)')
+    search.add_argument('--max-years', type=int, help='요구 경력 N년 이하')
+    search.add_argument('--years', type=int, help='내 경력 연차 (지원 가능한 공고)')
+    search.add_argument('--limit', type=int, default=20)
+    search.set_defaults(func=cmd_search)
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
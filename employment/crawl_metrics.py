@@ -0,0 +1,192 @@
+"""
+크롤링 실행 지표 - 단계별 소요 시간, 출처별 요청 지연 히스토그램/오류/다운로드 바이트를 모아 Prometheus 텍스트 형식으로 출력
+
+- FetchEngine이 요청마다 observe_request, 목록/상세/파싱/추출 시간을 add_stage로 기록
+- run_pipeline이 추출/저장 시간을 기록, scheduler가 실행 횟수/소요 시간을 기록
+- 값은 프로세스가 살아있는 동안 누적 (Prometheus counter 규칙), 데몬 모드에서는 실행마다 파일로 덮어쓰거나 HTTP로 노출
+
+노출: write(path) → node_exporter textfile collector용 파일, serve(port) → http://host:port/metrics
+"""
+
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+# 요청 지연 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 단계 이름 (출력 순서)
+STAGES = ('list_fetch', 'detail_fetch', 'parse', 'extract', 'write')
+
+
+def _labels(**labels) -> str:
+    parts = []
+    for key, value in labels.items():
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        parts.append(f'{key}="{value}"')
+    return '{' + ','.join(parts) + '}'
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class CrawlMetrics:
+    """스레드 안전한 누적 지표 모음"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stage_seconds = defaultdict(float)
+        self.stage_calls = defaultdict(int)
+        self.requests = defaultdict(int)        # (출처, 상태) → 요청 수 (상태: HTTP 코드 또는 'error')
+        self.errors = defaultdict(int)          # 출처 → 실패한 요청 수 (연결 오류, 200/304 외 응답)
+        self.bytes = defaultdict(int)           # 출처 → 받은 본문 바이트 (캐시에서 꺼낸 응답 제외)
+        self.latency_buckets = defaultdict(lambda: [0] * len(LATENCY_BUCKETS))
+        self.latency_sum = defaultdict(float)
+        self.latency_count = defaultdict(int)
+        self.runs = defaultdict(int)            # 'ok' | 'failed' → 실행 수
+        self.last_run = {}                      # 마지막 실행 정보 (시각, 소요 시간, 공고 수)
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+
+    def add_stage(self, stage: str, seconds: float, calls: int = 1):
+        with self._lock:
+            self.stage_seconds[stage] += seconds
+            self.stage_calls[stage] += calls
+
+    @contextmanager
+    def stage(self, stage: str):
+        """with 블록 소요 시간을 stage에 더함"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_stage(stage, time.perf_counter() - start)
+
+    def observe_request(self, source: str, seconds: float, status, nbytes: int = 0):
+        """요청 하나 기록 (status는 HTTP 코드, 연결 오류/타임아웃은 'error')"""
+        with self._lock:
+            self.requests[(source, str(status))] += 1
+            if status not in (200, 304):
+                self.errors[source] += 1
+            self.bytes[source] += nbytes
+            buckets = self.latency_buckets[source]
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    buckets[i] += 1
+            self.latency_sum[source] += seconds
+            self.latency_count[source] += 1
+
+    def record_run(self, ok: bool, seconds: float, jobs: int = 0):
+        with self._lock:
+            self.runs['ok' if ok else 'failed'] += 1
+            self.last_run = {'timestamp': time.time(), 'seconds': seconds, 'jobs': jobs, 'ok': ok}
+
+    # ------------------------------------------------------------------
+    # 출력
+    # ------------------------------------------------------------------
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식"""
+        with self._lock:
+            lines = [
+                '# HELP crawler_stage_seconds_total Cumulative seconds spent per crawl stage (summed across worker threads).',
+                '# TYPE crawler_stage_seconds_total counter',
+            ]
+            stages = list(STAGES) + sorted(set(self.stage_seconds) - set(STAGES))
+            for stage in stages:
+                lines.append(f"crawler_stage_seconds_total{_labels(stage=stage)} {_number(self.stage_seconds[stage])}")
+            lines += ['# HELP crawler_stage_calls_total Number of timed calls per crawl stage.',
+                      '# TYPE crawler_stage_calls_total counter']
+            for stage in stages:
+                lines.append(f"crawler_stage_calls_total{_labels(stage=stage)} {self.stage_calls[stage]}")
+
+            lines += ['# HELP crawler_requests_total HTTP requests per source and status.',
+                      '# TYPE crawler_requests_total counter']
+            for (source, status), count in sorted(self.requests.items()):
+                lines.append(f"crawler_requests_total{_labels(source=source, status=status)} {count}")
+
+            sources = sorted(self.latency_count)
+            lines += ['# HELP crawler_request_errors_total Failed HTTP requests per source.',
+                      '# TYPE crawler_request_errors_total counter']
+            for source in sources:
+                lines.append(f"crawler_request_errors_total{_labels(source=source)} {self.errors[source]}")
+            lines += ['# HELP crawler_response_bytes_total Response body bytes downloaded per source.',
+                      '# TYPE crawler_response_bytes_total counter']
+            for source in sources:
+                lines.append(f"crawler_response_bytes_total{_labels(source=source)} {self.bytes[source]}")
+
+            lines += ['# HELP crawler_request_duration_seconds HTTP request latency per source.',
+                      '# TYPE crawler_request_duration_seconds histogram']
+            for source in sources:
+                for bound, count in zip(LATENCY_BUCKETS, self.latency_buckets[source]):
+                    lines.append(f"crawler_request_duration_seconds_bucket{_labels(source=source, le=bound)} {count}")
+                count = self.latency_count[source]
+                lines.append(f"crawler_request_duration_seconds_bucket{_labels(source=source, le='+Inf')} {count}")
+                lines.append(f"crawler_request_duration_seconds_sum{_labels(source=source)} {_number(self.latency_sum[source])}")
+                lines.append(f"crawler_request_duration_seconds_count{_labels(source=source)} {count}")
+
+            lines += ['# HELP crawler_runs_total Completed crawl runs by outcome.',
+                      '# TYPE crawler_runs_total counter']
+            for status in ('ok', 'failed'):
+                lines.append(f"crawler_runs_total{_labels(status=status)} {self.runs[status]}")
+            if self.last_run:
+                lines += [
+                    '# TYPE crawler_last_run_timestamp_seconds gauge',
+                    f"crawler_last_run_timestamp_seconds {_number(self.last_run['timestamp'])}",
+                    '# TYPE crawler_last_run_duration_seconds gauge',
+                    f"crawler_last_run_duration_seconds {_number(self.last_run['seconds'])}",
+                    '# TYPE crawler_last_run_jobs gauge',
+                    f"crawler_last_run_jobs {self.last_run['jobs']}",
+                ]
+        return '\n'.join(lines) + '\n'
+
+    def summary(self) -> str:
+        """콘솔 출력용 한 줄 요약"""
+        with self._lock:
+            stages = ', '.join(f"{s} {self.stage_seconds[s]:.1f}s" for s in STAGES if self.stage_calls[s])
+            requests = sum(self.latency_count.values())
+            errors = sum(self.errors.values())
+            mb = sum(self.bytes.values()) / 1024 / 1024
+        return f"단계별 {stages or '-'} | 요청 {requests}회, 오류 {errors}회, {mb:.1f}MB"
+
+    def write(self, path: str):
+        """지표 파일 저장 (임시 파일에 쓴 뒤 교체 - 수집기가 쓰다 만 파일을 읽지 않도록)"""
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.render())
+        os.replace(tmp_path, path)
+
+    def serve(self, port: int, host: str = '0.0.0.0') -> 'ThreadingHTTPServer':
+        """백그라운드 스레드에서 /metrics HTTP 엔드포인트 실행"""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer  # 데몬에서만 사용
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
@@ -4,229 +4,67 @@
 """
 
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
-import re
 import time
 import json
 from collections import Counter
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import warnings
 warnings.filterwarnings('ignore')
 
-# 기술스택 키워드 정의
-TECH_KEYWORDS = {
-    # 언어
-    'Python': ['python', '파이썬'],
-    'Java': ['java', '자바'],
-    'Kotlin': ['kotlin', '코틀린'],
-    'Go': ['golang', 'go언어'],
-    'Scala': ['scala', '스칼라'],
-    'TypeScript': ['typescript', 'ts'],
-    'JavaScript': ['javascript', 'js'],
-    'SQL': ['sql'],
-
-    # 프레임워크
-    'Spring': ['spring', 'spring boot', 'springboot', '스프링'],
-    'Django': ['django', '장고'],
-    'FastAPI': ['fastapi'],
-    'Flask': ['flask'],
-    'Express': ['express', 'express.js'],
-    'NestJS': ['nestjs', 'nest.js'],
-
-    # 데이터 처리
-    'Spark': ['spark', 'pyspark', '스파크'],
-    'Hadoop': ['hadoop', '하둡'],
-    'Airflow': ['airflow', 'apache airflow'],
-    'Kafka': ['kafka', '카프카'],
-    'Flink': ['flink'],
-    'Presto': ['presto', 'trino'],
-
-    # 데이터베이스
-    'MySQL': ['mysql'],
-    'PostgreSQL': ['postgresql', 'postgres'],
-    'MongoDB': ['mongodb', '몽고db'],
-    'Redis': ['redis', '레디스'],
-    'Elasticsearch': ['elasticsearch', 'elastic', 'es'],
-    'DynamoDB': ['dynamodb'],
-    'Redshift': ['redshift'],
-    'BigQuery': ['bigquery'],
-
-    # 클라우드
-    'AWS': ['aws', 'amazon web services', 'ec2', 's3', 'lambda'],
-    'GCP': ['gcp', 'google cloud', 'gce'],
-    'Azure': ['azure', '애저'],
-
-    # 컨테이너/오케스트레이션
-    'Docker': ['docker', '도커'],
-    'Kubernetes': ['kubernetes', 'k8s', '쿠버네티스'],
-
-    # CI/CD
-    'Jenkins': ['jenkins', '젠킨스'],
-    'GitHub Actions': ['github actions'],
-    'ArgoCD': ['argocd', 'argo cd'],
-
-    # 기타
-    'Linux': ['linux', '리눅스'],
-    'Terraform': ['terraform', '테라폼'],
-    'Git': ['git', '깃'],
-    'REST API': ['rest api', 'restful', 'api'],
-    'GraphQL': ['graphql'],
-    'gRPC': ['grpc'],
-    'MSA': ['msa', 'microservice', '마이크로서비스'],
-}
+from dedup import dedup_jobs
+from fetch_engine import FetchEngine
+from html_parser import get_parser
+from http_cache import CachedSession
+from job_record import write_csv
+from seen_index import SeenIndex
+from sources import build_adapters, detail_cache_rule
+from tech_matcher import load_matcher
+
+# 기술스택 별칭 사전 (tech_aliases.json, 크롤러 공통 - 컴파일 결과는 pickle로 캐시)
+TECH_MATCHER = load_matcher()
+TECH_KEYWORDS = TECH_MATCHER.keywords
 
 class JobCrawler:
-    def __init__(self):
+    def __init__(self, cache_path: Optional[str] = None, parser: str = 'lxml', per_source: int = 2,
+                 min_interval: float = 1.0):
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
         }
+        # HTML 파서 백엔드 ('lxml' 기본, 설치되지 않았으면 'bs4')
+        self.parser = get_parser(parser)
+        # 사이트별 어댑터 + 공통 수집 엔진 (목록 페이지 간격은 엔진의 출처별 요청 간격으로 조절)
+        self.adapters = build_adapters(self.parser, self.extract_tech_stack)
+        # cache_path를 주면 상세 응답을 디스크에 캐시하고 조건부 요청으로 재검증 (목록은 매번 새로 요청)
+        if cache_path:
+            self.session = CachedSession(cache_path, cacheable=detail_cache_rule(self.adapters))
+        else:
+            self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.engine = FetchEngine(self.session, self.adapters, per_source=per_source, min_interval=min_interval)
         self.jobs = []
 
-    def crawl_saramin(self, keyword: str, pages: int = 5) -> List[Dict]:
-        """사람인 채용공고 크롤링"""
-        print(f"\n[사람인] '{keyword}' 검색 중...")
-        jobs = []
-
-        for page in range(1, pages + 1):
-            url = f"https://www.saramin.co.kr/zf_user/search/recruit?searchType=search&searchword={keyword}&recruitPage={page}"
-
-            try:
-                response = requests.get(url, headers=self.headers, timeout=10)
-                if response.status_code != 200:
-                    print(f"  페이지 {page}: 응답 오류 ({response.status_code})")
-                    continue
-
-                soup = BeautifulSoup(response.text, 'html.parser')
-                job_items = soup.select('.item_recruit')
-
-                for item in job_items:
-                    try:
-                        title_elem = item.select_one('.job_tit a')
-                        company_elem = item.select_one('.corp_name a')
-                        conditions = item.select('.job_condition span')
-                        sector = item.select_one('.job_sector')
-
-                        if not title_elem:
-                            continue
-
-                        job = {
-                            'source': '사람인',
-                            'title': title_elem.get_text(strip=True),
-                            'company': company_elem.get_text(strip=True) if company_elem else '',
-                            'link': 'https://www.saramin.co.kr' + title_elem.get('href', ''),
-                            'conditions': [c.get_text(strip=True) for c in conditions],
-                            'sector': sector.get_text(strip=True) if sector else '',
-                            'raw_text': item.get_text(' ', strip=True)
-                        }
-                        jobs.append(job)
-                    except Exception as e:
-                        continue
-
-                print(f"  페이지 {page}: {len(job_items)}개 공고 수집")
-                time.sleep(1)  # 요청 간격
-
-            except Exception as e:
-                print(f"  페이지 {page}: 오류 발생 - {e}")
-                continue
-
-        print(f"[사람인] 총 {len(jobs)}개 공고 수집 완료")
-        return jobs
-
-    def crawl_jobkorea(self, keyword: str, pages: int = 5) -> List[Dict]:
-        """잡코리아 채용공고 크롤링"""
-        print(f"\n[잡코리아] '{keyword}' 검색 중...")
-        jobs = []
-
-        for page in range(1, pages + 1):
-            url = f"https://www.jobkorea.co.kr/Search/?stext={keyword}&tabType=recruit&Page_No={page}"
-
-            try:
-                response = requests.get(url, headers=self.headers, timeout=10)
-                if response.status_code != 200:
-                    print(f"  페이지 {page}: 응답 오류 ({response.status_code})")
-                    continue
-
-                soup = BeautifulSoup(response.text, 'html.parser')
-                job_items = soup.select('.list-default .list-post')
-
-                for item in job_items:
-                    try:
-                        title_elem = item.select_one('.post-list-info a.title')
-                        company_elem = item.select_one('.post-list-corp a.name')
-                        options = item.select('.option span')
-
-                        if not title_elem:
-                            continue
-
-                        job = {
-                            'source': '잡코리아',
-                            'title': title_elem.get_text(strip=True),
-                            'company': company_elem.get_text(strip=True) if company_elem else '',
-                            'link': 'https://www.jobkorea.co.kr' + title_elem.get('href', ''),
-                            'conditions': [o.get_text(strip=True) for o in options],
-                            'sector': '',
-                            'raw_text': item.get_text(' ', strip=True)
-                        }
-                        jobs.append(job)
-                    except Exception as e:
-                        continue
-
-                print(f"  페이지 {page}: {len(job_items)}개 공고 수집")
-                time.sleep(1)
-
-            except Exception as e:
-                print(f"  페이지 {page}: 오류 발생 - {e}")
-                continue
-
-        print(f"[잡코리아] 총 {len(jobs)}개 공고 수집 완료")
-        return jobs
-
-    def crawl_wanted(self, keyword: str, limit: int = 50) -> List[Dict]:
-        """원티드 채용공고 크롤링 (API 방식)"""
-        print(f"\n[원티드] '{keyword}' 검색 중...")
-        jobs = []
-
-        # 원티드는 API로 데이터를 가져옴
-        url = f"https://www.wanted.co.kr/api/v4/jobs?country=kr&job_sort=company.response_rate_order&years=-1&locations=all&query={keyword}&limit={limit}"
-
-        try:
-            response = requests.get(url, headers=self.headers, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                for item in data.get('data', []):
-                    job = {
-                        'source': '원티드',
-                        'title': item.get('position', ''),
-                        'company': item.get('company', {}).get('name', ''),
-                        'link': f"https://www.wanted.co.kr/wd/{item.get('id', '')}",
-                        'conditions': [],
-                        'sector': '',
-                        'raw_text': f"{item.get('position', '')} {item.get('company', {}).get('name', '')}"
-                    }
-                    jobs.append(job)
-                print(f"[원티드] 총 {len(jobs)}개 공고 수집 완료")
-            else:
-                print(f"[원티드] API 응답 오류: {response.status_code}")
-        except Exception as e:
-            print(f"[원티드] 오류 발생: {e}")
-
-        return jobs
+    def crawl_source(self, source: str, keyword: str, pages: int = 5, limit: int = 50,
+                     seen_index: Optional[SeenIndex] = None) -> List[Dict]:
+        """출처 이름('사람인', '잡코리아', '원티드')으로 목록 크롤링"""
+        return self.engine.crawl_list(self.adapters[source], keyword, pages=pages, limit=limit, seen_index=seen_index)
 
-    def extract_tech_stack(self, text: str) -> List[str]:
-        """텍스트에서 기술스택 추출"""
-        found_techs = []
-        text_lower = text.lower()
+    def crawl_saramin(self, keyword: str, pages: int = 5, seen_index: Optional[SeenIndex] = None) -> List[Dict]:
+        """사람인 채용공고 크롤링 (seen_index가 있으면 이미 본 페이지에서 중단)"""
+        return self.crawl_source('사람인', keyword, pages=pages, seen_index=seen_index)
 
-        for tech, keywords in TECH_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword.lower() in text_lower:
-                    found_techs.append(tech)
-                    break
+    def crawl_jobkorea(self, keyword: str, pages: int = 5, seen_index: Optional[SeenIndex] = None) -> List[Dict]:
+        """잡코리아 채용공고 크롤링 (seen_index가 있으면 이미 본 페이지에서 중단)"""
+        return self.crawl_source('잡코리아', keyword, pages=pages, seen_index=seen_index)
 
-        return list(set(found_techs))
+    def crawl_wanted(self, keyword: str, limit: int = 50, seen_index: Optional[SeenIndex] = None) -> List[Dict]:
+        """원티드 채용공고 크롤링 (API 방식, limit개까지 offset 페이지를 동시에 요청)"""
+        return self.crawl_source('원티드', keyword, limit=limit, seen_index=seen_index)
+
+    def extract_tech_stack(self, text: str) -> List[str]:
+        """텍스트에서 기술스택 추출 (단어 경계를 지키는 한 번 순회 매칭)"""
+        return TECH_MATCHER.find(text)
 
     def analyze_jobs(self, jobs: List[Dict]) -> Dict:
         """수집된 공고 분석"""
@@ -273,10 +111,9 @@ class JobCrawler:
         """결과 저장"""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
 
-        # CSV 저장
-        df = pd.DataFrame(jobs)
+        # CSV 저장 (공고마다 키가 다를 수 있어 처음 나온 순서대로 모든 키를 컬럼으로)
         csv_path = f"{output_dir}/jobs_{timestamp}.csv"
-        df.to_csv(csv_path, index=False, encoding='utf-8-sig')
+        write_csv(jobs, csv_path)
         print(f"\n📁 CSV 저장: {csv_path}")
 
         # JSON 저장
@@ -318,40 +155,49 @@ class JobCrawler:
                 f.write(f"- {company}: {count}개\n")
 
 
-def main():
-    crawler = JobCrawler()
-    all_jobs = []
+DEFAULT_OUTPUT_DIR = '/home/junhyun/job_crawler'
+DEFAULT_KEYWORDS = ['데이터 엔지니어', '백엔드 개발자', 'backend developer', 'data engineer']
 
-    # 검색 키워드
-    keywords = ['데이터 엔지니어', '백엔드 개발자', 'backend developer', 'data engineer']
 
-    print("="*60)
-    print("🔍 채용공고 크롤링 시작")
-    print("="*60)
+def run_crawl(keywords: List[str], output_dir: str, pages: int = 3, wanted_limit: int = 200,
+              keyword_delay: float = 2.0, base_url: Optional[str] = None,
+              **crawler_options) -> Tuple[List[Dict], Dict]:
+    """목록 크롤링 1회 실행 (수집 → 중복 제거 → 분석 → 저장) → (공고 목록, 분석 결과)
+
+    base_url을 주면 모든 출처를 그 주소로 요청 (로컬 재생 서버 벤치마크용)
+    """
+    crawler = JobCrawler(cache_path=f"{output_dir}/.http_cache.sqlite", **crawler_options)
+    if base_url:
+        crawler.engine.set_base_url(base_url)
+    seen_index = SeenIndex(f"{output_dir}/seen_postings.sqlite")
+    all_jobs = []
+
+    for i, keyword in enumerate(keywords):
+        if i and keyword_delay:
+            time.sleep(keyword_delay)  # 키워드 간 간격
 
-    for keyword in keywords:
         # 사람인 크롤링
-        saramin_jobs = crawler.crawl_saramin(keyword, pages=3)
+        saramin_jobs = crawler.crawl_saramin(keyword, pages=pages, seen_index=seen_index)
         all_jobs.extend(saramin_jobs)
 
         # 잡코리아 크롤링
-        jobkorea_jobs = crawler.crawl_jobkorea(keyword, pages=3)
+        jobkorea_jobs = crawler.crawl_jobkorea(keyword, pages=pages, seen_index=seen_index)
         all_jobs.extend(jobkorea_jobs)
 
         # 원티드 크롤링
-        wanted_jobs = crawler.crawl_wanted(keyword, limit=30)
+        wanted_jobs = crawler.crawl_wanted(keyword, limit=wanted_limit, seen_index=seen_index)
         all_jobs.extend(wanted_jobs)
 
-        time.sleep(2)  # 키워드 간 간격
+    print(f"\n📦 HTTP 캐시: {crawler.session.summary()}")
+
+    seen_index.record(all_jobs)
+    counts = seen_index.finish_run()
+    seen_index.close()
+    print(f"🗂  공고 변화: 신규 {counts['new']}개 / 변경 {counts['changed']}개 / "
+          f"유지 {counts['unchanged']}개 / 마감 {counts['removed']}개")
 
-    # 중복 제거 (회사명+제목 기준)
-    seen = set()
-    unique_jobs = []
-    for job in all_jobs:
-        key = (job['company'], job['title'])
-        if key not in seen:
-            seen.add(key)
-            unique_jobs.append(job)
+    # 유사 중복 제거 (정규화 회사명 + 제목 MinHash/LSH, 출처 간 중복 포함)
+    unique_jobs = dedup_jobs(all_jobs)
 
     print(f"\n중복 제거 후: {len(unique_jobs)}개 (원본: {len(all_jobs)}개)")
 
@@ -359,7 +205,17 @@ def main():
     result = crawler.analyze_jobs(unique_jobs)
 
     # 저장
-    crawler.save_results(unique_jobs, result, output_dir='/home/junhyun/job_crawler')
+    crawler.save_results(unique_jobs, result, output_dir=output_dir)
+    crawler.session.close()
+    return unique_jobs, result
+
+
+def main():
+    print("="*60)
+    print("🔍 채용공고 크롤링 시작")
+    print("="*60)
+
+    run_crawl(DEFAULT_KEYWORDS, DEFAULT_OUTPUT_DIR)
 
     print("\n" + "="*60)
     print("✅ 크롤링 및 분석 완료!")
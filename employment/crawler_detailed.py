@@ -1,399 +1,202 @@
 #!/usr/bin/env python3
 """
-채용공고 상세 크롤러 - 사람인, 원티드에서 상세 공고 내용까지 수집
+채용공고 상세 크롤러 - 사람인, 잡코리아, 원티드에서 상세 공고 내용까지 수집
 자격요건, 우대사항, 기술스택, 연봉 정보 등 포함
 """
 
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
-import re
-import time
 import json
 from collections import Counter
 from datetime import datetime
 from typing import List, Dict, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
 import warnings
 warnings.filterwarnings('ignore')
 
-# 기술스택 키워드 정의 (더 상세하게)
-TECH_KEYWORDS = {
-    # 언어
-    'Python': ['python', '파이썬'],
-    'Java': ['java', '자바'],
-    'Kotlin': ['kotlin', '코틀린'],
-    'Go': ['golang', 'go언어', 'go '],
-    'Scala': ['scala', '스칼라'],
-    'TypeScript': ['typescript', 'ts'],
-    'JavaScript': ['javascript', 'js', 'node.js', 'nodejs'],
-    'SQL': ['sql'],
-    'C++': ['c++', 'cpp'],
-    'Rust': ['rust', '러스트'],
-    'Ruby': ['ruby', '루비'],
-    'PHP': ['php'],
-
-    # 백엔드 프레임워크
-    'Spring': ['spring', 'spring boot', 'springboot', '스프링'],
-    'Spring Boot': ['spring boot', 'springboot', '스프링부트', '스프링 부트'],
-    'Django': ['django', '장고'],
-    'FastAPI': ['fastapi', 'fast api'],
-    'Flask': ['flask', '플라스크'],
-    'Express': ['express', 'express.js'],
-    'NestJS': ['nestjs', 'nest.js'],
-    'JPA': ['jpa', 'hibernate', '하이버네이트'],
-    'MyBatis': ['mybatis', '마이바티스'],
-
-    # 데이터 처리
-    'Spark': ['spark', 'pyspark', '스파크', 'apache spark'],
-    'Hadoop': ['hadoop', '하둡'],
-    'Airflow': ['airflow', 'apache airflow', '에어플로우'],
-    'Kafka': ['kafka', '카프카', 'apache kafka'],
-    'Flink': ['flink', '플링크'],
-    'Presto': ['presto', 'trino'],
-    'Hive': ['hive', '하이브'],
-    'dbt': ['dbt', 'data build tool'],
-    'ETL': ['etl', 'elt'],
-    'Data Pipeline': ['data pipeline', '데이터 파이프라인'],
-
-    # 데이터베이스
-    'MySQL': ['mysql', 'mariadb'],
-    'PostgreSQL': ['postgresql', 'postgres', 'psql'],
-    'Oracle': ['oracle', '오라클'],
-    'MongoDB': ['mongodb', '몽고db', '몽고디비'],
-    'Redis': ['redis', '레디스'],
-    'Elasticsearch': ['elasticsearch', 'elastic search', 'elk'],
-    'DynamoDB': ['dynamodb'],
-    'Redshift': ['redshift', '레드시프트'],
-    'BigQuery': ['bigquery', '빅쿼리'],
-    'Snowflake': ['snowflake', '스노우플레이크'],
-    'Cassandra': ['cassandra', '카산드라'],
-    'ClickHouse': ['clickhouse', '클릭하우스'],
-
-    # 클라우드
-    'AWS': ['aws', 'amazon web services', 'ec2', 's3', 'lambda', 'ecs', 'eks', 'rds', 'emr', 'athena', 'glue'],
-    'GCP': ['gcp', 'google cloud', 'gce', 'bigquery', 'dataflow'],
-    'Azure': ['azure', '애저', 'microsoft azure'],
-    'NCP': ['ncp', 'naver cloud', '네이버 클라우드'],
-
-    # 컨테이너/오케스트레이션
-    'Docker': ['docker', '도커'],
-    'Kubernetes': ['kubernetes', 'k8s', '쿠버네티스'],
-    'ECS': ['ecs', 'fargate'],
-    'EKS': ['eks'],
-
-    # CI/CD & DevOps
-    'Jenkins': ['jenkins', '젠킨스'],
-    'GitHub Actions': ['github actions', 'github action'],
-    'GitLab CI': ['gitlab ci', 'gitlab-ci'],
-    'ArgoCD': ['argocd', 'argo cd', 'argo'],
-    'Terraform': ['terraform', '테라폼'],
-    'Ansible': ['ansible', '앤서블'],
-    'Helm': ['helm', '헬름'],
-
-    # 모니터링/로깅
-    'Prometheus': ['prometheus', '프로메테우스'],
-    'Grafana': ['grafana', '그라파나'],
-    'Datadog': ['datadog', '데이터독'],
-    'ELK Stack': ['elk', 'logstash', 'kibana'],
-
-    # 기타
-    'Linux': ['linux', '리눅스', 'ubuntu', 'centos'],
-    'Git': ['git', '깃', 'github', 'gitlab'],
-    'REST API': ['rest api', 'restful', 'rest'],
-    'GraphQL': ['graphql', '그래프큐엘'],
-    'gRPC': ['grpc'],
-    'MSA': ['msa', 'microservice', '마이크로서비스'],
-    'Message Queue': ['message queue', 'mq', 'rabbitmq', 'sqs'],
-    'CI/CD': ['ci/cd', 'cicd', 'ci cd', '지속적 통합'],
-    'Agile': ['agile', '애자일', 'scrum', '스크럼'],
-    'TDD': ['tdd', 'test driven', '테스트 주도'],
-}
-
-# 자격요건 관련 키워드
-QUALIFICATION_PATTERNS = {
-    'experience': [
-        r'(\d+)\s*년\s*이상',
-        r'경력\s*(\d+)\s*년',
-        r'(\d+)\s*~\s*(\d+)\s*년',
-        r'(\d+)년차',
-    ],
-    'education': [
-        r'(대졸|학사|석사|박사|초대졸|고졸)',
-        r'(컴퓨터|전산|정보|소프트웨어|IT)\s*(공학|과학|학과)',
-    ],
-}
-
+from change_tracker import ChangeTracker
+from crawl_metrics import CrawlMetrics
+from dashboard import write_dashboard
+from dedup import NearDuplicateIndex, dedup_jobs
+import job_record
+from job_store import JobStore
+from pipeline import SOURCES, run_pipeline
+from requirement_extractor import experience_label, extract_requirements, parse_experience
+from search_index import SearchIndex
+from seen_index import SeenIndex
+from sources import build_adapters, detail_cache_rule
+from tech_matcher import load_matcher
+
+# 기술스택 별칭 사전 (tech_aliases.json, 크롤러 공통 - 컴파일 결과는 pickle로 캐시)
+TECH_MATCHER = load_matcher()
+TECH_KEYWORDS = TECH_MATCHER.keywords
 
 class DetailedJobCrawler:
-    def __init__(self):
+    def __init__(self, max_workers: int = 8, per_host: int = 4, min_interval: float = 0.1,
+                 cache_path: Optional[str] = None, parser: str = 'lxml', metrics: Optional[CrawlMetrics] = None):
+        """per_host/min_interval: 출처(사이트)별 동시 요청 수와 요청 시작 간격"""
+        # 수집에만 필요한 HTTP/HTML 파서 모듈은 크롤러를 만들 때 import (analyze/report/search CLI 시작 시간 단축)
+        import requests
+        from fetch_engine import FetchEngine
+        from html_parser import get_parser
+        from http_cache import CachedSession
+
+        self.max_workers = max_workers
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
         }
-        self.session = requests.Session()
+        # HTML 파서 백엔드 ('lxml' 기본, 설치되지 않았으면 'bs4')
+        self.parser = get_parser(parser)
+        # 사이트별 어댑터 + 공통 수집 엔진 (커넥션 풀, 재시도, 출처별 동시성 제한)
+        self.adapters = build_adapters(self.parser, self.extract_tech_stack)
+        # cache_path를 주면 상세 응답을 디스크에 캐시하고 조건부 요청으로 재검증 (목록은 매번 새로 요청)
+        if cache_path:
+            self.session = CachedSession(cache_path, cacheable=detail_cache_rule(self.adapters))
+        else:
+            self.session = requests.Session()
         self.session.headers.update(self.headers)
+        self.engine = FetchEngine(self.session, self.adapters, max_workers=max_workers,
+                                  per_source=per_host, min_interval=min_interval, metrics=metrics)
 
-    def crawl_saramin_list(self, keyword: str, pages: int = 5) -> List[Dict]:
-        """사람인 채용공고 목록 크롤링"""
-        print(f"\n[사람인] '{keyword}' 목록 수집 중...")
-        jobs = []
-
-        for page in range(1, pages + 1):
-            url = f"https://www.saramin.co.kr/zf_user/search/recruit?searchType=search&searchword={keyword}&recruitPage={page}"
-
-            try:
-                response = self.session.get(url, timeout=10)
-                if response.status_code != 200:
-                    continue
-
-                soup = BeautifulSoup(response.text, 'html.parser')
-                job_items = soup.select('.item_recruit')
-
-                for item in job_items:
-                    try:
-                        title_elem = item.select_one('.job_tit a')
-                        company_elem = item.select_one('.corp_name a')
-                        conditions = item.select('.job_condition span')
-
-                        if not title_elem:
-                            continue
-
-                        href = title_elem.get('href', '')
-                        # rec_idx 추출
-                        rec_idx_match = re.search(r'rec_idx=(\d+)', href)
-                        if not rec_idx_match:
-                            continue
-
-                        job = {
-                            'source': '사람인',
-                            'title': title_elem.get_text(strip=True),
-                            'company': company_elem.get_text(strip=True) if company_elem else '',
-                            'rec_idx': rec_idx_match.group(1),
-                            'link': f"https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx={rec_idx_match.group(1)}",
-                            'conditions': [c.get_text(strip=True) for c in conditions],
-                        }
-                        jobs.append(job)
-                    except Exception:
-                        continue
-
-                print(f"  페이지 {page}: {len(job_items)}개")
-                time.sleep(0.5)
-
-            except Exception as e:
-                print(f"  페이지 {page}: 오류 - {e}")
-                continue
-
-        print(f"[사람인] 목록 {len(jobs)}개 수집 완료")
-        return jobs
-
-    def get_saramin_detail(self, job: Dict) -> Dict:
-        """사람인 상세 공고 크롤링"""
-        try:
-            url = job['link']
-            response = self.session.get(url, timeout=10)
-            if response.status_code != 200:
-                return job
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # 상세 정보 추출
-            detail = {
-                'qualifications': '',      # 자격요건
-                'preferred': '',           # 우대사항
-                'responsibilities': '',    # 담당업무
-                'benefits': '',            # 복리후생
-                'salary': '',              # 연봉
-                'detail_tech_stack': [],   # 상세 기술스택
-                'experience_years': '',    # 경력 연차
-                'education': '',           # 학력
-                'full_description': '',    # 전체 설명
-            }
-
-            # 채용 상세 섹션 찾기
-            detail_sections = soup.select('.jv_cont')
-
-            for section in detail_sections:
-                header = section.select_one('.jv_header, .tit_cont')
-                content = section.select_one('.jv_detail, .cont')
-
-                if not header or not content:
-                    continue
-
-                header_text = header.get_text(strip=True)
-                content_text = content.get_text('\n', strip=True)
-
-                if any(k in header_text for k in ['자격요건', '자격 요건', '필수', '지원자격']):
-                    detail['qualifications'] = content_text
-                elif any(k in header_text for k in ['우대', '선호', '가산점']):
-                    detail['preferred'] = content_text
-                elif any(k in header_text for k in ['담당업무', '업무내용', '주요업무', '담당 업무']):
-                    detail['responsibilities'] = content_text
-                elif any(k in header_text for k in ['복리후생', '혜택', '복지']):
-                    detail['benefits'] = content_text
-
-            # 연봉 정보
-            salary_elem = soup.select_one('.salary')
-            if salary_elem:
-                detail['salary'] = salary_elem.get_text(strip=True)
-
-            # 경력/학력 정보
-            career_elem = soup.select_one('.career')
-            if career_elem:
-                detail['experience_years'] = career_elem.get_text(strip=True)
-
-            edu_elem = soup.select_one('.education')
-            if edu_elem:
-                detail['education'] = edu_elem.get_text(strip=True)
-
-            # 전체 설명 (기술스택 추출용)
-            job_detail = soup.select_one('.jv_detail, .job_detail, .wrap_jv_cont')
-            if job_detail:
-                detail['full_description'] = job_detail.get_text('\n', strip=True)
-
-            # 기술스택 추출
-            full_text = f"{detail['qualifications']} {detail['preferred']} {detail['responsibilities']} {detail['full_description']}"
-            detail['detail_tech_stack'] = self.extract_tech_stack(full_text)
-
-            job.update(detail)
-            return job
-
-        except Exception as e:
-            job['error'] = str(e)
-            return job
-
-    def crawl_wanted_list(self, keyword: str, limit: int = 50) -> List[Dict]:
-        """원티드 채용공고 목록 크롤링"""
-        print(f"\n[원티드] '{keyword}' 목록 수집 중...")
-        jobs = []
-
-        url = f"https://www.wanted.co.kr/api/v4/jobs?country=kr&job_sort=company.response_rate_order&years=-1&locations=all&query={keyword}&limit={limit}"
-
-        try:
-            response = self.session.get(url, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                for item in data.get('data', []):
-                    job = {
-                        'source': '원티드',
-                        'title': item.get('position', ''),
-                        'company': item.get('company', {}).get('name', ''),
-                        'job_id': item.get('id', ''),
-                        'link': f"https://www.wanted.co.kr/wd/{item.get('id', '')}",
-                        'conditions': [],
-                    }
-                    jobs.append(job)
-                print(f"[원티드] 목록 {len(jobs)}개 수집 완료")
-        except Exception as e:
-            print(f"[원티드] 오류: {e}")
-
-        return jobs
-
-    def get_wanted_detail(self, job: Dict) -> Dict:
-        """원티드 상세 공고 크롤링 (API)"""
-        try:
-            job_id = job.get('job_id', '')
-            if not job_id:
-                return job
-
-            url = f"https://www.wanted.co.kr/api/v4/jobs/{job_id}"
-            response = self.session.get(url, timeout=10)
-
-            if response.status_code != 200:
-                return job
-
-            data = response.json()
-            job_data = data.get('job', {})
-
-            detail = {
-                'qualifications': job_data.get('requirements', ''),
-                'preferred': job_data.get('preferred', ''),
-                'responsibilities': job_data.get('responsibilities', ''),
-                'benefits': job_data.get('benefits', ''),
-                'salary': '',
-                'detail_tech_stack': [],
-                'experience_years': '',
-                'education': '',
-                'full_description': job_data.get('detail', ''),
-            }
-
-            # 기술 태그
-            skill_tags = job_data.get('skill_tags', [])
-            if skill_tags:
-                detail['detail_tech_stack'] = [tag.get('title', '') for tag in skill_tags]
-
-            # 추가 기술스택 추출
-            full_text = f"{detail['qualifications']} {detail['preferred']} {detail['responsibilities']} {detail['full_description']}"
-            extracted_techs = self.extract_tech_stack(full_text)
-            detail['detail_tech_stack'] = list(set(detail['detail_tech_stack'] + extracted_techs))
-
-            job.update(detail)
-            return job
-
-        except Exception as e:
-            job['error'] = str(e)
-            return job
+    def crawl_list(self, source: str, keyword: str, pages: int = 3, limit: int = 30,
+                   seen_index: Optional[SeenIndex] = None) -> List[Dict]:
+        """출처 이름('사람인', '잡코리아', '원티드')으로 목록 크롤링"""
+        return self.engine.crawl_list(self.adapters[source], keyword, pages=pages, limit=limit, seen_index=seen_index)
 
-    def extract_tech_stack(self, text: str) -> List[str]:
-        """텍스트에서 기술스택 추출"""
-        found_techs = []
-        text_lower = text.lower()
-
-        for tech, keywords in TECH_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword.lower() in text_lower:
-                    found_techs.append(tech)
-                    break
+    def crawl_saramin_list(self, keyword: str, pages: int = 5, seen_index: Optional[SeenIndex] = None) -> List[Dict]:
+        """사람인 채용공고 목록 크롤링 (seen_index가 있으면 이미 본 페이지에서 중단)"""
+        return self.crawl_list('사람인', keyword, pages=pages, seen_index=seen_index)
 
-        return list(set(found_techs))
+    def crawl_jobkorea_list(self, keyword: str, pages: int = 5, seen_index: Optional[SeenIndex] = None) -> List[Dict]:
+        """잡코리아 채용공고 목록 크롤링 (seen_index가 있으면 이미 본 페이지에서 중단)"""
+        return self.crawl_list('잡코리아', keyword, pages=pages, seen_index=seen_index)
+
+    def crawl_wanted_list(self, keyword: str, limit: int = 50, seen_index: Optional[SeenIndex] = None) -> List[Dict]:
+        """원티드 채용공고 목록 크롤링 (limit개까지 offset 페이지를 동시에 요청)"""
+        return self.crawl_list('원티드', keyword, limit=limit, seen_index=seen_index)
+
+    def get_detail(self, job: Dict) -> Dict:
+        """공고 출처의 어댑터로 상세 크롤링 (job 제자리 갱신)"""
+        return self.engine.fetch_detail(job, on_detail=self.add_requirements)
+
+    def extract_tech_stack(self, text: str) -> List[str]:
+        """텍스트에서 기술스택 추출 (단어 경계를 지키는 한 번 순회 매칭)"""
+        return TECH_MATCHER.find(text)
 
     def extract_experience(self, text: str) -> str:
-        """경력 연차 추출"""
-        for pattern in QUALIFICATION_PATTERNS['experience']:
-            match = re.search(pattern, text)
-            if match:
-                return match.group(0)
-        return ''
-
-    def crawl_with_details(self, keywords: List[str], saramin_pages: int = 3, wanted_limit: int = 30) -> List[Dict]:
-        """목록 + 상세 정보 크롤링"""
+        """경력 연차 추출 ('3~7년', '5년 이상' 형식)"""
+        return experience_label(*parse_experience(text))
+
+    def add_requirements(self, job: Dict) -> Dict:
+        """경력/학력/연봉 구조화 필드 추가, experience_years는 집계용 표기로 통일"""
+        job.update(extract_requirements(job))
+        label = experience_label(job['min_years'], job['max_years'])
+        if label:
+            job['experience_years'] = label
+        return job
+
+    def fetch_details(self, jobs: List[Dict], label: str = '') -> List[Dict]:
+        """상세 정보 병렬 수집 (입력 순서 유지, 출처별 요청 제한 적용)"""
+        return self.engine.fetch_details(jobs, on_detail=self.add_requirements, label=label)
+
+    def is_pending_retry(self, job: Dict) -> bool:
+        """상세 요청이 실패해 실행 끝 재시도를 기다리는 공고인지"""
+        return self.engine.is_queued(job)
+
+    def pending_retries(self) -> List[Dict]:
+        """실행 끝 재시도를 기다리는 공고 목록"""
+        return self.engine.queued_jobs()
+
+    def requeue(self, jobs: List[Dict]):
+        """공고를 실행 끝 재시도 대상으로 다시 넣기 (체크포인트에서 재개할 때)"""
+        self.engine.requeue(jobs, on_detail=self.add_requirements)
+
+    def retry_failed(self) -> List[Dict]:
+        """실패한 상세 요청 재시도 → 다시 요청한 공고 목록"""
+        return self.engine.drain_retries()
+
+    def crawl_with_details(self, keywords: List[str], saramin_pages: int = 3, wanted_limit: int = 30,
+                           seen_index: Optional[SeenIndex] = None) -> List[Dict]:
+        """목록 + 상세 정보 크롤링 (seen_index가 있으면 신규/변경 공고만 상세 수집)
+
+        saramin_pages는 페이지 단위 출처(사람인, 잡코리아) 공통 페이지 수
+        키워드 간/출처 간 중복 공고(같은 공고 ID 또는 유사 공고)는 상세 요청 전에 제외
+        """
         all_jobs = []
+        dedup_index = NearDuplicateIndex()
 
         for keyword in keywords:
-            # 사람인
-            saramin_jobs = self.crawl_saramin_list(keyword, pages=saramin_pages)
-            print(f"[사람인] '{keyword}' 상세 정보 수집 중... ({len(saramin_jobs)}개)")
+            listing = []
+            counts = []
+            for source in SOURCES:
+                source_jobs = self.crawl_list(source, keyword, pages=saramin_pages, limit=wanted_limit,
+                                              seen_index=seen_index)
+                listing.extend(source_jobs)
+                counts.append(f"{source} {len(source_jobs)}개")
+
+            # 상세 정보는 모든 출처를 한 번에 병렬 수집 (출처별로 따로 제한)
+            keyword_jobs = dedup_jobs(listing, dedup_index)
+            to_fetch = seen_index.split_for_details(keyword_jobs) if seen_index else keyword_jobs
+            print(f"['{keyword}'] 상세 정보 수집 중... ({', '.join(counts)}, 요청 {len(to_fetch)}개)")
+            self.fetch_details(to_fetch)
+
+            if seen_index:
+                seen_index.record(listing)
+            all_jobs.extend(keyword_jobs)
+
+        # 429/5xx/차단기로 실패한 상세는 마지막에 한 번 더 요청
+        retried = self.retry_failed()
+        if seen_index and retried:
+            seen_index.store_details(retried)
+        return all_jobs
 
-            for i, job in enumerate(saramin_jobs):
-                self.get_saramin_detail(job)
-                if (i + 1) % 10 == 0:
-                    print(f"  {i+1}/{len(saramin_jobs)} 완료")
-                time.sleep(0.3)  # 요청 간격
+    def analyze_detailed_jobs(self, jobs: List[Dict], store: Optional[JobStore] = None,
+                              run_id: Optional[int] = None) -> Dict:
+        """상세 공고 분석 (store가 있으면 SQL 집계 사용)"""
+        if store is not None:
+            result = store.aggregate(run_id)
+        else:
+            result = self._aggregate_jobs(jobs)
 
-            all_jobs.extend(saramin_jobs)
+        self.print_analysis(result)
+        return result
 
-            # 원티드
-            wanted_jobs = self.crawl_wanted_list(keyword, limit=wanted_limit)
-            print(f"[원티드] '{keyword}' 상세 정보 수집 중... ({len(wanted_jobs)}개)")
+    @staticmethod
+    def print_analysis(result: Dict):
+        """분석 결과 출력"""
+        print("\n" + "="*70)
+        print("📊 상세 채용공고 분석 결과")
+        print("="*70)
 
-            for i, job in enumerate(wanted_jobs):
-                self.get_wanted_detail(job)
-                if (i + 1) % 10 == 0:
-                    print(f"  {i+1}/{len(wanted_jobs)} 완료")
-                time.sleep(0.3)
+        total = result['total_jobs'] or 1
+        print(f"\n📌 총 수집 공고: {result['total_jobs']}개")
+        print(f"   상세정보 수집 성공: {result['jobs_with_details']}개")
 
-            all_jobs.extend(wanted_jobs)
-            time.sleep(1)
+        print(f"\n📍 출처별:")
+        for source, count in result['by_source'].items():
+            print(f"   - {source}: {count}개")
 
-        return all_jobs
+        print(f"\n🔧 기술스택 Top 25 (상세 공고 기반):")
+        for i, (tech, count) in enumerate(list(result['tech_frequency'].items())[:25], 1):
+            percentage = (count / total) * 100
+            bar = '█' * int(percentage / 2)
+            print(f"  {i:2}. {tech:18} | {bar:25} {count:3}개 ({percentage:.1f}%)")
 
-    def analyze_detailed_jobs(self, jobs: List[Dict]) -> Dict:
-        """상세 공고 분석"""
-        print("\n" + "="*70)
-        print("📊 상세 채용공고 분석 결과")
-        print("="*70)
+        print(f"\n📋 자격요건에서 많이 언급된 기술 Top 15:")
+        for i, (tech, count) in enumerate(list(result['qualification_tech_frequency'].items())[:15], 1):
+            percentage = (count / total) * 100
+            print(f"  {i:2}. {tech:18} - {count:3}개 ({percentage:.1f}%)")
+
+        print(f"\n🏢 채용 활발한 회사 Top 10:")
+        for company, count in result['top_companies'][:10]:
+            print(f"   - {company}: {count}개")
+
+        if result['experience_distribution']:
+            print(f"\n📅 경력 요구사항:")
+            for exp, count in result['experience_distribution']:
+                print(f"   - {exp}: {count}개")
 
+    def _aggregate_jobs(self, jobs: List[Dict]) -> Dict:
+        """공고 목록을 직접 순회하며 집계"""
         # 기술스택 빈도 분석 (상세 정보 기반)
         all_techs = []
         for job in jobs:
@@ -417,8 +220,7 @@ class DetailedJobCrawler:
             if exp:
                 experience_list.append(exp)
 
-        # 결과 정리
-        result = {
+        return {
             'total_jobs': len(jobs),
             'jobs_with_details': len([j for j in jobs if j.get('qualifications') or j.get('full_description')]),
             'by_source': dict(Counter(job['source'] for job in jobs)),
@@ -428,40 +230,30 @@ class DetailedJobCrawler:
             'experience_distribution': Counter(experience_list).most_common(10),
         }
 
-        # 출력
-        print(f"\n📌 총 수집 공고: {result['total_jobs']}개")
-        print(f"   상세정보 수집 성공: {result['jobs_with_details']}개")
-
-        print(f"\n📍 출처별:")
-        for source, count in result['by_source'].items():
-            print(f"   - {source}: {count}개")
-
-        print(f"\n🔧 기술스택 Top 25 (상세 공고 기반):")
-        for i, (tech, count) in enumerate(tech_counter.most_common(25), 1):
-            percentage = (count / len(jobs)) * 100
-            bar = '█' * int(percentage / 2)
-            print(f"  {i:2}. {tech:18} | {bar:25} {count:3}개 ({percentage:.1f}%)")
-
-        print(f"\n📋 자격요건에서 많이 언급된 기술 Top 15:")
-        for i, (tech, count) in enumerate(qual_counter.most_common(15), 1):
-            percentage = (count / len(jobs)) * 100
-            print(f"  {i:2}. {tech:18} - {count:3}개 ({percentage:.1f}%)")
+    @staticmethod
+    def save_detailed_results(jobs: List[Dict], result: Dict, output_dir: str = '.', dump_files: bool = True):
+        """상세 결과 저장 (dump_files=False면 공고 CSV/전체 JSON은 생략 - JobStore에 저장한 경우)"""
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
 
-        print(f"\n🏢 채용 활발한 회사 Top 10:")
-        for company, count in result['top_companies'][:10]:
-            print(f"   - {company}: {count}개")
+        if dump_files:
+            DetailedJobCrawler._dump_job_files(jobs, output_dir, timestamp)
 
-        if result['experience_distribution']:
-            print(f"\n📅 경력 요구사항:")
-            for exp, count in result['experience_distribution']:
-                print(f"   - {exp}: {count}개")
+        # 분석 결과 JSON
+        analysis_path = f"{output_dir}/analysis_detailed_{timestamp}.json"
+        with open(analysis_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"📁 분석 결과 저장: {analysis_path}")
 
-        return result
+        # 상세 마크다운 리포트
+        md_path = f"{output_dir}/report_detailed_{timestamp}.md"
+        DetailedJobCrawler._generate_detailed_report(result, jobs, md_path)
+        print(f"📁 상세 리포트 저장: {md_path}")
 
-    def save_detailed_results(self, jobs: List[Dict], result: Dict, output_dir: str = '.'):
-        """상세 결과 저장"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        return timestamp
 
+    @staticmethod
+    def _dump_job_files(jobs: List[Dict], output_dir: str, timestamp: str):
+        """공고 CSV(요약) + 전체 JSON (+ Parquet) 저장"""
         # CSV 저장 (상세 정보 포함)
         df_data = []
         for job in jobs:
@@ -480,9 +272,8 @@ class DetailedJobCrawler:
                 'benefits': job.get('benefits', '')[:300],
             })
 
-        df = pd.DataFrame(df_data)
         csv_path = f"{output_dir}/jobs_detailed_{timestamp}.csv"
-        df.to_csv(csv_path, index=False, encoding='utf-8-sig')
+        job_record.write_csv(df_data, csv_path)
         print(f"\n📁 상세 CSV 저장: {csv_path}")
 
         # JSON 저장 (전체 데이터)
@@ -491,20 +282,14 @@ class DetailedJobCrawler:
             json.dump(jobs, f, ensure_ascii=False, indent=2)
         print(f"📁 전체 JSON 저장: {json_path}")
 
-        # 분석 결과 JSON
-        analysis_path = f"{output_dir}/analysis_detailed_{timestamp}.json"
-        with open(analysis_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, ensure_ascii=False, indent=2)
-        print(f"📁 분석 결과 저장: {analysis_path}")
-
-        # 상세 마크다운 리포트
-        md_path = f"{output_dir}/report_detailed_{timestamp}.md"
-        self._generate_detailed_report(result, jobs, md_path)
-        print(f"📁 상세 리포트 저장: {md_path}")
-
-        return timestamp
+        # Parquet 저장 (이력 분석용 컬럼형, pyarrow가 있을 때만)
+        if job_record.HAS_PYARROW:
+            parquet_path = f"{output_dir}/jobs_{timestamp}.parquet"
+            job_record.write_parquet(jobs, parquet_path)
+            print(f"📁 Parquet 저장: {parquet_path}")
 
-    def _generate_detailed_report(self, result: Dict, jobs: List[Dict], path: str):
+    @staticmethod
+    def _generate_detailed_report(result: Dict, jobs: List[Dict], path: str):
         """상세 마크다운 리포트 생성"""
         with open(path, 'w', encoding='utf-8') as f:
             f.write(f"# 채용공고 상세 분석 리포트\n\n")
@@ -534,6 +319,17 @@ class DetailedJobCrawler:
                 percentage = (count / result['total_jobs']) * 100
                 f.write(f"| {i} | {tech} | {count} | {percentage:.1f}% |\n")
 
+            # JobStore 집계(store.aggregate)에만 있는 자격요건/우대사항 분리 집계
+            if result.get('required_tech_frequency') or result.get('preferred_tech_frequency'):
+                f.write(f"\n## 자격요건 vs 우대사항\n\n")
+                f.write(f"| 기술 | 자격요건 | 우대사항 |\n")
+                f.write(f"|------|----------|----------|\n")
+                required = result.get('required_tech_frequency', {})
+                preferred = result.get('preferred_tech_frequency', {})
+                techs = sorted(set(required) | set(preferred), key=lambda t: -(required.get(t, 0) + preferred.get(t, 0)))
+                for tech in techs[:20]:
+                    f.write(f"| {tech} | {required.get(tech, 0)} | {preferred.get(tech, 0)} |\n")
+
             f.write(f"\n## 채용 활발한 회사\n\n")
             for company, count in result['top_companies'][:15]:
                 f.write(f"- **{company}**: {count}개\n")
@@ -552,43 +348,93 @@ class DetailedJobCrawler:
                 f.write(f"---\n\n")
 
 
-def main():
-    crawler = DetailedJobCrawler()
+DEFAULT_OUTPUT_DIR = '/home/junhyun/job_crawler/employment'
+DEFAULT_KEYWORDS = ['데이터 엔지니어', '백엔드 개발자', 'backend developer', 'data engineer']
+
+
+def run_crawl(keywords: List[str], output_dir: str, sources=SOURCES, saramin_pages: int = 3,
+              wanted_limit: int = 200, batch_size: int = 20, metrics: Optional[CrawlMetrics] = None,
+              base_url: Optional[str] = None, **crawler_options) -> Dict:
+    """상세 크롤링 1회 실행 (파이프라인 → DB/검색 인덱스 → 분석 리포트) → 분석 결과
+
+    crawler_options는 DetailedJobCrawler 인자 (max_workers, per_host, min_interval, parser)
+    base_url을 주면 모든 출처를 그 주소로 요청 (로컬 재생 서버 벤치마크용)
+    """
+    crawler = DetailedJobCrawler(cache_path=f"{output_dir}/.http_cache.sqlite", metrics=metrics, **crawler_options)
+    if base_url:
+        crawler.engine.set_base_url(base_url)
+    seen_index = SeenIndex(f"{output_dir}/seen_postings.sqlite")
+    store = JobStore(f"{output_dir}/jobs.sqlite", extract_tech_stack=crawler.extract_tech_stack)
+
+    try:
+        # 목록 → 중복 제거 → 상세 → 추출 → 저장을 스트리밍으로 처리
+        # (중단되면 다시 실행 시 체크포인트부터 이어서 진행)
+        result, analyzer, jobs_path = run_pipeline(
+            crawler,
+            keywords,
+            output_dir,
+            saramin_pages=saramin_pages,  # 사람인/잡코리아 페이지 수
+            wanted_limit=wanted_limit,  # 원티드 키워드당 최대 공고 수 (50개씩 페이지 요청)
+            batch_size=batch_size,
+            seen_index=seen_index,
+            store=store,
+            sources=sources,
+            metrics=crawler.engine.metrics
+        )
+        print(f"\n📦 HTTP 캐시: {crawler.session.summary()}")
+        print(f"⏱  {crawler.engine.metrics.summary()}")
+
+        counts = seen_index.finish_run()
+        print(f"🗂  공고 변화: 신규 {counts['new']}개 / 변경 {counts['changed']}개 / "
+              f"유지 {counts['unchanged']}개 / 마감 {counts['removed']}개")
+        print(f"📁 공고 JSONL 저장: {jobs_path}")
+
+        # 상세 내용 변경/마감/재등록 추적 (python change_tracker.py events ...)
+        tracker = ChangeTracker(f"{output_dir}/changes.sqlite")
+        tracker.start_run()
+        tracker.observe_file(jobs_path)
+        events = tracker.finish_run(expire_sources=seen_index.complete_sources)
+        tracker.close()
+        print(f"📝 내용 변경 {events['changed']}개 / 마감 {events['closed']}개 / 재등록 {events['reopened']}개")
+        if job_record.HAS_PYARROW:
+            print(f"📁 Parquet 저장: {job_record.convert(jobs_path)}")
+        print(f"🗄  DB 저장: {store.path}")
+
+        # 검색 인덱스 증분 갱신 (python search_index.py search ...)
+        search_index = SearchIndex(f"{output_dir}/search_index.sqlite")
+        counts = search_index.sync(store)
+        search_index.close()
+        print(f"🔎 검색 인덱스: 추가 {counts['added']}개 / 변경 {counts['updated']}개")
+
+        # 대시보드 (집계 테이블만 읽으므로 누적 공고 수와 관계없이 일정한 시간)
+        print(f"📊 대시보드 저장: {write_dashboard(store, f'{output_dir}/dashboard.html')}")
+
+        # 분석 (이번 실행의 집계 테이블 - 파이프라인 카운터와 같은 값 + 자격요건/우대사항 분리)
+        result = store.aggregate(store.latest_run_id())
+        crawler.print_analysis(result)
+
+        # 저장 (공고 데이터는 JSONL/DB에 있으므로 분석 결과/리포트만 파일로)
+        crawler.save_detailed_results(
+            analyzer.samples,
+            result,
+            output_dir=output_dir,
+            dump_files=False
+        )
+    finally:
+        store.close()
+        seen_index.close()
+        crawler.session.close()
+    return result
 
-    keywords = ['데이터 엔지니어', '백엔드 개발자', 'backend developer', 'data engineer']
 
+def main():
     print("="*70)
     print("🔍 채용공고 상세 크롤링 시작")
     print("   (각 공고의 상세 페이지를 방문하여 자격요건/우대사항 등 수집)")
     print("="*70)
 
-    # 상세 크롤링 (시간이 좀 걸림)
-    jobs = crawler.crawl_with_details(
-        keywords=keywords,
-        saramin_pages=3,  # 사람인 페이지 수
-        wanted_limit=30   # 원티드 공고 수
-    )
-
-    # 중복 제거
-    seen = set()
-    unique_jobs = []
-    for job in jobs:
-        key = (job.get('company', ''), job.get('title', ''))
-        if key not in seen and key[0]:
-            seen.add(key)
-            unique_jobs.append(job)
-
-    print(f"\n중복 제거 후: {len(unique_jobs)}개 (원본: {len(jobs)}개)")
-
-    # 분석
-    result = crawler.analyze_detailed_jobs(unique_jobs)
-
-    # 저장
-    timestamp = crawler.save_detailed_results(
-        unique_jobs,
-        result,
-        output_dir='/home/junhyun/job_crawler/employment'
-    )
+    # 정기 실행/설정 파일은 scheduler.py 사용
+    run_crawl(DEFAULT_KEYWORDS, DEFAULT_OUTPUT_DIR)
 
     print("\n" + "="*70)
     print("✅ 상세 크롤링 및 분석 완료!")
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+정적 HTML 대시보드 - JobStore 집계 테이블(job_aggregates)만 읽어서 한 파일로 생성
+
+- 개요: 공고 수 / 상세 수집 수 / 출처별 공고
+- 기술 추이: 최근 실행별 상위 기술 언급 비율 (인라인 SVG 꺾은선, 외부 JS/CSS 없음)
+- 기술스택 / 자격요건 vs 우대사항 / 출처별·회사별 주요 기술
+
+공고 테이블을 훑지 않으므로 보관한 공고 수와 관계없이 생성 시간이 일정함
+
+사용법:
+    python dashboard.py [--db jobs.sqlite] [--run 3] [--out dashboard.html] [--runs 12]
+"""
+
+import argparse
+import html
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from job_store import JobStore
+
+PALETTE = ['#4e79a7', '#f28e2b', '#e15759', '#76b7b2', '#59a14f', '#edc948', '#b07aa1', '#ff9da7']
+
+STYLE = """
+body { font-family: -apple-system, 'Malgun Gothic', sans-serif; margin: 24px; color: #222; }
+h1 { margin-bottom: 4px; } .muted { color: #777; font-size: 13px; }
+.cards { display: flex; gap: 12px; margin: 16px 0; }
+.card { border: 1px solid #ddd; border-radius: 6px; padding: 10px 16px; min-width: 120px; }
+.card b { display: block; font-size: 22px; }
+.grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(360px, 1fr)); gap: 20px; }
+table { border-collapse: collapse; width: 100%; font-size: 14px; }
+td, th { padding: 3px 6px; border-bottom: 1px solid #eee; text-align: left; }
+td.num { text-align: right; white-space: nowrap; }
+.bar { background: #4e79a7; height: 10px; border-radius: 2px; }
+.legend span { display: inline-block; margin-right: 12px; font-size: 13px; }
+.legend i { display: inline-block; width: 10px; height: 10px; margin-right: 4px; }
+"""
+
+
+def _esc(value) -> str:
+    return html.escape(str(value))
+
+
+def bar_table(rows: List[tuple], total: int, headers=('기술', '공고')) -> str:
+    """[(이름, 개수), ...] → 막대 포함 표"""
+    if not rows:
+        return '<p class="muted">데이터 없음</p>'
+    peak = max(count for _, count in rows) or 1
+    body = ''.join(
+        f'<tr><td>{_esc(name)}</td><td class="num">{count} ({count / (total or 1) * 100:.1f}%)</td>'
+        f'<td style="width:40%"><div class="bar" style="width:{count / peak * 100:.0f}%"></div></td></tr>'
+        for name, count in rows
+    )
+    return f'<table><tr><th>{headers[0]}</th><th>{headers[1]}</th><th></th></tr>{body}</table>'
+
+
+def trend_chart(runs: List[tuple], series: Dict[str, List[float]], width: int = 720, height: int = 260) -> str:
+    """실행별 비율(%) 꺾은선 SVG"""
+    if len(runs) < 2:
+        return '<p class="muted">추이를 그리려면 실행이 2회 이상 필요합니다</p>'
+    pad_left, pad_bottom, pad_top = 40, 40, 10
+    plot_w, plot_h = width - pad_left - 10, height - pad_bottom - pad_top
+    peak = max((max(values) for values in series.values()), default=0) or 1
+    step = plot_w / (len(runs) - 1)
+
+    def point(i: int, value: float) -> str:
+        return f"{pad_left + i * step:.1f},{pad_top + plot_h - value / peak * plot_h:.1f}"
+
+    parts = [f'<svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg" font-size="11">']
+    for fraction in (0, 0.5, 1):
+        y = pad_top + plot_h - fraction * plot_h
+        parts.append(f'<line x1="{pad_left}" y1="{y:.1f}" x2="{width - 10}" y2="{y:.1f}" stroke="#eee"/>')
+        parts.append(f'<text x="{pad_left - 4}" y="{y + 4:.1f}" text-anchor="end" fill="#777">{peak * fraction:.0f}%</text>')
+    for i, (run_id, label, started_at, total) in enumerate(runs):
+        x = pad_left + i * step
+        parts.append(f'<text x="{x:.1f}" y="{height - pad_bottom + 16}" text-anchor="middle" fill="#777">'
+                     f'{_esc((started_at or label)[5:10])}</text>')
+    for color, (name, values) in zip(PALETTE, series.items()):
+        points = ' '.join(point(i, value) for i, value in enumerate(values))
+        parts.append(f'<polyline fill="none" stroke="{color}" stroke-width="2" points="{points}">'
+                     f'<title>{_esc(name)}</title></polyline>')
+    parts.append('</svg>')
+    legend = ''.join(f'<span><i style="background:{color}"></i>{_esc(name)}</span>'
+                     for color, name in zip(PALETTE, series))
+    return ''.join(parts) + f'<div class="legend">{legend}</div>'
+
+
+def render_html(store: JobStore, run_id: Optional[int] = None, top: int = 20, runs: int = 12) -> str:
+    """대시보드 HTML (run_id 없으면 가장 최근 실행, 추이는 최근 runs회)"""
+    run_id = run_id if run_id is not None else store.latest_run_id()
+    result = store.aggregate(run_id)
+    overall = store.aggregate()
+    total = result['total_jobs']
+    recent, series = store.trend('tech', top=len(PALETTE), runs=runs)
+
+    sources = ''.join(
+        f'<tr><td>{_esc(source)}</td><td class="num">{count}</td>'
+        f'<td>{_esc(", ".join(tech for tech, _ in store.breakdown("source_tech", source, run_id)))}</td></tr>'
+        for source, count in result['by_source'].items()
+    )
+    companies = ''.join(
+        f'<tr><td>{_esc(company)}</td><td class="num">{count}</td>'
+        f'<td>{_esc(", ".join(tech for tech, _ in store.breakdown("company_tech", company, run_id, 3)))}</td></tr>'
+        for company, count in result['top_companies'][:15]
+    )
+
+    return f"""<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>채용공고 대시보드</title><style>{STYLE}</style></head>
+<body>
+<h1>채용공고 대시보드</h1>
+<div class="muted">run {run_id} · 생성 {datetime.now():%Y-%m-%d %H:%M:%S}</div>
+<div class="cards">
+  <div class="card">이번 실행 공고<b>{total:,}</b></div>
+  <div class="card">상세 수집<b>{result['jobs_with_details']:,}</b></div>
+  <div class="card">누적 공고<b>{overall['total_jobs']:,}</b></div>
+  <div class="card">출처<b>{len(result['by_source'])}</b></div>
+</div>
+<h2>기술 언급 비율 추이 (최근 {len(recent)}회)</h2>
+{trend_chart(recent, series)}
+<div class="grid">
+  <div><h2>기술스택 Top {top}</h2>{bar_table(list(result['tech_frequency'].items())[:top], total)}</div>
+  <div><h2>누적 기술스택 Top {top}</h2>{bar_table(list(overall['tech_frequency'].items())[:top], overall['total_jobs'])}</div>
+  <div><h2>자격요건 기술</h2>{bar_table(list(result['required_tech_frequency'].items())[:15], total)}</div>
+  <div><h2>우대사항 기술</h2>{bar_table(list(result['preferred_tech_frequency'].items())[:15], total)}</div>
+  <div><h2>출처별</h2><table><tr><th>출처</th><th>공고</th><th>주요 기술</th></tr>{sources}</table></div>
+  <div><h2>채용 활발한 회사</h2><table><tr><th>회사</th><th>공고</th><th>주요 기술</th></tr>{companies}</table></div>
+  <div><h2>경력 요구사항</h2>{bar_table(result['experience_distribution'], total, headers=('경력', '공고'))}</div>
+</div>
+</body></html>
+"""
+
+
+def write_dashboard(store: JobStore, path: str, run_id: Optional[int] = None, runs: int = 12) -> str:
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(render_html(store, run_id, runs=runs))
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='집계 테이블로 정적 HTML 대시보드 생성')
+    parser.add_argument('--db', default='jobs.sqlite', help='JobStore DB 경로 (기본: jobs.sqlite)')
+    parser.add_argument('--run', type=int, help='실행 번호 (기본: 가장 최근 실행)')
+    parser.add_argument('--out', default='dashboard.html', help='저장 경로')
+    parser.add_argument('--runs', type=int, default=12, help='추이에 쓸 최근 실행 수')
+    args = parser.parse_args()
+
+    store = JobStore(args.db)
+    start = time.perf_counter()
+    write_dashboard(store, args.out, args.run, args.runs)
+    store.close()
+    print(f"📊 대시보드 저장: {args.out} ({(time.perf_counter() - start) * 1000:.0f}ms)")
+
+
+if __name__ == '__main__':
+    main()
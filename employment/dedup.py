@@ -0,0 +1,188 @@
+"""
+유사 중복 공고 탐지 - 회사명 정규화 + MinHash/LSH
+
+같은 공고가 사람인/잡코리아/원티드에 제목·회사 표기만 조금씩 다르게 올라오는 경우
+((주)케이비헬스케어 vs KB헬스케어, '[정규직] 데이터 엔지니어 채용' vs '데이터 엔지니어') 를 묶음
+- normalize_company: 법인 표기 제거, 영문 약어를 한글 발음으로 (KB → 케이비), 공백/기호 제거
+- 제목(+상세 설명이 있으면 앞부분)을 글자 3-gram으로 쪼개 MinHash 서명 생성
+- LSH 밴드 버킷(정규화 회사명별)으로 후보만 비교 → 전체 쌍 비교 없이 준선형 시간
+- 다른 출처끼리는 추정 유사도가 threshold 이상이면 중복, 같은 출처끼리는 정규화 제목이 같을 때만 중복
+  (같은 회사가 같은 사이트에 올린 비슷한 제목의 공고는 별개 공고인 경우가 많음)
+
+- 출처 ID(posting_key)가 같은 공고는 유사도 계산 없이 바로 중복 (키워드가 겹쳐 같은 공고가 다시 나온 경우)
+
+상세 수집 전에 적용해 중복 공고에는 상세 요청을 보내지 않음
+"""
+
+import random
+import re
+import zlib
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from seen_index import posting_key
+
+# 법인 표기 (정규화 시 제거)
+LEGAL_FORMS = re.compile(
+    r'\(주\)|㈜|\(유\)|\(사\)|\(재\)|\(합\)|주식회사|유한회사|유한책임회사|사단법인|재단법인|'
+    r'\b(?:co\.?,?\s*ltd\.?|inc\.?|corp\.?|corporation|ltd\.?|llc)\b',
+    re.IGNORECASE,
+)
+PARENTHESES = re.compile(r'\([^)]*\)|\[[^\]]*\]')
+ACRONYM = re.compile(r'(?<![A-Za-z])[A-Z]{1,3}(?![A-Za-z])')
+NON_WORD = re.compile(r'[^0-9a-z가-힣]+')
+
+# 영문 대문자 약어의 한글 발음 (KB → 케이비, SK → 에스케이)
+LETTER_READINGS = {
+    'A': '에이', 'B': '비', 'C': '씨', 'D': '디', 'E': '이', 'F': '에프', 'G': '지', 'H': '에이치',
+    'I': '아이', 'J': '제이', 'K': '케이', 'L': '엘', 'M': '엠', 'N': '엔', 'O': '오', 'P': '피',
+    'Q': '큐', 'R': '알', 'S': '에스', 'T': '티', 'U': '유', 'V': '브이', 'W': '더블유', 'X': '엑스',
+    'Y': '와이', 'Z': '지',
+}
+
+# 대표 공고 선택 시 상세 정보가 풍부한 출처 우선
+SOURCE_PRIORITY = {'사람인': 0, '원티드': 1, '잡코리아': 2}
+
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+def _read_acronyms(text: str) -> str:
+    return ACRONYM.sub(lambda m: ''.join(LETTER_READINGS[ch] for ch in m.group()), text)
+
+
+def normalize_company(name: str) -> str:
+    """회사명 비교 키 ('(주)케이비헬스케어', 'KB헬스케어' → '케이비헬스케어')"""
+    name = LEGAL_FORMS.sub(' ', name or '')
+    name = PARENTHESES.sub(' ', name)
+    return NON_WORD.sub('', _read_acronyms(name).lower())
+
+
+def normalize_title(title: str, company_key: str = '') -> str:
+    """제목 비교용 문자열 - 소문자화, 기호/공백 제거, 제목 안의 회사명 제거"""
+    text = NON_WORD.sub('', _read_acronyms(title or '').lower())
+    if company_key and len(text) > len(company_key):
+        text = text.replace(company_key, '')
+    return text
+
+
+def shingles(text: str, k: int = 3) -> set:
+    if len(text) <= k:
+        return {text} if text else set()
+    return {text[i:i + k] for i in range(len(text) - k + 1)}
+
+
+class MinHasher:
+    """(a·x + b) mod p 해시 num_perm개로 MinHash 서명 계산"""
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._params = [(rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+                        for _ in range(num_perm)]
+
+    def signature(self, shingle_set: set) -> Tuple[int, ...]:
+        if not shingle_set:
+            return tuple([_MERSENNE_PRIME] * self.num_perm)
+        values = [zlib.crc32(s.encode('utf-8')) for s in shingle_set]
+        return tuple(min((a * x + b) % _MERSENNE_PRIME for x in values) for a, b in self._params)
+
+
+def estimated_similarity(sig1: Tuple[int, ...], sig2: Tuple[int, ...]) -> float:
+    return sum(1 for x, y in zip(sig1, sig2) if x == y) / len(sig1)
+
+
+class NearDuplicateIndex:
+    """공고를 하나씩 넣으며 유사 중복을 찾는 LSH 인덱스 (먼저 들어온 공고가 대표)"""
+
+    def __init__(self, threshold: float = 0.5, num_perm: int = 64, bands: int = 16,
+                 description_chars: int = 300):
+        assert num_perm % bands == 0
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.description_chars = description_chars
+        self.hasher = MinHasher(num_perm)
+        self._buckets = defaultdict(list)   # (회사 키, 밴드 번호, 밴드 값) → 대표 공고 번호
+        self._entries = []                  # (공고, 출처, 정규화 제목, 서명)
+        self._ids = {}                      # 출처 ID(posting_key) → 먼저 들어온 공고
+        self.stats = Counter()
+
+    def _features(self, job: Dict):
+        company_key = normalize_company(job.get('company', ''))
+        title_key = normalize_title(job.get('title', ''), company_key)
+        text = title_key
+        description = job.get('full_description') or ''
+        if isinstance(description, str) and description:
+            text += ' ' + NON_WORD.sub('', description[:self.description_chars].lower())
+        return company_key, title_key, self.hasher.signature(shingles(text))
+
+    def _band_keys(self, company_key: str, signature: Tuple[int, ...]):
+        for band in range(self.bands):
+            yield company_key, band, signature[band * self.rows:(band + 1) * self.rows]
+
+    def find(self, job: Dict) -> Optional[Dict]:
+        """이미 들어온 공고 중 job의 중복이 있으면 그 대표 공고 반환"""
+        return self._match(job, *self._features(job))
+
+    def _match(self, job: Dict, company_key: str, title_key: str, signature) -> Optional[Dict]:
+        candidates = set()
+        for key in self._band_keys(company_key, signature):
+            candidates.update(self._buckets.get(key, ()))
+        self.stats['comparisons'] += len(candidates)
+
+        for index in sorted(candidates):
+            other, source, other_title, other_signature = self._entries[index]
+            if source == job.get('source'):
+                if other_title == title_key:
+                    return other
+            elif estimated_similarity(signature, other_signature) >= self.threshold:
+                return other
+        return None
+
+    def add(self, job: Dict) -> Optional[Dict]:
+        """공고 추가 - 중복이면 대표 공고를 반환하고 인덱스에는 넣지 않음, 새 공고면 None"""
+        job_id = posting_key(job)
+        if job_id in self._ids:
+            self.stats['duplicates'] += 1
+            self.stats['same_id'] += 1
+            return self._ids[job_id]
+
+        company_key, title_key, signature = self._features(job)
+        if not company_key:
+            self.stats['no_company'] += 1
+            if job_id:
+                self._ids[job_id] = job
+            return None
+
+        original = self._match(job, company_key, title_key, signature)
+        if job_id:
+            self._ids[job_id] = original or job
+        if original is not None:
+            self.stats['duplicates'] += 1
+            if original.get('source') != job.get('source'):
+                self.stats['cross_source'] += 1
+            return original
+
+        index = len(self._entries)
+        self._entries.append((job, job.get('source'), title_key, signature))
+        for key in self._band_keys(company_key, signature):
+            self._buckets[key].append(index)
+        self.stats['unique'] += 1
+        return None
+
+
+def dedup_jobs(jobs: List[Dict], index: Optional[NearDuplicateIndex] = None) -> List[Dict]:
+    """공고 목록의 유사 중복 제거 - 상세 정보가 풍부한 출처(사람인 > 원티드 > 잡코리아)를 대표로 남김
+
+    대표 공고에는 'duplicate_links'로 묶인 공고들의 링크를 기록, 회사명이 없는 공고는 그대로 유지
+    """
+    index = index or NearDuplicateIndex()
+    ordered = sorted(jobs, key=lambda job: SOURCE_PRIORITY.get(job.get('source'), len(SOURCE_PRIORITY)))
+    kept = set()
+    for job in ordered:
+        original = index.add(job)
+        if original is None:
+            kept.add(id(job))
+        elif job.get('link') and job.get('link') != original.get('link'):
+            original.setdefault('duplicate_links', []).append(job['link'])
+    return [job for job in jobs if id(job) in kept]
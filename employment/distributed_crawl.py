@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+분산 크롤링 - crawl_with_details 작업을 영속 작업 큐(work_queue.py)로 나눠 여러 워커 프로세스/노드가 처리
+
+- 목록 작업: 키워드 × 출처 × 페이지 URL 하나씩 (seed 단계에서 모두 넣음)
+  → 처리한 워커가 공고마다 상세 작업을 추가 (공고 키가 같으면 한 번만, 키워드/출처 간 ID 중복 제거)
+  → 마지막 페이지면 같은 키워드×출처의 뒤 페이지 작업 취소
+- 상세 작업: 공고 하나의 상세 요청 + 경력/학력/연봉 추출 → 공유 JobStore에 upsert (같은 실행 run_id)
+- 재시도: 요청 실패는 작업 실패로 돌려 큐가 지수 백오프 후 다른 워커에 다시 배정, 워커가 죽으면 임대 만료 후 재배정
+  출처 차단기가 열려 있으면 요청하지 않고 차단기가 닫힐 때까지 미룸 (시도 횟수에 넣지 않음, 실패 재시도도 그 뒤로)
+  처리 중인 작업은 임대를 주기적으로 연장 (느린 요청이 임대 시간을 넘겨 두 번 처리되지 않도록)
+  끝내 실패한 상세 작업은 마감 때 목록 정보만으로 저장
+  목록 작업은 상세 작업 추가가, 상세 작업은 upsert가 멱등이라 같은 작업이 두 번 처리돼도 결과는 같음
+- 워커마다 자기 FetchEngine(출처별 동시성/요청 간격/차단기)을 쓰므로 노드를 늘리면 IP당 요청 제한도 나눠 가짐
+
+큐/DB는 SQLite 파일이라 같은 머신의 여러 프로세스, 또는 파일 잠금이 동작하는 공유 볼륨의 여러 노드에서 사용
+(유사 공고 중복 제거(dedup.py)와 seen_index 증분 수집은 단일 프로세스 파이프라인에서만 사용)
+
+사용법:
+    python distributed_crawl.py run --processes 4 [--keywords 데이터 엔지니어] [--pages 3]   # 로컬 워커 N개로 한 번에 실행
+    python distributed_crawl.py seed --queue crawl_queue.sqlite --db jobs.sqlite [--keywords ...]
+    python distributed_crawl.py worker --queue crawl_queue.sqlite --db jobs.sqlite   # 노드마다 실행
+    python distributed_crawl.py finish --queue crawl_queue.sqlite --db jobs.sqlite   # 큐가 비면 실행 마감
+    python distributed_crawl.py status --queue crawl_queue.sqlite
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from crawler_detailed import DEFAULT_KEYWORDS, DetailedJobCrawler
+from job_store import JobStore, job_key
+from pipeline import SOURCES
+from work_queue import Task, WorkQueue
+
+DEFAULT_QUEUE = 'crawl_queue.sqlite'
+
+
+def seed(queue: WorkQueue, store: JobStore, keywords: List[str], sources=SOURCES, pages: int = 3,
+         wanted_limit: int = 200, base_url: Optional[str] = None) -> int:
+    """목록 작업 추가 → 이번 실행 run_id (마감하지 않은 실행이 큐에 있으면 이어서 사용)"""
+    meta = queue.meta()
+    if meta.get('run_id') and not meta.get('finished'):
+        run_id = meta['run_id']
+        base_url = meta.get('base_url')
+        print(f"♻️  진행 중인 실행 이어서: run {run_id}")
+    else:
+        queue.clear()
+        run_id = store.start_run(label=f"distributed_{datetime.now():%Y%m%d_%H%M%S}")
+        queue.set_meta(run_id=run_id, base_url=base_url, finished=False)
+
+    crawler = DetailedJobCrawler()  # 어댑터의 목록 URL만 사용
+    if base_url:
+        crawler.engine.set_base_url(base_url)
+    added = 0
+    for keyword in keywords:
+        for source in sources:
+            group = f"{source}:{keyword}"
+            urls = crawler.adapters[source].list_urls(keyword, pages, wanted_limit)
+            added += queue.enqueue_many('list', [
+                (f"list:{url}", {'source': source, 'keyword': keyword, 'url': url}, group, page)
+                for page, url in enumerate(urls, 1)
+            ])
+    crawler.session.close()
+    print(f"🌱 목록 작업 {added}개 추가 (키워드 {len(keywords)}개 × 출처 {len(sources)}개, run {run_id})")
+    return run_id
+
+
+# ----------------------------------------------------------------------
+# 워커
+# ----------------------------------------------------------------------
+
+class SourcePaused(Exception):
+    """출처 차단기가 열려 요청하지 않은 작업 - delay초 뒤로 미룸"""
+
+    def __init__(self, delay: float):
+        super().__init__(f"차단기 열림 ({delay:.0f}초)")
+        self.delay = delay
+
+
+def _breaker_wait(crawler: DetailedJobCrawler, task: Task) -> float:
+    """작업 출처의 차단기가 다시 요청을 허용할 때까지 남은 초"""
+    source = task.payload['source'] if task.kind == 'list' else task.payload['job'].get('source')
+    breaker = crawler.engine.breakers.get(source)
+    return breaker.remaining() if breaker else 0.0
+
+
+def _process(crawler: DetailedJobCrawler, task: Task):
+    """작업 하나 처리 (네트워크/파싱만, 큐/DB 쓰기는 호출한 스레드에서) → 목록 결과 또는 상세를 채운 공고"""
+    delay = _breaker_wait(crawler, task)
+    if delay:
+        raise SourcePaused(delay)
+    if task.kind == 'list':
+        adapter = crawler.adapters[task.payload['source']]
+        result = crawler.engine._list_page(adapter, task.payload['url'])
+        if result is None:
+            raise RuntimeError("목록 요청 실패")
+        return result
+
+    job = task.payload['job']
+    crawler.engine.fetch_detail(job, on_detail=crawler.add_requirements, requeue=False)
+    if job.get('error'):
+        raise RuntimeError(job['error'])
+    qual_text = f"{job.get('qualifications', '')} {job.get('preferred', '')}"
+    job['qualification_tech_stack'] = crawler.extract_tech_stack(qual_text)
+    return job
+
+
+def run_worker(queue_path: str, db_path: str, worker_id: Optional[str] = None, batch: Optional[int] = None,
+               poll: float = 1.0, **crawler_options) -> Counter:
+    """큐가 빌 때까지 작업을 임대해서 처리 → 처리 결과 집계"""
+    queue = WorkQueue(queue_path)
+    meta = queue.meta()
+    if not meta.get('run_id'):
+        raise SystemExit("큐에 실행 정보가 없음 - 먼저 seed 실행")
+    crawler = DetailedJobCrawler(**crawler_options)
+    if meta.get('base_url'):
+        crawler.engine.set_base_url(meta['base_url'])
+    store = JobStore(db_path, extract_tech_stack=crawler.extract_tech_stack)
+    owner = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    batch = batch or crawler.max_workers * 2
+    renew_every = queue.visibility_timeout / 3
+    counts = Counter()
+
+    print(f"👷 워커 {owner} 시작 (run {meta['run_id']}, 배치 {batch})")
+    try:
+        with ThreadPoolExecutor(max_workers=crawler.max_workers) as executor:
+            while True:
+                tasks = queue.lease(owner, limit=batch)
+                if not tasks:
+                    if queue.is_drained():
+                        break
+                    time.sleep(poll)  # 다른 워커가 임대 중인 작업이 끝나거나 만료될 때까지 대기
+                    continue
+
+                futures = {executor.submit(_process, crawler, task): task for task in tasks}
+                pending = set(futures)
+                detailed = []
+                extended = time.monotonic()
+                while pending:
+                    done, pending = wait(pending, timeout=renew_every, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        task = futures[future]
+                        try:
+                            result = future.result()
+                        except SourcePaused as e:
+                            queue.release(task, owner, e.delay)
+                            counts[f"{task.kind}_deferred"] += 1
+                            continue
+                        except Exception as e:
+                            status = queue.fail(task, owner, str(e), min_delay=_breaker_wait(crawler, task))
+                            counts[f"{task.kind}_{status or 'lost'}"] += 1
+                            continue
+                        if task.kind == 'list':
+                            _finish_list(queue, owner, task, result, counts)
+                        else:
+                            detailed.append((task, result))
+
+                    # 아직 처리 중이거나 upsert를 기다리는 작업의 임대 연장
+                    if pending and time.monotonic() - extended >= renew_every:
+                        for task in [futures[future] for future in pending] + [task for task, _ in detailed]:
+                            queue.extend(task, owner)
+                        extended = time.monotonic()
+
+                # 상세 결과는 배치로 upsert 후 완료 처리 (upsert 전에 죽으면 임대 만료 후 재처리)
+                if detailed:
+                    store.upsert_jobs([job for _, job in detailed], meta['run_id'])
+                    for task, _ in detailed:
+                        counts['detail_done' if queue.complete(task, owner) else 'detail_lost'] += 1
+                print(f"  [{owner}] 목록 {counts['list_done']}개 / 상세 {counts['detail_done']}개 완료"
+                      f" (재시도 예약 {counts['list_pending'] + counts['detail_pending']}개,"
+                      f" 차단기로 미룸 {counts['list_deferred'] + counts['detail_deferred']}개)")
+    finally:
+        store.close()
+        queue.close()
+        crawler.session.close()
+    return counts
+
+
+def _finish_list(queue: WorkQueue, owner: str, task: Task, result, counts: Counter):
+    page_jobs, item_count, last = result
+    details = []
+    for job in page_jobs:
+        job['keyword'] = task.payload['keyword']
+        details.append((f"detail:{job_key(job)}", {'job': job}, None, 0))
+    counts['detail_added'] += queue.enqueue_many('detail', details)
+    if last:
+        counts['list_skipped'] += queue.cancel_after(task.grp, task.seq)
+    counts['list_done' if queue.complete(task, owner) else 'list_lost'] += 1
+
+
+# ----------------------------------------------------------------------
+# 마감 / 상태
+# ----------------------------------------------------------------------
+
+def print_status(queue: WorkQueue):
+    for kind, counts in sorted(queue.counts().items()):
+        print(f"  {kind:6} | " + ' / '.join(f"{status} {count}" for status, count in sorted(counts.items())))
+    for kind, key, attempts, error in queue.failures():
+        print(f"  ❌ {key} ({attempts}회): {error}")
+
+
+def finish(queue: WorkQueue, store: JobStore, output_dir: str = '.') -> Optional[Dict]:
+    """큐가 비었으면 실행 마감 + 검색 인덱스 갱신 → 분석 결과 (아직 남은 작업이 있으면 None)"""
+    meta = queue.meta()
+    if not queue.is_drained():
+        print("⏳ 아직 처리 중인 작업이 있음")
+        print_status(queue)
+        return None
+    run_id = meta['run_id']
+    if not meta.get('finished'):
+        # 상세를 끝내 못 받은 공고도 목록 정보로 저장 (공고 자체를 잃지 않도록)
+        failed = [payload['job'] for payload in queue.failed_payloads('detail')]
+        if failed:
+            store.upsert_jobs(failed, run_id)
+            print(f"⚠️  상세 실패 {len(failed)}개는 목록 정보만 저장")
+        store.finish_run(run_id)
+        queue.set_meta(finished=True)
+
+    from search_index import SearchIndex
+    search_index = SearchIndex(os.path.join(output_dir, 'search_index.sqlite'))
+    counts = search_index.sync(store)
+    search_index.close()
+
+    print(f"\n🏁 run {run_id} 마감")
+    print_status(queue)
+    print(f"🔎 검색 인덱스: 추가 {counts['added']}개 / 변경 {counts['updated']}개")
+    result = store.aggregate(run_id)
+    DetailedJobCrawler.print_analysis(result)
+    return result
+
+
+def run_local(args) -> Optional[Dict]:
+    """seed → 로컬 워커 프로세스 N개 → finish"""
+    queue, store = WorkQueue(args.queue), JobStore(args.db)
+    seed(queue, store, args.keywords, args.sources, args.pages, args.wanted_limit, args.base_url)
+
+    start = time.perf_counter()
+    worker_args = ['--queue', args.queue, '--db', args.db, '--workers', str(args.workers),
+                   '--per-host', str(args.per_host), '--min-interval', str(args.min_interval)]
+    procs = [subprocess.Popen([sys.executable, os.path.abspath(__file__), 'worker', '--id', f"local-{i}",
+                               *worker_args]) for i in range(args.processes)]
+    codes = [proc.wait() for proc in procs]
+    print(f"\n⏱  워커 {args.processes}개 완료 ({time.perf_counter() - start:.1f}초, 종료 코드 {codes})")
+
+    result = finish(queue, store, os.path.dirname(os.path.abspath(args.db)))
+    queue.close()
+    store.close()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='분산 크롤링 (SQLite 작업 큐 + 여러 워커)')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    def common(p, crawl_options=False):
+        p.add_argument('--queue', default=DEFAULT_QUEUE, help=f'작업 큐 경로 (기본: {DEFAULT_QUEUE})')
+        p.add_argument('--db', default='jobs.sqlite', help='결과 JobStore DB 경로 (기본: jobs.sqlite)')
+        if crawl_options:
+            p.add_argument('--workers', type=int, default=8, help='워커 프로세스당 동시 요청 수')
+            p.add_argument('--per-host', type=int, default=4, help='워커 프로세스당 출처별 동시 요청 수')
+            p.add_argument('--min-interval', type=float, default=0.1, help='출처별 요청 시작 간격(초)')
+
+    def seed_options(p):
+        p.add_argument('--keywords', nargs='+', default=DEFAULT_KEYWORDS)
+        p.add_argument('--sources', nargs='+', choices=SOURCES, default=list(SOURCES))
+        p.add_argument('--pages', type=int, default=3, help='사람인/잡코리아 페이지 수')
+        p.add_argument('--wanted-limit', type=int, default=200, help='원티드 키워드당 공고 수')
+        p.add_argument('--base-url', help='모든 출처를 이 주소로 요청 (로컬 재생 서버)')
+
+    run_parser = sub.add_parser('run', help='로컬 워커 프로세스 N개로 seed → 처리 → 마감')
+    common(run_parser, crawl_options=True)
+    seed_options(run_parser)
+    run_parser.add_argument('--processes', type=int, default=4, help='워커 프로세스 수')
+    seed_parser = sub.add_parser('seed', help='목록 작업 추가')
+    common(seed_parser)
+    seed_options(seed_parser)
+    worker_parser = sub.add_parser('worker', help='큐가 빌 때까지 작업 처리')
+    common(worker_parser, crawl_options=True)
+    worker_parser.add_argument('--id', help='워커 이름 (기본: 호스트:PID)')
+    finish_parser = sub.add_parser('finish', help='큐가 비었으면 실행 마감 + 검색 인덱스 갱신')
+    common(finish_parser)
+    status_parser = sub.add_parser('status', help='작업 상태')
+    common(status_parser)
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        run_local(args)
+    elif args.command == 'worker':
+        counts = run_worker(args.queue, args.db, worker_id=args.id, max_workers=args.workers,
+                            per_host=args.per_host, min_interval=args.min_interval)
+        print(f"👋 워커 종료: {dict(counts)}")
+    elif args.command == 'seed':
+        queue, store = WorkQueue(args.queue), JobStore(args.db)
+        seed(queue, store, args.keywords, args.sources, args.pages, args.wanted_limit, args.base_url)
+        queue.close()
+        store.close()
+    elif args.command == 'finish':
+        queue, store = WorkQueue(args.queue), JobStore(args.db)
+        finish(queue, store, os.path.dirname(os.path.abspath(args.db)))
+        queue.close()
+        store.close()
+    elif args.command == 'status':
+        queue = WorkQueue(args.queue)
+        print_status(queue)
+        queue.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,465 @@
+"""
+공통 수집 엔진 - 모든 사이트 어댑터(sources.py)가 같이 쓰는 요청/재시도/동시성 처리
+
+- 커넥션 풀: 세션 하나에 워커 수만큼 커넥션을 유지해 사이트별 연결 재사용
+- 출처별 동시성(AIMD): 동시 요청 한도를 성공마다 조금씩(+1/한도) 늘리고 429/503이면 절반으로 줄임
+  (최대치는 어댑터 설정 또는 엔진 기본값, Retry-After가 오면 그 시간 동안 해당 출처 요청을 멈춤)
+- 재시도: 연결 오류/타임아웃/429/5xx는 지수 백오프 + full jitter로 재시도
+  (대기 시간 = 0 ~ backoff × 2^(시도-1) 사이 난수, 여러 워커가 같은 순간에 다시 몰리지 않도록)
+- 차단기: 출처별로 연속 실패가 threshold번이면 cooldown 동안 요청 중단 (장애 중인 출처에 요청을 쌓지 않음)
+  cooldown이 지나면 요청 하나로 확인, 성공하면 복구 / 실패하면 cooldown을 두 배로 늘려 다시 중단
+- 재시도 큐: 상세 요청이 실패하거나 차단기 때문에 건너뛴 공고는 큐에 넣고 실행 끝에 drain_retries로 다시 요청
+- 목록: 어댑터가 정한 개수(list_window)씩 페이지를 동시에 요청, 결과는 페이지 순서대로 처리
+  (마지막 페이지 또는 seen_index 기준 이미 본 페이지에서 중단, 차단기가 열려 있으면 닫힐 때까지 대기)
+  끝까지 훑었는지 seen_index에 알려 중간에 멈춘 출처의 공고는 마감 처리하지 않도록 함
+- 상세: 스레드 풀로 병렬 요청, 공고 dict를 제자리에서 갱신하고 입력 순서 유지
+- 지표: 요청마다 출처별 지연/상태/바이트, 단계별(목록·상세 요청, 파싱, 추출) 시간을 metrics(CrawlMetrics)에 기록
+"""
+
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from crawl_metrics import CrawlMetrics
+from sources import SourceAdapter
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+THROTTLE_STATUSES = {429, 503}   # 동시 요청 한도를 줄이는 응답
+MAX_RETRY_AFTER = 120            # Retry-After 상한(초)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜) → 대기 초 (없거나 잘못된 값이면 None)"""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+class SourceThrottle:
+    """출처별 동시 요청 수(AIMD로 조절) 및 최소 요청 간격 제한 (스레드 안전)"""
+
+    def __init__(self, max_concurrent: int = 4, min_interval: float = 0.1, decrease_gap: float = 1.0):
+        self.max_concurrent = max_concurrent
+        self.min_interval = min_interval
+        self.decrease_gap = decrease_gap  # 한 번 줄인 뒤 이 시간 안의 429/503은 같은 혼잡으로 보고 다시 줄이지 않음
+        self._limits = {}
+        self._cond = threading.Condition()
+        self._state = {}
+        self._next_slot = {}
+
+    def configure(self, key: str, max_concurrent: Optional[int] = None, min_interval: Optional[float] = None):
+        """출처별 제한 (None이면 기본값)"""
+        self._limits[key] = (max_concurrent or self.max_concurrent,
+                             self.min_interval if min_interval is None else min_interval)
+
+    def _source(self, key: str) -> Dict:
+        """출처 상태 (_cond를 잡은 상태에서 호출)"""
+        if key not in self._state:
+            ceiling = self._limits.get(key, (self.max_concurrent,))[0]
+            self._state[key] = {'limit': float(ceiling), 'ceiling': ceiling, 'active': 0,
+                                'paused_until': 0.0, 'decreased_at': 0.0}
+        return self._state[key]
+
+    def limit(self, key: str) -> int:
+        with self._cond:
+            return int(self._source(key)['limit'])
+
+    def _acquire(self, key: str):
+        with self._cond:
+            state = self._source(key)
+            while True:
+                wait = state['paused_until'] - time.monotonic()
+                if wait <= 0 and state['active'] < int(state['limit']):
+                    state['active'] += 1
+                    return
+                self._cond.wait(timeout=wait if wait > 0 else None)
+
+    def _release(self, key: str):
+        with self._cond:
+            self._source(key)['active'] -= 1
+            self._cond.notify_all()
+
+    def _wait_turn(self, key: str):
+        """같은 출처의 요청 시작 시각이 min_interval 이상 벌어지도록 대기"""
+        interval = self._limits.get(key, (None, self.min_interval))[1]
+        with self._cond:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(key, now))
+            self._next_slot[key] = slot + interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def run(self, key: str, func, *args, **kwargs):
+        """key 출처의 제한 안에서 func 실행"""
+        self._acquire(key)
+        try:
+            self._wait_turn(key)
+            return func(*args, **kwargs)
+        finally:
+            self._release(key)
+
+    def on_success(self, key: str):
+        """가산 증가 - 한도만큼 성공하면 한도 +1 (최대치까지)"""
+        with self._cond:
+            state = self._source(key)
+            if state['limit'] < state['ceiling']:
+                state['limit'] = min(state['ceiling'], state['limit'] + 1 / state['limit'])
+                self._cond.notify_all()
+
+    def on_throttled(self, key: str, retry_after: Optional[float] = None):
+        """승산 감소 - 한도 절반 (최소 1), Retry-After가 있으면 그동안 출처 전체 정지"""
+        with self._cond:
+            state = self._source(key)
+            now = time.monotonic()
+            if now - state['decreased_at'] >= self.decrease_gap:
+                state['limit'] = max(1.0, state['limit'] / 2)
+                state['decreased_at'] = now
+            if retry_after:
+                state['paused_until'] = max(state['paused_until'], now + retry_after)
+
+
+class CircuitBreaker:
+    """출처 하나의 차단기 - closed(정상) → open(요청 중단) → half_open(요청 하나로 확인)"""
+
+    def __init__(self, threshold: int = 5, cooldown: float = 30.0, max_cooldown: float = 300.0):
+        self.threshold = threshold
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.cooldown = cooldown
+        self.state = 'closed'
+        self.failures = 0
+        self.open_until = 0.0
+        self.opened = 0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """지금 요청해도 되는지 (open이 끝났으면 확인 요청 하나만 허용)"""
+        with self._lock:
+            if self.state == 'closed':
+                return True
+            if self.state == 'open' and time.monotonic() >= self.open_until:
+                self.state = 'half_open'
+                return True
+            return False
+
+    def remaining(self) -> float:
+        """다시 요청을 시도할 수 있을 때까지 남은 초 (확인 요청 진행 중이면 짧게)"""
+        with self._lock:
+            if self.state == 'open':
+                return max(0.0, self.open_until - time.monotonic())
+            return 0.0 if self.state == 'closed' else 0.1
+
+    def record_success(self):
+        with self._lock:
+            self.state = 'closed'
+            self.failures = 0
+            self.cooldown = self.base_cooldown
+
+    def record_failure(self) -> bool:
+        """실패 기록 → 이번 실패로 차단기가 열렸으면 True"""
+        with self._lock:
+            self.failures += 1
+            if self.state == 'half_open':
+                self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+            elif self.state == 'open' or self.failures < self.threshold:
+                return False
+            self.state = 'open'
+            self.open_until = time.monotonic() + self.cooldown
+            self.opened += 1
+            return True
+
+
+class FetchEngine:
+    def __init__(self, session: requests.Session, adapters: Dict[str, SourceAdapter], max_workers: int = 8,
+                 per_source: int = 4, min_interval: float = 0.1, max_retries: int = 2, backoff: float = 0.5,
+                 timeout: float = 10, metrics: Optional[CrawlMetrics] = None,
+                 breaker_threshold: int = 5, breaker_cooldown: float = 30.0):
+        self.session = session
+        self.adapters = adapters
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.stats = Counter()
+        self.metrics = metrics or CrawlMetrics()
+
+        # 출처 수만큼 호스트 풀, 호스트마다 워커 수만큼 커넥션 재사용
+        pool = HTTPAdapter(pool_connections=max(len(adapters), 1), pool_maxsize=max_workers)
+        self.session.mount('https://', pool)
+        self.session.mount('http://', pool)
+
+        self.throttle = SourceThrottle(max_concurrent=per_source, min_interval=min_interval)
+        for adapter in adapters.values():
+            self.throttle.configure(adapter.name, adapter.concurrency, adapter.min_interval)
+        self.breakers = {name: CircuitBreaker(breaker_threshold, breaker_cooldown) for name in adapters}
+
+        # 실행 끝에 다시 요청할 상세 (공고, on_detail)
+        self.retry_queue = []
+        self._queued = set()
+        self._queue_lock = threading.Lock()
+
+    def adapter_for(self, job: Dict) -> Optional[SourceAdapter]:
+        return self.adapters.get(job.get('source'))
+
+    def set_base_url(self, base_url: str, sources: Optional[List[str]] = None):
+        """어댑터 요청 주소 변경 (로컬 스텁 서버 벤치마크용)"""
+        for name, adapter in self.adapters.items():
+            if sources is None or name in sources:
+                adapter.base_url = base_url
+
+    # ------------------------------------------------------------------
+    # 요청
+    # ------------------------------------------------------------------
+
+    def _get(self, adapter: SourceAdapter, url: str) -> requests.Response:
+        """GET 한 번 + 지표 기록 (캐시에서 꺼낸 응답은 받은 바이트에 넣지 않음)"""
+        start = time.perf_counter()
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+        except requests.RequestException:
+            self.metrics.observe_request(adapter.name, time.perf_counter() - start, 'error')
+            raise
+        nbytes = 0 if getattr(response, 'from_cache', False) else len(response.content)
+        self.metrics.observe_request(adapter.name, time.perf_counter() - start, response.status_code, nbytes)
+        return response
+
+    def _failed(self, adapter: SourceAdapter):
+        if self.breakers[adapter.name].record_failure():
+            self.stats['breaker_opened'] += 1
+            breaker = self.breakers[adapter.name]
+            print(f"  [{adapter.name}] 연속 실패 {breaker.failures}회 → {breaker.cooldown:.0f}초 동안 요청 중단")
+
+    def fetch(self, adapter: SourceAdapter, url: str, as_json: bool = False, wait: bool = False):
+        """출처 제한 안에서 GET, 일시적 오류는 재시도 → 본문(str 또는 JSON), 실패 시 None
+
+        차단기가 열려 있으면 wait=True는 닫힐 때까지 기다리고, False는 요청 없이 None 반환
+        """
+        breaker = self.breakers[adapter.name]
+        error, retry_after = '', None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.stats['retries'] += 1
+                # Retry-After를 받았으면 throttle이 그 시간만큼 출처 전체를 멈추므로 백오프 생략
+                if not retry_after:
+                    time.sleep(random.uniform(0, self.backoff * 2 ** (attempt - 1)))
+            while not breaker.allow():
+                if not wait:
+                    self.stats['short_circuited'] += 1
+                    return None
+                time.sleep(breaker.remaining() or 0.1)
+            self.stats['requests'] += 1
+            retry_after = None
+            # 어떤 경로로 나가든 차단기에 결과를 기록 (half_open 확인 요청이 결과 없이 끝나면 영영 갇힘)
+            reached = False
+            try:
+                response = self.throttle.run(adapter.name, self._get, adapter, url)
+                status = response.status_code
+                # 서버가 응답한 요청 (200, 404 등 4xx 포함)은 출처 정상, 재시도 대상 응답(429/5xx)만 실패
+                reached = status not in RETRY_STATUSES
+                if status == 200:
+                    self.throttle.on_success(adapter.name)
+                    return response.json() if as_json else response.text
+
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                if status in THROTTLE_STATUSES:
+                    self.stats['throttled'] += 1
+                # 5xx라도 Retry-After가 있으면 throttle로 출처를 멈춤 (다음 시도는 백오프 대신 이 정지를 기다림)
+                if status in THROTTLE_STATUSES or (retry_after and not reached):
+                    self.throttle.on_throttled(adapter.name, retry_after)
+                error = f"Retry-After {retry_after:.0f}초 ({status})" if retry_after else f"응답 오류 ({status})"
+                if reached:
+                    break
+            except requests.RequestException as e:
+                error = f"요청 오류 - {e}"
+            finally:
+                if reached:
+                    breaker.record_success()
+                else:
+                    self._failed(adapter)
+
+        self.stats['errors'] += 1
+        print(f"  [{adapter.name}] {error}: {url}")
+        return None
+
+    # ------------------------------------------------------------------
+    # 목록 / 상세
+    # ------------------------------------------------------------------
+
+    def _list_page(self, adapter: SourceAdapter, url: str):
+        """목록 페이지 하나 요청 + 파싱 → (공고 목록, 항목 수, 마지막 페이지 여부), 실패 시 None"""
+        with self.metrics.stage('list_fetch'):
+            body = self.fetch(adapter, url, as_json=adapter.list_format == 'json', wait=True)
+        if body is None:
+            return None
+        with self.metrics.stage('parse'):
+            page_jobs, item_count = adapter.parse_list(body)
+        return page_jobs, item_count, adapter.is_last_page(body, item_count)
+
+    def crawl_list(self, adapter: SourceAdapter, keyword: str, pages: int = 1, limit: int = 50,
+                   seen_index=None) -> List[Dict]:
+        """검색 목록 수집 - 어댑터의 list_window개씩 동시에 요청하고 페이지 순서대로 처리
+
+        마지막 페이지이거나 seen_index 기준 모두 이미 본 공고인 페이지에서 중단 (같은 묶음의 뒤 페이지는 버림)
+        seen_index의 전체 확인 주기가 된 출처는 이미 본 페이지에서도 멈추지 않고 요청한 페이지를 모두 수집
+        """
+        print(f"\n[{adapter.name}] '{keyword}' 목록 수집 중...")
+        jobs = []
+        urls = adapter.list_urls(keyword, pages, limit)
+        window = max(1, min(adapter.list_window, self.max_workers))
+        early_stop = seen_index is not None and seen_index.allows_early_stop(adapter.key)
+        if seen_index is not None and not early_stop:
+            print("  전체 확인 주기 → 이미 본 페이지에서도 계속 수집")
+        complete = True  # 실패한 페이지 없이 마지막(또는 요청한 마지막) 페이지까지 수집했는지
+
+        with ThreadPoolExecutor(max_workers=window) as executor:
+            for start in range(0, len(urls), window):
+                futures = [executor.submit(self._list_page, adapter, url) for url in urls[start:start + window]]
+                stop = False
+                for page, future in enumerate(futures, start + 1):
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        print(f"  페이지 {page}: 오류 - {e}")
+                        complete = False
+                        continue
+                    if result is None:
+                        complete = False
+                        continue
+                    page_jobs, item_count, last = result
+                    jobs.extend(page_jobs)
+                    print(f"  페이지 {page}: {item_count}개")
+                    if last:
+                        stop = True
+                    elif early_stop and seen_index.is_page_known(page_jobs):
+                        print(f"  페이지 {page}: 모두 이미 수집한 공고 → 이후 페이지 생략")
+                        stop = True
+                        complete = False
+                    if stop:
+                        break
+                if stop:
+                    break
+
+        if seen_index is not None:
+            seen_index.mark_scanned(adapter.key, complete)
+        print(f"[{adapter.name}] 목록 {len(jobs)}개 수집 완료")
+        return jobs
+
+    def fetch_detail(self, job: Dict, on_detail: Optional[Callable[[Dict], Dict]] = None,
+                     requeue: bool = True) -> Dict:
+        """공고 하나의 상세 수집 (job 제자리 갱신), 성공하면 on_detail(job) 호출
+
+        요청이 실패하면(차단기로 건너뛴 경우 포함) requeue=True일 때 재시도 큐에 넣음
+        """
+        adapter = self.adapter_for(job)
+        url = adapter.detail_url(job) if adapter else None
+        if not url:
+            return job
+        try:
+            with self.metrics.stage('detail_fetch'):
+                body = self.fetch(adapter, url, as_json=adapter.detail_format == 'json')
+            if body is None:
+                if requeue:
+                    self._enqueue(job, on_detail)
+                else:
+                    job['error'] = '상세 요청 실패'
+                return job
+            job.pop('error', None)
+            with self.metrics.stage('parse'):
+                job.update(adapter.parse_detail(body))
+            if on_detail:
+                with self.metrics.stage('extract'):
+                    on_detail(job)
+        except Exception as e:
+            job['error'] = str(e)
+        return job
+
+    def fetch_details(self, jobs: List[Dict], on_detail: Optional[Callable[[Dict], Dict]] = None,
+                      label: str = '', requeue: bool = True) -> List[Dict]:
+        """상세 정보 병렬 수집 (입력 순서 유지, 출처별 요청 제한 적용)"""
+        total = len(jobs)
+        if not total:
+            return jobs
+
+        done = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self.fetch_detail, job, on_detail, requeue) for job in jobs]
+            for future in as_completed(futures):
+                future.result()
+                done += 1
+                if done % 10 == 0 or done == total:
+                    print(f"  {label}{done}/{total} 완료")
+
+        # fetch_detail은 job을 제자리에서 갱신하므로 입력 순서 그대로 반환
+        return jobs
+
+    # ------------------------------------------------------------------
+    # 재시도 큐
+    # ------------------------------------------------------------------
+
+    def _enqueue(self, job: Dict, on_detail: Optional[Callable[[Dict], Dict]]):
+        with self._queue_lock:
+            if id(job) not in self._queued:
+                self._queued.add(id(job))
+                self.retry_queue.append((job, on_detail))
+                self.stats['queued'] += 1
+
+    def queued_jobs(self) -> List[Dict]:
+        """재시도 큐에서 기다리는 공고 목록 (체크포인트 저장용)"""
+        with self._queue_lock:
+            return [job for job, _ in self.retry_queue]
+
+    def requeue(self, jobs: List[Dict], on_detail: Optional[Callable[[Dict], Dict]] = None):
+        """재시도 큐에 다시 넣기 (중단된 실행의 체크포인트에서 복원)"""
+        for job in jobs:
+            self._enqueue(job, on_detail)
+
+    def is_queued(self, job: Dict) -> bool:
+        """상세 요청이 실패해 재시도 큐에서 기다리는 공고인지"""
+        return id(job) in self._queued
+
+    def drain_retries(self, label: str = '재시도 ') -> List[Dict]:
+        """재시도 큐의 상세를 다시 요청 (열린 차단기는 닫힐 때까지 기다림, 이번엔 실패해도 다시 넣지 않음)
+
+        → 다시 요청한 공고 목록 (끝내 실패한 공고에는 job['error'])
+        """
+        with self._queue_lock:
+            queue, self.retry_queue = self.retry_queue, []
+            self._queued.clear()
+        if not queue:
+            return []
+
+        print(f"\n🔁 실패한 상세 {len(queue)}개 재시도")
+        for name in sorted({job['source'] for job, _ in queue}):
+            wait = self.breakers[name].remaining()
+            if wait:
+                print(f"  [{name}] 차단기 복구 대기 {wait:.0f}초")
+                time.sleep(wait)
+
+        by_callback = {}
+        for job, on_detail in queue:
+            by_callback.setdefault(on_detail, []).append(job)
+        for on_detail, jobs in by_callback.items():
+            self.fetch_details(jobs, on_detail, label=label, requeue=False)
+
+        jobs = [job for job, _ in queue]
+        failed = Counter(job['source'] for job in jobs if job.get('error'))
+        self.stats['retry_recovered'] += len(jobs) - sum(failed.values())
+        if failed:
+            print(f"  ⚠️  끝내 실패한 상세: {', '.join(f'{name} {count}개' for name, count in sorted(failed.items()))}")
+        print(f"  ✅ 재시도 복구 {len(jobs) - sum(failed.values())}/{len(jobs)}개")
+        return jobs
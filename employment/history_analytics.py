@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+수집 이력 분석 - 저장된 모든 실행의 공고를 공고×기술 불리언 행렬로 만들어 벡터 연산으로 집계
+
+- 기술 빈도 추이: 주(또는 실행)별 공고 중 기술 언급 비율
+- 동시 등장 행렬: Mᵀ·M (같이 요구되는 기술 쌍)
+- 회사별 기술스택: 회사 코드별 행렬 합
+- 전주 대비 변화: 주별 비율의 차이
+
+공고 단위 파이썬 루프 없이 pandas factorize + NumPy 인덱싱/행렬곱으로 처리
+입력: JobStore(jobs.sqlite) 또는 job_record Parquet 이력 파일
+
+사용법:
+    python history_analytics.py [--db jobs.sqlite] [--top 15]
+    python history_analytics.py --parquet jobs_*.parquet
+"""
+
+import argparse
+import sqlite3
+import time
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class HistoryAnalytics:
+    """postings(공고 행) / sightings(공고가 보인 시각) / techs(공고별 기술) 세 프레임으로 구성"""
+
+    def __init__(self, postings: pd.DataFrame, sightings: pd.DataFrame, techs: pd.DataFrame):
+        """
+        postings : job_key, company
+        sightings: job_key, seen_at (datetime)
+        techs    : job_key, tech
+        """
+        job_codes, self.job_keys = pd.factorize(postings['job_key'])
+        self.companies = postings['company'].fillna('').to_numpy()
+
+        techs = techs[techs['job_key'].isin(self.job_keys)]
+        tech_codes, self.techs = pd.factorize(techs['tech'], sort=True)
+        job_index = self.job_keys.get_indexer(techs['job_key'])
+
+        # 공고×기술 불리언 행렬
+        self.matrix = np.zeros((len(self.job_keys), len(self.techs)), dtype=bool)
+        self.matrix[job_index, tech_codes] = True
+
+        sightings = sightings[sightings['job_key'].isin(self.job_keys)]
+        self.sighting_jobs = self.job_keys.get_indexer(sightings['job_key'])
+        self.sighting_times = pd.to_datetime(sightings['seen_at']).to_numpy()
+
+    # ------------------------------------------------------------------
+    # 로드
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_store(cls, db_path: str, scope: str = 'detail') -> 'HistoryAnalytics':
+        """JobStore DB의 전체 실행 로드 (scope: 'detail' 상세 전체 / 'qualification' 자격요건)"""
+        conn = sqlite3.connect(db_path)
+        postings = pd.read_sql_query("SELECT job_key, company FROM jobs", conn)
+        sightings = pd.read_sql_query(
+            """SELECT j.job_key, r.started_at AS seen_at
+               FROM job_snapshots s JOIN jobs j USING (job_id) JOIN crawl_runs r USING (run_id)""",
+            conn,
+        )
+        techs = pd.read_sql_query(
+            "SELECT j.job_key, t.tech FROM job_techs t JOIN jobs j USING (job_id) WHERE t.scope = ?",
+            conn, params=(scope,),
+        )
+        conn.close()
+        return cls(postings, sightings, techs)
+
+    @classmethod
+    def from_parquet(cls, paths: List[str]) -> 'HistoryAnalytics':
+        """job_record Parquet 이력 파일들 로드 (공고 키 = 출처:출처ID, 없으면 출처:회사|제목)"""
+        from job_record import read_parquet
+
+        table = read_parquet(paths, columns=['source', 'source_id', 'company', 'title',
+                                             'detail_tech_stack', 'collected_at'])
+        frame = table.to_pandas()
+        source = frame['source'].astype(str)
+        fallback = source + ':' + frame['company'].astype(str) + '|' + frame['title']
+        frame['job_key'] = (source + ':' + frame['source_id']).where(frame['source_id'] != '', fallback)
+
+        postings = frame.drop_duplicates('job_key', keep='last')[['job_key', 'company']]
+        sightings = frame[['job_key', 'collected_at']].rename(columns={'collected_at': 'seen_at'})
+        techs = frame[['job_key', 'detail_tech_stack']].explode('detail_tech_stack').dropna()
+        techs = techs.rename(columns={'detail_tech_stack': 'tech'}).drop_duplicates()
+        return cls(postings, sightings, techs)
+
+    # ------------------------------------------------------------------
+    # 집계
+    # ------------------------------------------------------------------
+
+    def _period_counts(self, freq: str):
+        """기간별 (고유 공고 수, 기간×기술 공고 수) - 같은 기간에 여러 번 보인 공고는 한 번만"""
+        periods = pd.PeriodIndex(self.sighting_times, freq=freq)
+        period_codes, labels = pd.factorize(periods, sort=True)
+
+        # 기간×공고 관측 행렬 (같은 칸에 여러 번 찍혀도 True 한 번 = 중복 제거)
+        seen = np.zeros((len(labels), len(self.job_keys)), dtype=np.float32)
+        seen[period_codes, self.sighting_jobs] = 1
+        totals = seen.sum(axis=1).astype(np.int64)
+        counts = (seen @ self.matrix.astype(np.float32)).round().astype(np.int64)
+        return labels, totals, counts
+
+    def tech_frequency(self) -> pd.Series:
+        """전체 이력 기준 기술별 공고 수 (내림차순)"""
+        return pd.Series(self.matrix.sum(axis=0), index=self.techs).sort_values(ascending=False)
+
+    def tech_trend(self, freq: str = 'W', share: bool = True) -> pd.DataFrame:
+        """기간(행)×기술(열) 공고 수 또는 비율 (freq: 'W' 주, 'D' 일, 'M' 월)"""
+        labels, totals, counts = self._period_counts(freq)
+        values = counts / np.maximum(totals, 1)[:, None] if share else counts
+        frame = pd.DataFrame(values, index=labels.astype(str), columns=self.techs)
+        frame.insert(0, '공고수', totals)
+        return frame
+
+    def week_over_week(self, top: int = 15) -> pd.DataFrame:
+        """최근 두 주의 기술별 언급 비율과 변화 (%p), 변화량 절댓값 순"""
+        trend = self.tech_trend('W').drop(columns='공고수')
+        if len(trend) < 2:
+            return pd.DataFrame(columns=['이전주', '이번주', '변화(%p)'])
+        previous, current = trend.iloc[-2], trend.iloc[-1]
+        frame = pd.DataFrame({
+            '이전주': previous * 100,
+            '이번주': current * 100,
+            '변화(%p)': (current - previous) * 100,
+        })
+        return frame.reindex(frame['변화(%p)'].abs().sort_values(ascending=False).index).head(top)
+
+    def cooccurrence(self, top: Optional[int] = 20) -> pd.DataFrame:
+        """기술 동시 등장 공고 수 (Mᵀ·M, 대각선은 기술별 공고 수) - 빈도 상위 top개 기술만"""
+        m = self.matrix.astype(np.float32)  # float 행렬곱(BLAS)이 정수 행렬곱보다 훨씬 빠름
+        matrix = pd.DataFrame((m.T @ m).round().astype(np.int64), index=self.techs, columns=self.techs)
+        if top:
+            keep = self.tech_frequency().index[:top]
+            matrix = matrix.loc[keep, keep]
+        return matrix
+
+    def top_pairs(self, top: int = 15) -> pd.DataFrame:
+        """가장 많이 같이 요구되는 기술 쌍 (공고 수, Jaccard)"""
+        co = self.cooccurrence(top=None).to_numpy()
+        counts = np.diag(co)
+        upper_i, upper_j = np.triu_indices_from(co, k=1)
+        together = co[upper_i, upper_j]
+        union = counts[upper_i] + counts[upper_j] - together
+        order = np.argsort(-together, kind='stable')[:top]
+        return pd.DataFrame({
+            '기술1': self.techs[upper_i[order]],
+            '기술2': self.techs[upper_j[order]],
+            '공고수': together[order],
+            'jaccard': np.round(together[order] / np.maximum(union[order], 1), 3),
+        })
+
+    def company_stacks(self, min_postings: int = 3, top_techs: int = 5) -> pd.DataFrame:
+        """회사별 공고 수와 가장 많이 요구하는 기술 (공고 min_postings개 이상인 회사)"""
+        company_codes, names = pd.factorize(self.companies)
+        postings = np.bincount(company_codes, minlength=len(names))
+
+        # 회사 코드 순으로 정렬한 뒤 구간 합 (회사별 기술 공고 수)
+        order = np.argsort(company_codes, kind='stable')
+        starts = np.concatenate([[0], np.cumsum(postings)[:-1]])
+        stacks = np.add.reduceat(self.matrix[order].astype(np.int64), starts, axis=0)
+
+        keep = np.flatnonzero((postings >= min_postings) & (names != ''))
+        keep = keep[np.argsort(-postings[keep], kind='stable')]
+        top = np.argsort(-stacks[keep], axis=1, kind='stable')[:, :top_techs]
+        top_counts = np.take_along_axis(stacks[keep], top, axis=1)
+        stacks_text = [
+            ', '.join(f"{self.techs[t]}({c})" for t, c in zip(row, row_counts) if c)
+            for row, row_counts in zip(top, top_counts)
+        ]
+        return pd.DataFrame({'회사': names[keep], '공고수': postings[keep], '주요 기술': stacks_text})
+
+
+def main():
+    parser = argparse.ArgumentParser(description='수집 이력 기술 트렌드 분석')
+    parser.add_argument('--db', default='jobs.sqlite', help='JobStore DB 경로 (기본: jobs.sqlite)')
+    parser.add_argument('--parquet', nargs='+', help='DB 대신 Parquet 이력 파일 사용')
+    parser.add_argument('--scope', default='detail', choices=['detail', 'qualification'])
+    parser.add_argument('--top', type=int, default=15)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.parquet:
+        analytics = HistoryAnalytics.from_parquet(sorted(args.parquet))
+    else:
+        analytics = HistoryAnalytics.from_store(args.db, scope=args.scope)
+    loaded = time.perf_counter()
+
+    trend = analytics.tech_trend('W')
+    frequency = analytics.tech_frequency()
+    wow = analytics.week_over_week(args.top)
+    pairs = analytics.top_pairs(args.top)
+    companies = analytics.company_stacks()
+    elapsed = time.perf_counter() - loaded
+
+    print("=" * 70)
+    print(f"📈 수집 이력 분석: 공고 {len(analytics.job_keys):,}개 × 기술 {len(analytics.techs)}개, "
+          f"관측 {len(analytics.sighting_jobs):,}건")
+    print(f"   로드 {loaded - start:.2f}초 / 집계 {elapsed:.2f}초")
+    print("=" * 70)
+
+    print(f"\n🔧 전체 기간 기술 Top {args.top}:")
+    for tech, count in frequency.head(args.top).items():
+        print(f"   {tech:18} {count:5}개 ({count / max(len(analytics.job_keys), 1) * 100:.1f}%)")
+
+    print(f"\n📅 주별 공고 수 / 상위 기술 비율:")
+    top_techs = list(frequency.index[:5])
+    print((trend[['공고수'] + top_techs].tail(8).round(3)).to_string())
+
+    print(f"\n📊 전주 대비 변화 (언급 비율 %p):")
+    print(wow.round(1).to_string() if len(wow) else "   (2주 이상 이력 필요)")
+
+    print(f"\n🔗 함께 요구되는 기술 쌍:")
+    print(pairs.to_string(index=False))
+
+    print(f"\n🏢 회사별 기술스택 (공고 3개 이상):")
+    print(companies.head(args.top).to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,248 @@
+"""
+HTML 파서 백엔드 - 사람인/잡코리아 목록·상세 페이지에서 필요한 값만 뽑아 단순한 dict/list로 반환
+
+- LxmlParser: lxml.html(C 파서) + 미리 컴파일한 XPath, 기본값
+- Bs4Parser : BeautifulSoup(html.parser), lxml이 없을 때 대체. 상세 페이지는 SoupStrainer로 필요한 영역만 파싱
+
+두 백엔드는 같은 값을 반환하므로 크롤러는 get_parser()로 받은 객체만 사용하면 됨
+텍스트 추출 규칙은 BeautifulSoup get_text(sep, strip=True)와 동일 (각 텍스트 조각 strip 후 빈 조각 제외하고 sep로 연결)
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:  # lxml 미설치 시 bs4만 사용
+    lxml = None
+
+# 상세 페이지에서 실제로 사용하는 영역 (클래스명)
+DETAIL_CLASSES = ['jv_cont', 'jv_detail', 'job_detail', 'wrap_jv_cont', 'salary', 'career', 'education']
+
+# 잡코리아 상세: 요약 표(dt/dd)와 상세요강 본문 (본문은 GI_Read_Comt_Ifrm 프레임 페이지에 있음)
+JOBKOREA_SUMMARY_FIELDS = {'경력': 'career', '학력': 'education', '급여': 'salary'}
+
+# 본문 텍스트에서 섹션 제목으로 볼 줄 ('■ 자격요건', '[우대사항]', '주요업무 :' 등 짧은 줄)
+SECTION_HEADER = re.compile(
+    r'^[\s\W]*(자격\s*요건|지원\s*자격|필수\s*사항|우대\s*사항|우대\s*조건|담당\s*업무|주요\s*업무|업무\s*내용|'
+    r'복리\s*후생|혜택|복지)[\s\W]*$'
+)
+
+
+def _join_text(strings, sep: str) -> str:
+    return sep.join(s for s in (t.strip() for t in strings) if s)
+
+
+def _empty_detail() -> Dict:
+    return {'sections': [], 'salary': '', 'career': '', 'education': '', 'full_description': ''}
+
+
+def split_sections(text: str) -> List[Tuple[str, str]]:
+    """제목 줄 기준으로 본문을 (제목, 내용) 섹션으로 나눔 - 섹션 마크업이 없는 상세요강용"""
+    sections = []
+    header, lines = None, []
+    for line in text.split('\n'):
+        if len(line) <= 20 and SECTION_HEADER.match(line):
+            if header and lines:
+                sections.append((header, '\n'.join(lines)))
+            header, lines = line.strip(' ■□●○•·-:[]<>【】'), []
+        elif header:
+            lines.append(line)
+    if header and lines:
+        sections.append((header, '\n'.join(lines)))
+    return sections
+
+
+def _jobkorea_detail(summary: List[Tuple[str, str]], full_description: str) -> Dict:
+    detail = _empty_detail()
+    for label, value in summary:
+        field = JOBKOREA_SUMMARY_FIELDS.get(label)
+        if field and not detail[field]:
+            detail[field] = value
+    detail['full_description'] = full_description
+    detail['sections'] = split_sections(full_description)
+    return detail
+
+
+class LxmlParser:
+    name = 'lxml'
+
+    @staticmethod
+    def _cls(name: str) -> str:
+        return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+    def __init__(self):
+        cls = self._cls
+        X = etree.XPath
+        # 사람인 목록
+        self._saramin_items = X(f"//*[{cls('item_recruit')}]")
+        self._saramin_title = X(f".//*[{cls('job_tit')}]//a")
+        self._saramin_company = X(f".//*[{cls('corp_name')}]//a")
+        self._saramin_conditions = X(f".//*[{cls('job_condition')}]//span")
+        self._saramin_sector = X(f".//*[{cls('job_sector')}]")
+        # 잡코리아 목록
+        self._jobkorea_items = X(f"//*[{cls('list-default')}]//*[{cls('list-post')}]")
+        self._jobkorea_title = X(f".//*[{cls('post-list-info')}]//a[{cls('title')}]")
+        self._jobkorea_company = X(f".//*[{cls('post-list-corp')}]//a[{cls('name')}]")
+        self._jobkorea_options = X(f".//*[{cls('option')}]//span")
+        # 사람인 상세
+        self._detail_sections = X(f"//*[{cls('jv_cont')}]")
+        self._section_header = X(f"(.//*[{cls('jv_header')} or {cls('tit_cont')}])[1]")
+        self._section_content = X(f"(.//*[{cls('jv_detail')} or {cls('cont')}])[1]")
+        self._salary = X(f"(//*[{cls('salary')}])[1]")
+        self._career = X(f"(//*[{cls('career')}])[1]")
+        self._education = X(f"(//*[{cls('education')}])[1]")
+        self._full_description = X(f"(//*[{cls('jv_detail')} or {cls('job_detail')} or {cls('wrap_jv_cont')}])[1]")
+        # 잡코리아 상세
+        self._jobkorea_terms = X(f"//dl[{cls('tbList')}]/dt")
+        self._jobkorea_body = X(f"(//*[{cls('artReadDetail')} or {cls('detailed-summary-contents')}])[1]")
+        self._body = X("(//body)[1]")
+
+    @staticmethod
+    def _doc(html: str):
+        return lxml.html.fromstring(html) if html.strip() else None
+
+    @staticmethod
+    def _text(elements, sep: str = '') -> str:
+        return _join_text(elements[0].itertext(), sep) if elements else ''
+
+    def saramin_list(self, html: str) -> List[Dict]:
+        doc = self._doc(html)
+        if doc is None:
+            return []
+        items = []
+        for item in self._saramin_items(doc):
+            title = self._saramin_title(item)
+            items.append({
+                'title': self._text(title),
+                'href': title[0].get('href', '') if title else None,
+                'company': self._text(self._saramin_company(item)),
+                'conditions': [_join_text(c.itertext(), '') for c in self._saramin_conditions(item)],
+                'sector': self._text(self._saramin_sector(item)),
+                'raw_text': _join_text(item.itertext(), ' '),
+            })
+        return items
+
+    def jobkorea_list(self, html: str) -> List[Dict]:
+        doc = self._doc(html)
+        if doc is None:
+            return []
+        items = []
+        for item in self._jobkorea_items(doc):
+            title = self._jobkorea_title(item)
+            items.append({
+                'title': self._text(title),
+                'href': title[0].get('href', '') if title else None,
+                'company': self._text(self._jobkorea_company(item)),
+                'conditions': [_join_text(o.itertext(), '') for o in self._jobkorea_options(item)],
+                'sector': '',
+                'raw_text': _join_text(item.itertext(), ' '),
+            })
+        return items
+
+    def saramin_detail(self, html: str) -> Dict:
+        doc = self._doc(html)
+        detail = _empty_detail()
+        if doc is None:
+            return detail
+        for section in self._detail_sections(doc):
+            header = self._section_header(section)
+            content = self._section_content(section)
+            if header and content:
+                detail['sections'].append((self._text(header), self._text(content, '\n')))
+        detail['salary'] = self._text(self._salary(doc))
+        detail['career'] = self._text(self._career(doc))
+        detail['education'] = self._text(self._education(doc))
+        detail['full_description'] = self._text(self._full_description(doc), '\n')
+        return detail
+
+    def jobkorea_detail(self, html: str) -> Dict:
+        doc = self._doc(html)
+        if doc is None:
+            return _empty_detail()
+        summary = []
+        for term in self._jobkorea_terms(doc):
+            value = term.getnext()
+            if value is not None and value.tag == 'dd':
+                summary.append((_join_text(term.itertext(), ''), _join_text(value.itertext(), ' ')))
+        body = self._jobkorea_body(doc) or self._body(doc) or [doc]
+        return _jobkorea_detail(summary, self._text(body, '\n'))
+
+
+class Bs4Parser:
+    name = 'bs4'
+
+    def __init__(self):
+        from bs4 import BeautifulSoup, SoupStrainer
+        self._soup = BeautifulSoup
+        self._detail_strainer = SoupStrainer(class_=DETAIL_CLASSES)
+
+    @staticmethod
+    def _text(elem, sep: str = '') -> str:
+        return elem.get_text(sep, strip=True) if elem else ''
+
+    def saramin_list(self, html: str) -> List[Dict]:
+        soup = self._soup(html, 'html.parser')
+        items = []
+        for item in soup.select('.item_recruit'):
+            title = item.select_one('.job_tit a')
+            items.append({
+                'title': self._text(title),
+                'href': title.get('href', '') if title else None,
+                'company': self._text(item.select_one('.corp_name a')),
+                'conditions': [c.get_text(strip=True) for c in item.select('.job_condition span')],
+                'sector': self._text(item.select_one('.job_sector')),
+                'raw_text': item.get_text(' ', strip=True),
+            })
+        return items
+
+    def jobkorea_list(self, html: str) -> List[Dict]:
+        soup = self._soup(html, 'html.parser')
+        items = []
+        for item in soup.select('.list-default .list-post'):
+            title = item.select_one('.post-list-info a.title')
+            items.append({
+                'title': self._text(title),
+                'href': title.get('href', '') if title else None,
+                'company': self._text(item.select_one('.post-list-corp a.name')),
+                'conditions': [o.get_text(strip=True) for o in item.select('.option span')],
+                'sector': '',
+                'raw_text': item.get_text(' ', strip=True),
+            })
+        return items
+
+    def saramin_detail(self, html: str) -> Dict:
+        # 상세 영역만 파싱 (나머지 마크업은 트리로 만들지 않음)
+        soup = self._soup(html, 'html.parser', parse_only=self._detail_strainer)
+        detail = _empty_detail()
+        for section in soup.select('.jv_cont'):
+            header = section.select_one('.jv_header, .tit_cont')
+            content = section.select_one('.jv_detail, .cont')
+            if header and content:
+                detail['sections'].append((self._text(header), self._text(content, '\n')))
+        detail['salary'] = self._text(soup.select_one('.salary'))
+        detail['career'] = self._text(soup.select_one('.career'))
+        detail['education'] = self._text(soup.select_one('.education'))
+        detail['full_description'] = self._text(soup.select_one('.jv_detail, .job_detail, .wrap_jv_cont'), '\n')
+        return detail
+
+    def jobkorea_detail(self, html: str) -> Dict:
+        soup = self._soup(html, 'html.parser')
+        summary = []
+        for term in soup.select('dl.tbList > dt'):
+            value = term.find_next_sibling()
+            if value is not None and value.name == 'dd':
+                summary.append((term.get_text(strip=True), value.get_text(' ', strip=True)))
+        body = soup.select_one('.artReadDetail, .detailed-summary-contents') or soup.body or soup
+        return _jobkorea_detail(summary, self._text(body, '\n'))
+
+
+PARSERS = {'lxml': LxmlParser, 'bs4': Bs4Parser}
+
+
+def get_parser(name: Optional[str] = 'lxml'):
+    """이름으로 파서 생성 - lxml이 없으면 bs4로 대체"""
+    if name == 'lxml' and lxml is None:
+        name = 'bs4'
+    return PARSERS[name or 'lxml']()
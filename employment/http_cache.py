@@ -0,0 +1,212 @@
+"""
+HTTP 응답 캐시 - URL 기준 SQLite 저장소 + 조건부 재검증(ETag/Last-Modified)
+
+- TTL 이내 응답은 네트워크 없이 캐시에서 바로 반환 (hit)
+- TTL이 지나면 If-None-Match / If-Modified-Since로 재요청, 304면 캐시 본문 재사용 (revalidated)
+- 저장 용량이 max_bytes를 넘으면 가장 오래 안 쓴 응답부터 삭제 (LRU)
+- max_age가 지난 응답은 evict 때 함께 삭제
+- cacheable(url)이 False인 URL은 캐시를 거치지 않음 (검색 목록처럼 실행마다 새 공고가 나오는 페이지)
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import Counter
+from typing import Callable, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+DEFAULT_TTL = 12 * 3600              # 12시간 (상세 페이지 기준, 이후 조건부 재검증)
+DEFAULT_MAX_AGE = 30 * 24 * 3600     # 30일 지난 응답은 삭제
+DEFAULT_MAX_BYTES = 500 * 1024 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    encoding TEXT,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at);
+"""
+
+
+class ResponseCache:
+    """URL → 응답 본문/헤더 저장소 (스레드 안전)"""
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_BYTES, max_age: float = DEFAULT_MAX_AGE):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def get(self, url: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, headers, encoding, body, etag, last_modified, fetched_at FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+        status, headers, encoding, body, etag, last_modified, fetched_at = row
+        return {
+            'status': status,
+            'headers': json.loads(headers),
+            'encoding': encoding,
+            'body': body,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': fetched_at,
+        }
+
+    def put(self, url: str, response: requests.Response):
+        body = response.content
+        now = time.time()
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM responses WHERE url = ?", (url,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    response.status_code,
+                    json.dumps(dict(response.headers)),
+                    response.encoding,
+                    body,
+                    response.headers.get('ETag'),
+                    response.headers.get('Last-Modified'),
+                    now,
+                    now,
+                    len(body),
+                ),
+            )
+            self._conn.commit()
+            self._total_bytes += len(body) - (old[0] if old else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict_locked()
+
+    def touch(self, url: str):
+        """304 재검증 성공 시 TTL 갱신"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("UPDATE responses SET fetched_at = ?, accessed_at = ? WHERE url = ?", (now, now, url))
+            self._conn.commit()
+
+    def evict(self) -> int:
+        """만료 응답 삭제 + 용량 초과분 LRU 삭제, 삭제 건수 반환"""
+        with self._lock:
+            return self._evict_locked()
+
+    def _evict_locked(self) -> int:
+        deleted = self._conn.execute(
+            "DELETE FROM responses WHERE fetched_at < ?", (time.time() - self.max_age,)
+        ).rowcount
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+        # 용량의 90%까지 오래 안 쓴 순서로 삭제
+        target = int(self.max_bytes * 0.9)
+        if self._total_bytes > target:
+            rows = self._conn.execute("SELECT url, size FROM responses ORDER BY accessed_at").fetchall()
+            victims = []
+            for url, size in rows:
+                if self._total_bytes <= target:
+                    break
+                victims.append((url,))
+                self._total_bytes -= size
+            self._conn.executemany("DELETE FROM responses WHERE url = ?", victims)
+            deleted += len(victims)
+
+        self._conn.commit()
+        return deleted
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class CachedSession(requests.Session):
+    """GET 응답을 ResponseCache에 저장/재사용하는 requests.Session"""
+
+    def __init__(self, cache_path: str, ttl: float = DEFAULT_TTL, max_bytes: int = DEFAULT_MAX_BYTES,
+                 max_age: float = DEFAULT_MAX_AGE, cacheable: Optional[Callable[[str], bool]] = None):
+        """cacheable: URL → 캐시 여부 (없으면 모든 GET 캐시, 크롤러는 sources.detail_cache_rule로 상세만)"""
+        super().__init__()
+        self.cache = ResponseCache(cache_path, max_bytes=max_bytes, max_age=max_age)
+        self.ttl = ttl
+        self.cacheable = cacheable
+        self.stats = Counter()
+        self._stats_lock = threading.Lock()
+
+    def _count(self, key: str):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def request(self, method, url, *args, **kwargs):
+        if method.upper() != 'GET' or args:
+            return super().request(method, url, *args, **kwargs)
+
+        key = requests.Request('GET', url, params=kwargs.get('params')).prepare().url
+        if self.cacheable and not self.cacheable(key):
+            response = super().request(method, url, **kwargs)
+            self._count('uncached')
+            with self._stats_lock:
+                self.stats['bytes_downloaded'] += len(response.content)
+            return response
+        entry = self.cache.get(key)
+
+        if entry and time.time() - entry['fetched_at'] < self.ttl:
+            self._count('hits')
+            return self._from_cache(key, entry)
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if entry:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        response = super().request(method, url, headers=headers, **kwargs)
+
+        if response.status_code == 304 and entry:
+            self._count('revalidated')
+            self.cache.touch(key)
+            return self._from_cache(key, entry)
+
+        self._count('misses')
+        with self._stats_lock:
+            self.stats['bytes_downloaded'] += len(response.content)
+        if response.status_code == 200:
+            self.cache.put(key, response)
+        return response
+
+    @staticmethod
+    def _from_cache(url: str, entry: dict) -> requests.Response:
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.encoding = entry['encoding']
+        response._content = entry['body']
+        response.url = url
+        response.from_cache = True
+        return response
+
+    def summary(self) -> str:
+        """캐시 통계 한 줄 요약"""
+        return (f"hit {self.stats['hits']} / 재검증 {self.stats['revalidated']} / "
+                f"miss {self.stats['misses']} / 캐시 제외 {self.stats['uncached']} / 다운로드 {self.stats['bytes_downloaded'] / 1024:.0f}KB")
+
+    def close(self):
+        super().close()
+        self.cache.close()
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+공고 레코드 + 컬럼형(Parquet) 저장
+
+- Job: __slots__ 데이터클래스 (dict 대비 공고당 메모리 절감, 출처/회사 등 반복 문자열은 intern)
+- Parquet: source/company/experience_years는 dictionary 인코딩, 기술스택은 list<string> 컬럼
+  → 한 달치 이력을 필요한 컬럼만 골라 읽을 수 있어 들여쓰기 JSON 전체 파싱보다 빠르고 가벼움
+- pyarrow는 선택 의존성 (없으면 Parquet 저장/로드만 사용 불가, 처음 사용할 때 import)
+- CSV: 표준 csv 모듈로 저장 (CSV 한 번 쓰려고 pandas를 불러오지 않도록)
+
+사용법:
+    python job_record.py convert jobs_full_*.json jobs_*.jsonl   # 기존 파일을 Parquet으로 변환
+"""
+
+import argparse
+import csv
+import glob
+import importlib.util
+import json
+import os
+import re
+import sys
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Union
+
+# pyarrow는 처음 Parquet을 읽고 쓸 때 import (크롤러/CLI 시작 시간 단축, 없으면 Parquet 저장/로드 비활성)
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+pa = pq = None
+
+
+@dataclass(slots=True)
+class Job:
+    source: str
+    title: str = ''
+    company: str = ''
+    link: str = ''
+    source_id: str = ''
+    conditions: List[str] = field(default_factory=list)
+    qualifications: str = ''
+    preferred: str = ''
+    responsibilities: str = ''
+    benefits: str = ''
+    salary: str = ''
+    experience_years: str = ''
+    education: str = ''
+    full_description: str = ''
+    detail_tech_stack: List[str] = field(default_factory=list)
+    qualification_tech_stack: List[str] = field(default_factory=list)
+    min_years: Optional[int] = None
+    max_years: Optional[int] = None
+    education_level: Optional[int] = None
+    salary_min: Optional[int] = None
+    salary_max: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Job':
+        """크롤러 공고 dict → Job (모르는 키는 무시, dict로 온 상세 설명은 텍스트로 합침)"""
+        values = {}
+        for name in _FIELD_NAMES:
+            value = data.get(name)
+            if value is None:
+                continue
+            if isinstance(value, dict):
+                value = '\n'.join(str(v) for v in value.values() if v)
+            values[name] = value
+        values['source_id'] = str(data.get('rec_idx') or data.get('job_id') or data.get('source_id') or '')
+        for name in _INTERNED:
+            values[name] = sys.intern(values.get(name) or '')
+        return cls(**values)
+
+    def to_dict(self) -> Dict:
+        """크롤러 dict 형식으로 복원 (rec_idx / job_id 포함)"""
+        data = asdict(self)
+        source_id = data.pop('source_id')
+        if source_id and self.source == '사람인':
+            data['rec_idx'] = source_id
+        elif source_id and self.source == '원티드':
+            data['job_id'] = int(source_id) if source_id.isdigit() else source_id
+        return data
+
+
+_FIELD_NAMES = [f.name for f in fields(Job) if f.name != 'source_id']
+_INTERNED = ('source', 'company', 'experience_years', 'education', 'salary')
+
+_LIST_COLUMNS = ('conditions', 'detail_tech_stack', 'qualification_tech_stack')
+_DICT_COLUMNS = ('source', 'company', 'experience_years', 'education', 'salary')
+_INT_COLUMNS = {'min_years': 'int8', 'max_years': 'int8', 'education_level': 'int8',
+                'salary_min': 'int32', 'salary_max': 'int32'}
+
+
+def _require_pyarrow():
+    global pa, pq
+    if pa is None:
+        if not HAS_PYARROW:
+            raise ImportError("Parquet 저장/로드에는 pyarrow가 필요합니다: pip install pyarrow")
+        import pyarrow
+        import pyarrow.parquet
+        pa, pq = pyarrow, pyarrow.parquet
+
+
+def parquet_schema():
+    _require_pyarrow()
+    columns = []
+    for name in [f.name for f in fields(Job)]:
+        if name in _LIST_COLUMNS:
+            columns.append(pa.field(name, pa.list_(pa.string())))
+        elif name in _DICT_COLUMNS:
+            columns.append(pa.field(name, pa.dictionary(pa.int32(), pa.string())))
+        elif name in _INT_COLUMNS:
+            columns.append(pa.field(name, getattr(pa, _INT_COLUMNS[name])()))
+        else:
+            columns.append(pa.field(name, pa.string()))
+    columns.append(pa.field('collected_at', pa.timestamp('s')))
+    return pa.schema(columns)
+
+
+def write_parquet(jobs: Iterable[Union[Dict, Job]], path: str, collected_at: Optional[datetime] = None) -> int:
+    """공고 목록을 Parquet 파일로 저장 (zstd 압축), 저장한 공고 수 반환"""
+    _require_pyarrow()
+    records = [job if isinstance(job, Job) else Job.from_dict(job) for job in jobs]
+    columns = {name: [getattr(job, name) for job in records] for name in [f.name for f in fields(Job)]}
+    columns['collected_at'] = [collected_at or datetime.now()] * len(records)
+    schema = parquet_schema()
+    table = pa.Table.from_pydict(columns, schema=schema)
+    pq.write_table(table, path, compression='zstd')
+    return len(records)
+
+
+def read_parquet(paths: Union[str, List[str]], columns: Optional[List[str]] = None):
+    """Parquet 파일(들)을 하나의 pyarrow Table로 읽기 (columns로 필요한 컬럼만)"""
+    _require_pyarrow()
+    if isinstance(paths, str):
+        paths = [paths]
+    tables = [pq.read_table(path, columns=columns) for path in paths]
+    return pa.concat_tables(tables) if len(tables) > 1 else tables[0]
+
+
+def load_jobs(paths: Union[str, List[str]], batch_size: int = 4096) -> List[Job]:
+    """Parquet → Job 목록 (배치 단위로 읽어 테이블 전체를 메모리에 올리지 않음)"""
+    _require_pyarrow()
+    if isinstance(paths, str):
+        paths = [paths]
+    names = [f.name for f in fields(Job)]
+    jobs = []
+    for path in paths:
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size, columns=names):
+            columns = [batch.column(name).to_pylist() for name in names]
+            for row in zip(*columns):
+                job = Job(*row)
+                for name in _INTERNED:
+                    setattr(job, name, sys.intern(getattr(job, name) or ''))
+                jobs.append(job)
+    return jobs
+
+
+def write_csv(rows: List[Dict], path: str) -> int:
+    """dict 목록을 CSV로 저장 (엑셀용 utf-8-sig), 저장한 행 수 반환
+
+    컬럼은 처음 나온 키 순서, 없는 값/None은 빈 칸, 리스트 등은 str() 표기 (pandas to_csv와 같은 형식)
+    """
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow(['' if row.get(col) is None else row[col] for col in columns])
+    return len(rows)
+
+
+def history_files(output_dir: str, days: int = 30) -> List[str]:
+    """output_dir의 jobs_<타임스탬프>.parquet 중 최근 days일 파일"""
+    since = datetime.now() - timedelta(days=days)
+    paths = []
+    for path in sorted(glob.glob(os.path.join(output_dir, 'jobs_*.parquet'))):
+        match = re.search(r'(\d{8}_\d{6})', os.path.basename(path))
+        if match and datetime.strptime(match.group(1), '%Y%m%d_%H%M%S') >= since:
+            paths.append(path)
+    return paths
+
+
+def convert(path: str) -> str:
+    """jobs_full_*.json / jobs_*.jsonl → 같은 이름의 .parquet (수집 시각은 파일명 타임스탬프)"""
+    with open(path, encoding='utf-8') as f:
+        if path.endswith('.jsonl'):
+            jobs = [json.loads(line) for line in f if line.strip()]
+        else:
+            jobs = json.load(f)
+    match = re.search(r'(\d{8}_\d{6})', os.path.basename(path))
+    collected_at = datetime.strptime(match.group(1), '%Y%m%d_%H%M%S') if match else None
+    out_path = re.sub(r'^jobs_full_', 'jobs_', os.path.basename(os.path.splitext(path)[0])) + '.parquet'
+    out_path = os.path.join(os.path.dirname(path), out_path)
+    write_parquet(jobs, out_path, collected_at=collected_at)
+    return out_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='공고 파일 Parquet 변환')
+    sub = parser.add_subparsers(dest='command', required=True)
+    convert_parser = sub.add_parser('convert', help='JSON/JSONL → Parquet')
+    convert_parser.add_argument('files', nargs='+')
+    args = parser.parse_args()
+
+    if args.command == 'convert':
+        for path in sorted(args.files):
+            out_path = convert(path)
+            print(f"📦 {path} → {out_path} ({os.path.getsize(path) / 1024:.0f}KB → "
+                  f"{os.path.getsize(out_path) / 1024:.0f}KB)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,612 @@
+#!/usr/bin/env python3
+"""
+채용공고 저장소 - 실행마다 새로 쓰던 CSV/JSON 대신 정규화된 SQLite DB에 누적 저장
+
+테이블
+- crawl_runs    : 크롤링 실행 (시작/종료 시각, 공고 수)
+- jobs          : 공고 (출처 고유 키 기준 upsert, 상세 필드 + 경력/학력/연봉 구조화 컬럼 포함)
+- job_techs     : 공고별 기술 태그 (scope='detail' 상세 전체, 'qualification' 자격요건+우대사항)
+- job_snapshots : 실행별 수집된 공고 목록
+- job_aggregates: 집계 테이블 (run_id=0 전체 공고, 그 외 실행별) - upsert 때 바뀐 공고의 증감분만 반영
+                  → 리포트/대시보드는 보관한 공고 수와 관계없이 이 테이블만 읽음
+
+사용법:
+    python job_store.py import jobs_full_20260109_152215.json [--db jobs.sqlite]
+    python job_store.py stats [--db jobs.sqlite]
+    python job_store.py filter --years 3 [--min-salary 5000] [--education 3]
+    python job_store.py rebuild-aggregates   # 집계 테이블 다시 계산 (이전 버전 DB는 처음 열 때 자동)
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+from collections import Counter
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from requirement_extractor import experience_label, extract_requirements
+from seen_index import posting_key
+
+DEFAULT_DB = 'jobs.sqlite'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS crawl_runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    label TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    total_jobs INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_key TEXT NOT NULL UNIQUE,
+    source TEXT NOT NULL,
+    source_id TEXT,
+    company TEXT NOT NULL DEFAULT '',
+    title TEXT NOT NULL DEFAULT '',
+    link TEXT,
+    conditions TEXT,
+    qualifications TEXT,
+    preferred TEXT,
+    responsibilities TEXT,
+    benefits TEXT,
+    salary TEXT,
+    experience_years TEXT,
+    education TEXT,
+    full_description TEXT,
+    min_years INTEGER,
+    max_years INTEGER,
+    education_level INTEGER,
+    salary_min INTEGER,
+    salary_max INTEGER,
+    has_detail INTEGER NOT NULL DEFAULT 0,
+    first_run_id INTEGER REFERENCES crawl_runs(run_id),
+    last_run_id INTEGER REFERENCES crawl_runs(run_id)
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_source_id ON jobs(source, source_id);
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company);
+
+CREATE TABLE IF NOT EXISTS job_techs (
+    job_id INTEGER NOT NULL REFERENCES jobs(job_id),
+    scope TEXT NOT NULL,
+    tech TEXT NOT NULL,
+    PRIMARY KEY (job_id, scope, tech)
+);
+CREATE INDEX IF NOT EXISTS idx_job_techs_tech ON job_techs(scope, tech);
+
+CREATE TABLE IF NOT EXISTS job_snapshots (
+    run_id INTEGER NOT NULL REFERENCES crawl_runs(run_id),
+    job_id INTEGER NOT NULL REFERENCES jobs(job_id),
+    PRIMARY KEY (run_id, job_id)
+);
+CREATE INDEX IF NOT EXISTS idx_job_snapshots_job ON job_snapshots(job_id);
+
+CREATE TABLE IF NOT EXISTS job_aggregates (
+    run_id INTEGER NOT NULL,
+    dim TEXT NOT NULL,
+    key TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (run_id, dim, key)
+);
+CREATE INDEX IF NOT EXISTS idx_job_aggregates_top ON job_aggregates(run_id, dim, count);
+"""
+
+ALL_RUNS = 0  # job_aggregates에서 전체 공고(현재 상태) 집계의 run_id
+
+# job_techs scope → 집계 차원 (required/preferred: 자격요건/우대사항 각각에서 추출한 기술)
+TECH_DIMS = {'detail': 'tech', 'qualification': 'qualification', 'required': 'required', 'preferred': 'preferred'}
+
+DETAIL_COLUMNS = [
+    'qualifications', 'preferred', 'responsibilities', 'benefits',
+    'salary', 'experience_years', 'education', 'full_description',
+]
+
+# 상세 기술스택을 추출하는 본문 (sources.py 어댑터의 parse_detail과 같은 필드)
+DETAIL_TECH_SOURCES = ['qualifications', 'preferred', 'responsibilities', 'full_description']
+
+# 경력/학력/연봉 구조화 컬럼 (requirement_extractor)
+REQUIREMENT_COLUMNS = ['min_years', 'max_years', 'education_level', 'salary_min', 'salary_max']
+
+REQUIREMENT_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_jobs_min_years ON jobs(min_years);
+CREATE INDEX IF NOT EXISTS idx_jobs_salary ON jobs(salary_max, salary_min);
+"""
+
+
+def _text(value) -> str:
+    """TEXT 컬럼용 문자열 (원티드 API의 detail처럼 dict로 온 값은 섹션별로 이어 붙임)"""
+    if isinstance(value, dict):
+        return '\n'.join(str(v) for v in value.values() if v)
+    return value or ''
+
+
+def job_key(job: Dict) -> str:
+    """출처 고유 ID 기반 키, 없으면 출처+회사+제목"""
+    return posting_key(job) or f"{job.get('source', '')}:{job.get('company', '')}|{job.get('title', '')}"
+
+
+class JobStore:
+    def __init__(self, path: str = DEFAULT_DB, extract_tech_stack: Optional[Callable[[str], List[str]]] = None):
+        """extract_tech_stack: 자격요건+우대사항 기술 추출 함수 (없으면 qualification 태그 생략)"""
+        self.path = path
+        self.extract_tech_stack = extract_tech_stack
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        """이전 버전 DB에 구조화 컬럼 추가"""
+        existing = {row[1] for row in self.conn.execute("PRAGMA table_info(jobs)")}
+        with self.conn:
+            for col in REQUIREMENT_COLUMNS:
+                if col not in existing:
+                    self.conn.execute(f"ALTER TABLE jobs ADD COLUMN {col} INTEGER")
+        self.conn.executescript(REQUIREMENT_INDEXES)
+        # 집계 테이블이 생기기 전 DB: 한 번만 전체 공고로 계산
+        if (self.conn.execute("SELECT 1 FROM jobs LIMIT 1").fetchone()
+                and not self.conn.execute("SELECT 1 FROM job_aggregates LIMIT 1").fetchone()):
+            print("🧮 집계 테이블 생성 중 (처음 한 번)...")
+            self.rebuild_aggregates()
+
+    # ------------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------------
+
+    def start_run(self, label: Optional[str] = None, started_at: Optional[str] = None) -> int:
+        started_at = started_at or datetime.now().isoformat(timespec='seconds')
+        label = label or datetime.now().strftime('%Y%m%d_%H%M%S')
+        cur = self.conn.execute("INSERT INTO crawl_runs (label, started_at) VALUES (?, ?)", (label, started_at))
+        self.conn.commit()
+        return cur.lastrowid
+
+    def finish_run(self, run_id: int):
+        with self.conn:
+            self.conn.execute(
+                """
+                UPDATE crawl_runs SET finished_at = ?,
+                    total_jobs = (SELECT COUNT(*) FROM job_snapshots WHERE run_id = ?)
+                WHERE run_id = ?
+                """,
+                (datetime.now().isoformat(timespec='seconds'), run_id, run_id),
+            )
+
+    def upsert_jobs(self, jobs: List[Dict], run_id: int, reextract: bool = False) -> int:
+        """공고 일괄 upsert (한 트랜잭션), 저장한 공고 수 반환
+
+        reextract: 공고의 detail_tech_stack 대신 본문에서 기술스택을 다시 추출 (이전 사전/규칙으로 만든 파일을 가져올 때)
+        """
+        rows = []
+        for job in jobs:
+            key = job_key(job)
+            # 상세 수집 때 추출된 값이 없으면 (목록만 있는 공고, 이전 JSON) 여기서 추출
+            requirements = job if 'min_years' in job else extract_requirements(job)
+            detail_values = [_text(job.get(col)) for col in DETAIL_COLUMNS]
+            if not detail_values[DETAIL_COLUMNS.index('experience_years')]:
+                detail_values[DETAIL_COLUMNS.index('experience_years')] = experience_label(
+                    requirements['min_years'], requirements['max_years'])
+            rows.append((
+                key,
+                job.get('source', ''),
+                key.split(':', 1)[1] if posting_key(job) else None,
+                job.get('company', ''),
+                job.get('title', ''),
+                job.get('link', ''),
+                json.dumps(job.get('conditions', []), ensure_ascii=False),
+                *detail_values,
+                *[requirements.get(col) for col in REQUIREMENT_COLUMNS],
+                int(bool(job.get('qualifications') or job.get('full_description'))),
+                run_id,
+                run_id,
+            ))
+
+        with self.conn:
+            # 다른 프로세스의 upsert와 겹치지 않도록 변경 전 집계 기여분 조회부터 잠금
+            self.conn.execute("BEGIN IMMEDIATE")
+            before, in_run = self._contributions_of_keys([row[0] for row in rows], run_id)
+
+            self.conn.executemany(
+                f"""
+                INSERT INTO jobs (job_key, source, source_id, company, title, link, conditions,
+                                  {', '.join(DETAIL_COLUMNS + REQUIREMENT_COLUMNS)}, has_detail, first_run_id, last_run_id)
+                VALUES ({', '.join('?' * (10 + len(DETAIL_COLUMNS) + len(REQUIREMENT_COLUMNS)))})
+                ON CONFLICT(job_key) DO UPDATE SET
+                    company = excluded.company,
+                    title = excluded.title,
+                    link = excluded.link,
+                    conditions = excluded.conditions,
+                    {', '.join(f'{col} = CASE WHEN excluded.has_detail THEN excluded.{col} ELSE jobs.{col} END' for col in DETAIL_COLUMNS)},
+                    {', '.join(f'{col} = COALESCE(excluded.{col}, jobs.{col})' for col in REQUIREMENT_COLUMNS)},
+                    has_detail = MAX(jobs.has_detail, excluded.has_detail),
+                    last_run_id = excluded.last_run_id
+                """,
+                rows,
+            )
+
+            ids = self._ids_of_keys([row[0] for row in rows])
+
+            tech_rows = []
+            detail_ids = []
+            for job in jobs:
+                job_id = ids[job_key(job)]
+                if not (job.get('qualifications') or job.get('full_description')):
+                    continue
+                detail_ids.append((job_id,))
+                techs = job.get('detail_tech_stack', [])
+                if reextract and self.extract_tech_stack:
+                    techs = self.extract_tech_stack(' '.join(_text(job.get(col)) for col in DETAIL_TECH_SOURCES))
+                tech_rows.extend((job_id, 'detail', tech) for tech in techs if tech)
+                if self.extract_tech_stack:
+                    tech_rows.extend(self._qualification_tags(job_id, job.get('qualifications'), job.get('preferred')))
+
+            # 상세를 새로 받은 공고만 태그 교체 (상세 실패 공고는 기존 태그 유지)
+            self.conn.executemany("DELETE FROM job_techs WHERE job_id = ?", detail_ids)
+            self.conn.executemany("INSERT OR IGNORE INTO job_techs VALUES (?, ?, ?)", tech_rows)
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO job_snapshots VALUES (?, ?)",
+                [(run_id, ids[job_key(job)]) for job in jobs],
+            )
+
+            after = self._contributions({ids[job_key(job)] for job in jobs})
+            self._apply_deltas(run_id, before, in_run, after)
+        return len(rows)
+
+    def _ids_of_keys(self, keys: List[str]) -> Dict[str, int]:
+        """job_key → job_id (이번 배치의 키만 조회 - job_key 유일 인덱스 사용)"""
+        ids = {}
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            marks = ', '.join('?' * len(chunk))
+            ids.update(self.conn.execute(f"SELECT job_key, job_id FROM jobs WHERE job_key IN ({marks})", chunk))
+        return ids
+
+    def _qualification_tags(self, job_id: int, qualifications, preferred) -> List[tuple]:
+        """자격요건+우대사항 기술 태그 (qualification) + 각각의 태그 (required/preferred)"""
+        required = self.extract_tech_stack(_text(qualifications))
+        preferred = self.extract_tech_stack(_text(preferred))
+        combined = self.extract_tech_stack(f"{_text(qualifications)} {_text(preferred)}")
+        return ([(job_id, 'qualification', tech) for tech in combined]
+                + [(job_id, 'required', tech) for tech in required]
+                + [(job_id, 'preferred', tech) for tech in preferred])
+
+    # ------------------------------------------------------------------
+    # 집계 테이블 (증분 갱신)
+    # ------------------------------------------------------------------
+
+    def _contributions(self, job_ids) -> Dict[int, List[tuple]]:
+        """공고별 집계 기여분 → {job_id: [(dim, key), ...]}"""
+        ids = list(job_ids)
+        contributions = {}
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            marks = ', '.join('?' * len(chunk))
+            labels = {}
+            for job_id, source, company, experience, has_detail in self.conn.execute(
+                f"SELECT job_id, source, company, experience_years, has_detail FROM jobs WHERE job_id IN ({marks})",
+                chunk,
+            ):
+                items = [('jobs', 'total'), ('source', source)]
+                if has_detail:
+                    items.append(('jobs', 'with_details'))
+                if company:
+                    items.append(('company', company))
+                if experience:
+                    items.append(('experience', experience))
+                contributions[job_id] = items
+                labels[job_id] = (source, company)
+
+            for job_id, scope, tech in self.conn.execute(
+                f"SELECT job_id, scope, tech FROM job_techs WHERE job_id IN ({marks})", chunk
+            ):
+                items = contributions[job_id]
+                items.append((TECH_DIMS.get(scope, scope), tech))
+                if scope == 'detail':
+                    source, company = labels[job_id]
+                    items.append(('source_tech', f"{source}\t{tech}"))
+                    if company:
+                        items.append(('company_tech', f"{company}\t{tech}"))
+        return contributions
+
+    def _contributions_of_keys(self, keys: List[str], run_id: int):
+        """upsert 전 이미 있던 공고의 기여분 + 그중 이번 실행에 이미 포함된 job_id"""
+        existing, in_run = [], set()
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            marks = ', '.join('?' * len(chunk))
+            for job_id, snapshot in self.conn.execute(
+                f"""SELECT j.job_id, s.run_id FROM jobs j
+                    LEFT JOIN job_snapshots s ON s.job_id = j.job_id AND s.run_id = ?
+                    WHERE j.job_key IN ({marks})""",
+                (run_id, *chunk),
+            ):
+                existing.append(job_id)
+                if snapshot is not None:
+                    in_run.add(job_id)
+        return self._contributions(existing), in_run
+
+    def _apply_deltas(self, run_id: int, before: Dict[int, List[tuple]], in_run: set,
+                      after: Dict[int, List[tuple]]):
+        """바뀐 공고의 (변경 후 - 변경 전) 기여분을 전체/이번 실행 집계에 더함"""
+        deltas = {ALL_RUNS: Counter(), run_id: Counter()}
+        for job_id, items in after.items():
+            deltas[ALL_RUNS].update(items)
+            deltas[run_id].update(items)
+        for job_id, items in before.items():
+            deltas[ALL_RUNS].subtract(items)
+            if job_id in in_run:
+                deltas[run_id].subtract(items)
+
+        rows = [(scope, dim, key, count) for scope, delta in deltas.items()
+                for (dim, key), count in delta.items() if count]
+        self.conn.executemany(
+            """INSERT INTO job_aggregates VALUES (?, ?, ?, ?)
+               ON CONFLICT(run_id, dim, key) DO UPDATE SET count = count + excluded.count""",
+            rows,
+        )
+        self.conn.executemany(
+            "DELETE FROM job_aggregates WHERE run_id = ? AND dim = ? AND key = ? AND count <= 0",
+            [row[:3] for row in rows if row[3] < 0],
+        )
+
+    def rebuild_aggregates(self):
+        """집계 테이블을 현재 공고/스냅샷으로 다시 계산 (이전 실행도 현재 공고 내용 기준이 됨)"""
+        with self.conn:
+            if self.extract_tech_stack:
+                # 자격요건/우대사항 분리 태그가 없던 DB: 저장된 본문으로 채움
+                missing = self.conn.execute(
+                    """SELECT job_id, qualifications, preferred FROM jobs WHERE has_detail = 1
+                       AND job_id NOT IN (SELECT job_id FROM job_techs WHERE scope IN ('required', 'preferred'))"""
+                ).fetchall()
+                tags = [tag for job_id, qual, pref in missing for tag in self._qualification_tags(job_id, qual, pref)]
+                self.conn.executemany("INSERT OR IGNORE INTO job_techs VALUES (?, ?, ?)", tags)
+
+            self.conn.execute("DELETE FROM job_aggregates")
+            totals = {}
+            ids = [row[0] for row in self.conn.execute("SELECT job_id FROM jobs ORDER BY job_id")]
+            for start in range(0, len(ids), 500):
+                contributions = self._contributions(ids[start:start + 500])
+                runs = {}
+                marks = ', '.join('?' * len(contributions))
+                for snapshot_run, job_id in self.conn.execute(
+                    f"SELECT run_id, job_id FROM job_snapshots WHERE job_id IN ({marks})", list(contributions)
+                ):
+                    runs.setdefault(job_id, []).append(snapshot_run)
+                for job_id, items in contributions.items():
+                    for scope in [ALL_RUNS, *runs.get(job_id, [])]:
+                        totals.setdefault(scope, Counter()).update(items)
+
+            self.conn.executemany(
+                "INSERT INTO job_aggregates VALUES (?, ?, ?, ?)",
+                [(scope, dim, key, count) for scope, counter in totals.items() for (dim, key), count in counter.items()],
+            )
+
+    # ------------------------------------------------------------------
+    # 집계
+    # ------------------------------------------------------------------
+
+    def top(self, dim: str, run_id: Optional[int] = None, limit: int = 20) -> List[tuple]:
+        """집계 테이블에서 차원별 상위 항목 → [(key, count), ...] (run_id 없으면 전체 공고)"""
+        return self.conn.execute(
+            "SELECT key, count FROM job_aggregates WHERE run_id = ? AND dim = ? ORDER BY count DESC, key LIMIT ?",
+            (ALL_RUNS if run_id is None else run_id, dim, limit),
+        ).fetchall()
+
+    def aggregate(self, run_id: Optional[int] = None) -> Dict:
+        """analyze_detailed_jobs와 같은 형식의 분석 결과 (집계 테이블 조회, run_id 없으면 전체 공고)
+
+        실행별 집계는 그 실행에서 저장한 공고 내용 기준 (이후 실행에서 바뀐 내용은 전체 집계에만 반영)
+        """
+        totals = dict(self.top('jobs', run_id))
+        return {
+            'total_jobs': totals.get('total', 0),
+            'jobs_with_details': totals.get('with_details', 0),
+            'by_source': dict(self.top('source', run_id)),
+            'tech_frequency': dict(self.top('tech', run_id, 40)),
+            'qualification_tech_frequency': dict(self.top('qualification', run_id, 30)),
+            'required_tech_frequency': dict(self.top('required', run_id, 30)),
+            'preferred_tech_frequency': dict(self.top('preferred', run_id, 30)),
+            'top_companies': self.top('company', run_id, 20),
+            'experience_distribution': self.top('experience', run_id, 10),
+        }
+
+    def breakdown(self, dim: str, name: str, run_id: Optional[int] = None, limit: int = 5) -> List[tuple]:
+        """회사/출처별 기술 상위 (dim: 'company_tech' 또는 'source_tech') → [(tech, count), ...]"""
+        prefix = f"{name}\t"  # 키: 이름\t기술 → '이름\t' 이상 '이름\n'(탭 다음 문자) 미만 범위
+        rows = self.conn.execute(
+            """SELECT key, count FROM job_aggregates WHERE run_id = ? AND dim = ? AND key >= ? AND key < ?
+               ORDER BY count DESC, key LIMIT ?""",
+            (ALL_RUNS if run_id is None else run_id, dim, prefix, f"{name}\n", limit),
+        ).fetchall()
+        return [(key[len(prefix):], count) for key, count in rows]
+
+    def recent_runs(self, limit: int = 12) -> List[tuple]:
+        """최근 실행 (오래된 순) → [(run_id, label, started_at, 공고 수), ...]"""
+        rows = self.conn.execute(
+            """SELECT r.run_id, r.label, r.started_at, a.count FROM crawl_runs r
+               JOIN job_aggregates a ON a.run_id = r.run_id AND a.dim = 'jobs' AND a.key = 'total'
+               ORDER BY r.run_id DESC LIMIT ?""",
+            (limit,),
+        ).fetchall()
+        return rows[::-1]
+
+    def trend(self, dim: str = 'tech', keys: Optional[List[str]] = None, top: int = 8,
+              runs: int = 12) -> Tuple[List[tuple], Dict[str, List[float]]]:
+        """최근 실행별 언급 비율(%) 추이 → (recent_runs 결과, {key: [실행별 비율, ...]})
+
+        keys가 없으면 가장 최근 실행의 상위 top개
+        """
+        recent = self.recent_runs(runs)
+        if not recent:
+            return [], {}
+        keys = keys or [key for key, _ in self.top(dim, recent[-1][0], top)]
+        run_ids = [run[0] for run in recent]
+        counts = {}
+        for run_id, key, count in self.conn.execute(
+            f"""SELECT run_id, key, count FROM job_aggregates
+                WHERE dim = ? AND run_id IN ({', '.join('?' * len(run_ids))}) AND key IN ({', '.join('?' * len(keys))})""",
+            (dim, *run_ids, *keys),
+        ):
+            counts[run_id, key] = count
+        series = {
+            key: [counts.get((run_id, key), 0) / (total or 1) * 100 for run_id, _, _, total in recent]
+            for key in keys
+        }
+        return recent, series
+
+    def sample_jobs(self, run_id: Optional[int] = None, limit: int = 5) -> List[Dict]:
+        """리포트용 자격요건 있는 공고 샘플 (전체를 불러오지 않음)"""
+        return self.load_jobs(run_id, limit=limit, detail_only=True)
+
+    def load_jobs(self, run_id: Optional[int] = None, limit: Optional[int] = None,
+                  detail_only: bool = False) -> List[Dict]:
+        """저장된 공고를 크롤러 dict 형식으로 복원 (detail_only: 자격요건 있는 공고만)"""
+        clauses, params = [], []
+        if run_id is not None:
+            clauses.append("job_id IN (SELECT job_id FROM job_snapshots WHERE run_id = ?)")
+            params.append(run_id)
+        if detail_only:
+            clauses.append("qualifications != ''")
+        sql = "SELECT * FROM jobs" + (f" WHERE {' AND '.join(clauses)}" if clauses else '') + " ORDER BY job_id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        cur = self.conn.execute(sql, params)
+        columns = [d[0] for d in cur.description]
+        rows = [dict(zip(columns, row)) for row in cur.fetchall()]
+
+        techs = {}
+        for job_id, tech in self.conn.execute(
+            f"SELECT job_id, tech FROM job_techs WHERE scope = 'detail' AND job_id IN (SELECT job_id FROM ({sql}))",
+            params,
+        ):
+            techs.setdefault(job_id, []).append(tech)
+
+        jobs = []
+        for row in rows:
+            job = {
+                'source': row['source'],
+                'title': row['title'],
+                'company': row['company'],
+                'link': row['link'],
+                'conditions': json.loads(row['conditions'] or '[]'),
+            }
+            source, _, source_id = row['job_key'].partition(':')
+            if row['source_id'] and source == 'saramin':
+                job['rec_idx'] = row['source_id']
+            elif row['source_id'] and source == 'wanted':
+                job['job_id'] = int(row['source_id']) if row['source_id'].isdigit() else row['source_id']
+            for col in DETAIL_COLUMNS:
+                job[col] = row[col] or ''
+            for col in REQUIREMENT_COLUMNS:
+                job[col] = row[col]
+            job['detail_tech_stack'] = techs.get(row['job_id'], [])
+            jobs.append(job)
+        return jobs
+
+    def filter_jobs(self, years: Optional[int] = None, min_salary: Optional[int] = None,
+                    education_level: Optional[int] = None, limit: int = 50) -> List[tuple]:
+        """구조화 컬럼으로 공고 필터링 → (job_id, 출처, 회사, 제목, min_years, max_years, salary_min, salary_max)
+
+        years: 지원자 경력 (min_years <= years <= max_years 인 공고)
+        min_salary: 희망 연봉 하한, 만원 (salary_max가 이 값 이상인 공고)
+        education_level: 지원자 학력 (요구 학력이 이 수준 이하인 공고)
+        """
+        clauses, params = [], []
+        if years is not None:
+            clauses.append("min_years <= ? AND (max_years IS NULL OR max_years >= ?)")
+            params += [years, years]
+        if min_salary is not None:
+            clauses.append("salary_max >= ?")
+            params.append(min_salary)
+        if education_level is not None:
+            clauses.append("(education_level IS NULL OR education_level <= ?)")
+            params.append(education_level)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        return self.conn.execute(
+            f"""SELECT job_id, source, company, title, min_years, max_years, salary_min, salary_max
+                FROM jobs {where} ORDER BY salary_max DESC, job_id LIMIT ?""",
+            (*params, limit),
+        ).fetchall()
+
+    def latest_run_id(self) -> Optional[int]:
+        row = self.conn.execute("SELECT MAX(run_id) FROM crawl_runs").fetchone()
+        return row[0]
+
+    # ------------------------------------------------------------------
+    # 기존 파일 가져오기
+    # ------------------------------------------------------------------
+
+    def import_json(self, path: str) -> int:
+        """jobs_full_*.json 하나를 실행 1회로 가져오기 (extract_tech_stack이 있으면 기술스택은 본문에서 다시 추출)"""
+        with open(path, encoding='utf-8') as f:
+            jobs = json.load(f)
+
+        # 파일명의 타임스탬프를 실행 라벨/시각으로 사용
+        match = re.search(r'(\d{8}_\d{6})', os.path.basename(path))
+        label = match.group(1) if match else os.path.basename(path)
+        started_at = datetime.strptime(label, '%Y%m%d_%H%M%S').isoformat() if match else None
+
+        existing = self.conn.execute("SELECT run_id FROM crawl_runs WHERE label = ?", (label,)).fetchone()
+        if existing:
+            print(f"  이미 가져온 실행: {label} (run_id={existing[0]})")
+            return 0
+
+        run_id = self.start_run(label=label, started_at=started_at)
+        count = self.upsert_jobs(jobs, run_id, reextract=True)
+        self.finish_run(run_id)
+        return count
+
+    def close(self):
+        self.conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='채용공고 SQLite 저장소')
+    parser.add_argument('--db', default=DEFAULT_DB, help=f'DB 경로 (기본: {DEFAULT_DB})')
+    sub = parser.add_subparsers(dest='command', required=True)
+    import_parser = sub.add_parser('import', help='jobs_full_*.json 가져오기')
+    import_parser.add_argument('files', nargs='+')
+    sub.add_parser('stats', help='실행별 공고 수')
+    filter_parser = sub.add_parser('filter', help='경력/연봉/학력 조건으로 공고 검색')
+    filter_parser.add_argument('--years', type=int, help='내 경력 연차')
+    filter_parser.add_argument('--min-salary', type=int, help='희망 연봉 하한 (만원)')
+    filter_parser.add_argument('--education', type=int, help='내 학력 (1=고졸, 2=초대졸, 3=대졸, 4=석사, 5=박사)')
+    filter_parser.add_argument('--limit', type=int, default=30)
+    sub.add_parser('rebuild-aggregates', help='집계 테이블 다시 계산')
+    args = parser.parse_args()
+
+    from crawler_detailed import TECH_MATCHER
+    store = JobStore(args.db, extract_tech_stack=TECH_MATCHER.find)
+
+    if args.command == 'import':
+        for path in sorted(args.files):
+            count = store.import_json(path)
+            print(f"📥 {path}: {count}개 공고 가져옴")
+    elif args.command == 'stats':
+        for run_id, label, started_at, total in store.conn.execute(
+            "SELECT run_id, label, started_at, total_jobs FROM crawl_runs ORDER BY run_id"
+        ):
+            print(f"  run {run_id:3} | {label} | {started_at} | {total}개")
+        total = store.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+        print(f"\n총 공고: {total}개")
+    elif args.command == 'filter':
+        rows = store.filter_jobs(args.years, args.min_salary, args.education, args.limit)
+        for job_id, source, company, title, min_years, max_years, salary_min, salary_max in rows:
+            years = experience_label(min_years, max_years) or '-'
+            salary = f"{salary_min or '?'}~{salary_max or '?'}만원" if salary_min or salary_max else '-'
+            print(f"  [{source}] {company} | {title} | {years} | {salary}")
+        print(f"\n{len(rows)}개 공고")
+    elif args.command == 'rebuild-aggregates':
+        store.rebuild_aggregates()
+        count = store.conn.execute("SELECT COUNT(*) FROM job_aggregates").fetchone()[0]
+        print(f"🧮 집계 테이블: {count}행")
+
+    store.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,262 @@
+"""
+스트리밍 크롤링 파이프라인 - 목록 → 중복 제거 → 상세 → 추출 → 저장을 제너레이터로 연결
+
+- 공고는 배치 단위로 흘러가며 처리 즉시 JSONL(+ JobStore)에 기록되므로 중간에 죽어도 결과가 남음
+- 메모리에는 현재 배치와 중복 제거용 키만 유지
+- 분석 카운터(OnlineAnalyzer)는 공고가 기록될 때마다 갱신
+- 체크포인트 파일에 완료한 (키워드, 출처)를 기록해 재실행 시 이어서 진행 (이미 기록된 공고는 건너뜀)
+  재개할 때 seen_index는 원래 실행 시작 시각으로 비교 (중단된 단위가 중단 전 기록한 페이지에서 멈추지 않도록)
+  실행 끝 재시도를 기다리는 공고도 체크포인트에 저장 (완료된 단위의 공고가 재개 후 사라지지 않도록)
+"""
+
+import json
+import os
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from crawl_metrics import CrawlMetrics
+from dedup import NearDuplicateIndex
+from job_store import JobStore, job_key
+from seen_index import SeenIndex
+
+# 상세 수집 대상 출처 (sources.py 어댑터 이름, 순서 = 수집 순서)
+SOURCES = ('사람인', '잡코리아', '원티드')
+
+
+class OnlineAnalyzer:
+    """공고 하나씩 받아 analyze_detailed_jobs와 같은 결과를 누적 계산"""
+
+    def __init__(self, extract_tech_stack, sample_size: int = 5):
+        self.extract_tech_stack = extract_tech_stack
+        self.sample_size = sample_size
+        self.total = 0
+        self.with_details = 0
+        self.by_source = Counter()
+        self.techs = Counter()
+        self.qual_techs = Counter()
+        self.companies = Counter()
+        self.experience = Counter()
+        self.samples = []  # 리포트용 자격요건 샘플
+
+    def update(self, job: Dict):
+        self.total += 1
+        self.by_source[job.get('source', '')] += 1
+        self.techs.update(job.get('detail_tech_stack', []))
+        self.qual_techs.update(job.get('qualification_tech_stack', []))
+        if job.get('company'):
+            self.companies[job['company']] += 1
+        if job.get('experience_years'):
+            self.experience[job['experience_years']] += 1
+        if job.get('qualifications') or job.get('full_description'):
+            self.with_details += 1
+        if job.get('qualifications') and len(self.samples) < self.sample_size:
+            self.samples.append(job)
+
+    def result(self) -> Dict:
+        return {
+            'total_jobs': self.total,
+            'jobs_with_details': self.with_details,
+            'by_source': dict(self.by_source),
+            'tech_frequency': dict(self.techs.most_common(40)),
+            'qualification_tech_frequency': dict(self.qual_techs.most_common(30)),
+            'top_companies': self.companies.most_common(20),
+            'experience_distribution': self.experience.most_common(10),
+        }
+
+
+class Checkpoint:
+    """파이프라인 진행 상태 (JSON 파일, 원자적으로 교체 저장)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.state = {'jobs_path': None, 'run_id': None, 'started_at': None, 'done_units': [],
+                      'partial_sources': [], 'retry_jobs': [], 'finished': False}
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                self.state.update(json.load(f))
+
+    @property
+    def resumable(self) -> bool:
+        return bool(self.state['jobs_path']) and not self.state['finished']
+
+    def is_done(self, keyword: str, source: str) -> bool:
+        return [keyword, source] in self.state['done_units']
+
+    def mark_done(self, keyword: str, source: str):
+        self.state['done_units'].append([keyword, source])
+        self.save()
+
+    def save(self):
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+
+# ----------------------------------------------------------------------
+# 단계별 제너레이터
+# ----------------------------------------------------------------------
+
+def iter_listings(crawler, keywords: List[str], saramin_pages: int, wanted_limit: int,
+                  checkpoint: Checkpoint, seen_index: Optional[SeenIndex] = None,
+                  sources: Iterable[str] = SOURCES) -> Iterator[Tuple[str, str, List[Dict]]]:
+    """(키워드, 출처, 목록) 단위로 목록 수집 - 체크포인트에서 완료된 단위는 건너뜀
+
+    saramin_pages는 페이지 단위 출처(사람인, 잡코리아) 공통 페이지 수, wanted_limit은 원티드 API 건수
+    """
+    for keyword in keywords:
+        for source in sources:
+            if checkpoint.is_done(keyword, source):
+                print(f"[{source}] '{keyword}' 체크포인트에서 완료됨 → 건너뜀")
+                continue
+            jobs = crawler.crawl_list(source, keyword, pages=saramin_pages, limit=wanted_limit, seen_index=seen_index)
+            yield keyword, source, jobs
+
+
+def iter_batches(jobs: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    batch = []
+    for job in jobs:
+        batch.append(job)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def iter_unique(jobs: Iterable[Dict], index: NearDuplicateIndex) -> Iterator[Dict]:
+    """유사 중복 제거 (정규화 회사명 + MinHash/LSH) - 상세 요청 전에 걸러서 중복 공고는 요청하지 않음"""
+    for job in jobs:
+        if not job.get('company') or index.add(job) is not None:
+            continue
+        yield job
+
+
+def iter_details(crawler, jobs: Iterable[Dict], batch_size: int,
+                 seen_index: Optional[SeenIndex] = None) -> Iterator[Dict]:
+    """배치 단위 병렬 상세 수집 (seen_index가 있으면 변경 없는 공고는 저장된 상세 재사용)
+
+    상세 요청이 실패해 재시도 큐에 들어간 공고는 넘기지 않음 (run_pipeline 끝에서 재시도 후 기록)
+    """
+    for batch in iter_batches(jobs, batch_size):
+        to_fetch = seen_index.split_for_details(batch) if seen_index else batch
+        crawler.fetch_details(to_fetch)
+        for job in batch:
+            if not crawler.is_pending_retry(job):
+                yield job
+
+
+def iter_extract(crawler, jobs: Iterable[Dict], metrics: Optional[CrawlMetrics] = None) -> Iterator[Dict]:
+    """자격요건+우대사항 기술 추출 (분석 단계에서 다시 추출하지 않도록 공고에 저장)"""
+    for job in jobs:
+        start = time.perf_counter()
+        qual_text = f"{job.get('qualifications', '')} {job.get('preferred', '')}"
+        job['qualification_tech_stack'] = crawler.extract_tech_stack(qual_text)
+        if metrics is not None:
+            metrics.add_stage('extract', time.perf_counter() - start)
+        yield job
+
+
+# ----------------------------------------------------------------------
+# 실행
+# ----------------------------------------------------------------------
+
+def _restore(jobs_path: str, analyzer: OnlineAnalyzer, dedup_index: NearDuplicateIndex, written_keys: set):
+    """중단된 실행의 JSONL을 다시 읽어 분석 카운터/중복 제거 상태 복원"""
+    with open(jobs_path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                job = json.loads(line)
+            except json.JSONDecodeError:
+                break  # 쓰다 만 마지막 줄
+            analyzer.update(job)
+            dedup_index.add(job)
+            written_keys.add(job_key(job))
+
+
+def run_pipeline(crawler, keywords: List[str], output_dir: str, saramin_pages: int = 3, wanted_limit: int = 30,
+                 batch_size: int = 20, seen_index: Optional[SeenIndex] = None,
+                 store: Optional[JobStore] = None, resume: bool = True, sources: Iterable[str] = SOURCES,
+                 metrics: Optional[CrawlMetrics] = None) -> Tuple[Dict, OnlineAnalyzer, str]:
+    """파이프라인 실행 → (분석 결과, analyzer, JSONL 경로)
+
+    sources: 수집할 출처 (기본 전체), metrics: 추출/저장 단계 시간을 기록할 CrawlMetrics
+    """
+    metrics = metrics or CrawlMetrics()
+    checkpoint = Checkpoint(os.path.join(output_dir, 'pipeline_checkpoint.json'))
+    analyzer = OnlineAnalyzer(crawler.extract_tech_stack)
+    dedup_index = NearDuplicateIndex()
+    written_keys = set()
+
+    if resume and checkpoint.resumable and os.path.exists(checkpoint.state['jobs_path']):
+        jobs_path = checkpoint.state['jobs_path']
+        _restore(jobs_path, analyzer, dedup_index, written_keys)
+        if seen_index and checkpoint.state['started_at']:
+            seen_index.resume_run(checkpoint.state['started_at'], checkpoint.state['partial_sources'])
+        # 완료된 단위에서 상세 재시도를 기다리던 공고 → 다시 재시도 큐로 (다른 키워드 목록에서 또 나와도 건너뜀)
+        retry_jobs = checkpoint.state['retry_jobs']
+        for job in retry_jobs:
+            dedup_index.add(job)
+            written_keys.add(job_key(job))
+        crawler.requeue(retry_jobs)
+        print(f"♻️  체크포인트에서 재개: {jobs_path} ({analyzer.total}개 기록됨, 상세 재시도 대기 {len(retry_jobs)}개)")
+    else:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        jobs_path = os.path.join(output_dir, f"jobs_{timestamp}.jsonl")
+        started_at = seen_index.run_started if seen_index else time.time()
+        checkpoint.state = {'jobs_path': jobs_path, 'run_id': None, 'started_at': started_at, 'done_units': [],
+                            'partial_sources': [], 'retry_jobs': [], 'finished': False}
+        if store is not None:
+            checkpoint.state['run_id'] = store.start_run(label=timestamp)
+        checkpoint.save()
+
+    run_id = checkpoint.state['run_id']
+    if store is not None and run_id is None:
+        run_id = checkpoint.state['run_id'] = store.start_run()
+        checkpoint.save()
+
+    def write_batch(batch: List[Dict]):
+        with metrics.stage('write'):
+            for job in batch:
+                out.write(json.dumps(job, ensure_ascii=False) + '\n')
+                written_keys.add(job_key(job))
+                analyzer.update(job)
+            out.flush()
+            if store is not None:
+                store.upsert_jobs(batch, run_id)
+            if seen_index:
+                seen_index.record(batch)
+
+    with open(jobs_path, 'a', encoding='utf-8') as out:
+        for keyword, source, listing in iter_listings(crawler, keywords, saramin_pages, wanted_limit,
+                                                      checkpoint, seen_index, sources):
+            pending = (job for job in listing if job_key(job) not in written_keys)
+            unique = iter_unique(pending, dedup_index)
+            detailed = iter_details(crawler, unique, batch_size, seen_index)
+
+            for batch in iter_batches(iter_extract(crawler, detailed, metrics), batch_size):
+                write_batch(batch)
+
+            # 출처 단위 완료 기록 (중단 후 재실행 시 이 단위는 목록 요청부터 생략)
+            if seen_index:
+                seen_index.record(listing)
+                checkpoint.state['partial_sources'] = sorted(seen_index.partial_sources)
+            checkpoint.state['retry_jobs'] = crawler.pending_retries()
+            checkpoint.mark_done(keyword, source)
+            print(f"[{source}] '{keyword}' 완료 - 누적 {analyzer.total}개 기록")
+
+        # 429/5xx/차단기로 실패한 상세는 마지막에 한 번 더 요청 (끝내 실패해도 목록 정보로 기록)
+        retried = crawler.retry_failed()
+        for batch in iter_batches(iter_extract(crawler, retried, metrics), batch_size):
+            write_batch(batch)
+            if seen_index:
+                seen_index.store_details(batch)
+
+    print(f"🧹 유사 중복 제거: {dedup_index.stats['duplicates']}개 (출처 간 {dedup_index.stats['cross_source']}개)")
+    if store is not None:
+        store.finish_run(run_id)
+    checkpoint.state['finished'] = True
+    checkpoint.save()
+    return analyzer.result(), analyzer, jobs_path
@@ -0,0 +1,121 @@
+"""
+자격요건 구조화 추출 - 경력 연차/학력/연봉을 숫자 컬럼으로 변환
+
+필드마다 대안 패턴을 이름 있는 그룹으로 합친 정규식 하나를 미리 컴파일해 한 번의 finditer로 처리
+- 경력: '3년 이상', '경력5년↑', '3~7년', '5년차', '5+ years', '3-5 years', '3 to 5 years', '신입', '경력무관' → min_years / max_years
+- 학력: 고졸/초대졸/대졸/석사/박사/학력무관 → education_level (0=무관, 1=고졸, 2=초대졸, 3=대졸, 4=석사, 5=박사)
+- 연봉: '4,000~6,000만원', '3500만원 이상', '1.2억', '월 300만원' → salary_min / salary_max (연 기준 만원)
+
+입력은 목록 조건(사람인 '경력5년↑·대졸↑' 등) + 상세의 경력/학력/연봉 + 자격요건 텍스트
+우대사항은 필수 조건이 아니므로 제외
+"""
+
+import re
+from typing import Dict, Optional, Tuple
+
+EXPERIENCE_RE = re.compile(
+    r'(?P<range_min>(?<!\d)\d{1,2})\s*(?:년)?\s*[~\-–]\s*(?P<range_max>\d{1,2})\s*년(?!\d)'
+    r'|(?P<min>(?<![\d.])\d{1,2})\s*년\s*(?:차\s*)?(?:이상|↑|초과)'
+    r'|(?P<max>(?<![\d.])\d{1,2})\s*년\s*(?:차\s*)?(?:이하|미만|↓)'
+    r'|(?P<nth>(?<![\d.])\d{1,2})\s*년차'
+    r'|(?:경력\s*)(?P<career>\d{1,2})\s*년(?!\s*[~\-–])'
+    r'|(?P<en_range_min>(?<![\d.])\d{1,2})\s*(?:[~\-–]|to)\s*(?P<en_range_max>\d{1,2})\s*\+?\s*years?'
+    r'|(?P<en_min>(?<![\d.])\d{1,2})\s*\+?\s*years?'
+    r'|(?P<any>경력\s*무관|신입\s*[·/,]?\s*경력|신입)',
+    re.IGNORECASE,
+)
+
+EDUCATION_LEVELS = {'학력무관': 0, '고졸': 1, '초대졸': 2, '대졸': 3, '석사': 4, '박사': 5}
+EDUCATION_RE = re.compile(
+    r'(?P<학력무관>학력\s*무관)'
+    r'|(?P<박사>박사)'
+    r'|(?P<석사>석사)'
+    r'|(?P<초대졸>초대졸|전문\s*학사|전문대|2,?3년제)'
+    r'|(?P<대졸>대졸|학사|4년제|대학교\s*졸업|bachelor)'
+    r'|(?P<고졸>고졸|고등학교\s*졸업)',
+    re.IGNORECASE,
+)
+
+_AMOUNT = r'\d[\d,]*(?:\.\d+)?'
+SALARY_RE = re.compile(
+    rf'(?P<monthly>월(?:급)?\s*)?'
+    rf'(?:(?P<lo>{_AMOUNT})\s*(?P<lo_unit>억|만\s*원|만)?\s*[~\-–]\s*(?P<hi>{_AMOUNT})\s*(?P<hi_unit>억|만\s*원|만)'
+    rf'|(?P<single>{_AMOUNT})\s*(?P<single_unit>억|만\s*원)\s*(?P<cmp>이상|이하|미만)?)'
+)
+
+
+def parse_experience(text: str) -> Tuple[Optional[int], Optional[int]]:
+    """경력 요구 범위 (min_years, max_years) - 못 찾으면 None"""
+    minimums, maximums = [], []
+    for match in EXPERIENCE_RE.finditer(text or ''):
+        group = match.lastgroup
+        if group in ('range_max', 'en_range_max'):
+            low, high = int(match.group(group.replace('max', 'min'))), int(match.group(group))
+            if low <= high:
+                minimums.append(low)
+                maximums.append(high)
+        elif group in ('min', 'nth', 'career', 'en_min'):
+            minimums.append(int(match.group(group)))
+        elif group == 'max':
+            minimums.append(0)
+            maximums.append(int(match.group('max')))
+        elif group == 'any':
+            minimums.append(0)
+    return (min(minimums) if minimums else None), (max(maximums) if maximums else None)
+
+
+def parse_education(text: str) -> Optional[int]:
+    """최소 학력 수준 - 여러 개 나오면 가장 낮은 수준 ('학사 이상, 석사 우대' → 대졸)"""
+    levels = [EDUCATION_LEVELS[match.lastgroup] for match in EDUCATION_RE.finditer(text or '')]
+    return min(levels) if levels else None
+
+
+def _to_manwon(amount: str, unit: Optional[str]) -> int:
+    value = float(amount.replace(',', ''))
+    if unit == '억':
+        value *= 10000
+    elif not unit and value >= 100000:  # 단위 없이 원 단위로 쓴 경우
+        value /= 10000
+    return int(value)
+
+
+def parse_salary(text: str) -> Tuple[Optional[int], Optional[int]]:
+    """연봉 범위 (salary_min, salary_max), 연 기준 만원 - '회사내규에 따름' 등은 None"""
+    for match in SALARY_RE.finditer(text or ''):
+        factor = 12 if match.group('monthly') else 1
+        if match.group('hi'):
+            hi_unit = match.group('hi_unit')
+            low = _to_manwon(match.group('lo'), match.group('lo_unit') or hi_unit) * factor
+            high = _to_manwon(match.group('hi'), hi_unit) * factor
+            return low, high
+        amount = _to_manwon(match.group('single'), match.group('single_unit')) * factor
+        if match.group('cmp') in ('이하', '미만'):
+            return None, amount
+        if match.group('cmp') == '이상':
+            return amount, None
+        return amount, amount
+    return None, None
+
+
+def experience_label(min_years: Optional[int], max_years: Optional[int]) -> str:
+    """경력 분포 집계용 표기 ('3~7년', '5년 이상', '3년 이하', '신입 가능')"""
+    if min_years is None:
+        return ''
+    if max_years is not None:
+        return f"{min_years}~{max_years}년" if min_years else f"{max_years}년 이하"
+    return f"{min_years}년 이상" if min_years else '신입 가능'
+
+
+def extract_requirements(job: Dict) -> Dict:
+    """공고 dict → 구조화 필드 (min_years, max_years, education_level, salary_min, salary_max)"""
+    conditions = ' '.join(job.get('conditions') or [])
+    experience_text = f"{conditions} {job.get('experience_years', '')} {job.get('qualifications', '')}"
+    min_years, max_years = parse_experience(experience_text)
+    salary_min, salary_max = parse_salary(f"{job.get('salary', '')} {conditions}")
+    return {
+        'min_years': min_years,
+        'max_years': max_years,
+        'education_level': parse_education(f"{conditions} {job.get('education', '')} {job.get('qualifications', '')}"),
+        'salary_min': salary_min,
+        'salary_max': salary_max,
+    }
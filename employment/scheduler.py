@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+정기 크롤링 데몬 - 설정 파일(JSON)의 키워드/출처로 cron 일정마다 상세 크롤링(crawler_detailed.run_crawl) 실행
+
+- 일정: cron 5필드 (분 시 일 월 요일, '*', '*/n', 'a/n', 'a-b', 'a-b/n', 'a,b' 지원), 예: "0 */6 * * *" = 6시간마다 정각
+- 지표: 실행마다 단계별 시간/요청 지연 히스토그램/출처별 오류·바이트를 Prometheus 텍스트로
+  metrics_file에 기록하고, metrics_port를 주면 http://host:port/metrics 로도 노출
+- 프로파일: profile이 'cprofile'이면 실행마다 .prof + 누적 시간 상위 함수 텍스트,
+  'pyinstrument'면 HTML 리포트를 profile_dir에 저장 (pyinstrument 미설치 시 cProfile 사용)
+  cProfile은 실행 중 생긴 작업 스레드(상세 페이지 요청 등)도 스레드별로 프로파일링해 합산, pyinstrument는 메인 스레드만
+
+사용법:
+  python scheduler.py --config scheduler_config.json        # 데몬, Ctrl+C / SIGTERM으로 종료 (예시: scheduler_config.example.json)
+  python scheduler.py --config scheduler_config.json --once # 지금 한 번만 실행
+"""
+
+import argparse
+import cProfile
+import io
+import json
+import os
+import pstats
+import signal
+import sys
+import threading
+import time
+import traceback
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Set
+
+from crawl_metrics import CrawlMetrics
+from crawler_detailed import DEFAULT_KEYWORDS, DEFAULT_OUTPUT_DIR, run_crawl
+from pipeline import SOURCES
+
+DEFAULT_CONFIG = {
+    'keywords': DEFAULT_KEYWORDS,
+    'sources': list(SOURCES),
+    'schedule': '0 */6 * * *',
+    'output_dir': DEFAULT_OUTPUT_DIR,
+    'saramin_pages': 3,
+    'wanted_limit': 200,
+    'batch_size': 20,
+    'max_workers': 8,
+    'per_host': 4,
+    'min_interval': 0.1,
+    'metrics_file': None,       # None이면 output_dir/crawler.prom
+    'metrics_port': None,
+    'profile': None,            # None | 'cprofile' | 'pyinstrument'
+    'profile_dir': None,        # None이면 output_dir/profiles
+}
+
+# cron 필드별 (최솟값, 최댓값)
+CRON_FIELDS = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 6)]
+
+
+def load_config(path: Optional[str]) -> Dict:
+    """설정 파일을 읽어 기본값 위에 덮어씀 (모르는 키는 오류)"""
+    config = dict(DEFAULT_CONFIG)
+    if path:
+        with open(path, encoding='utf-8') as f:
+            user_config = json.load(f)
+        unknown = set(user_config) - set(DEFAULT_CONFIG)
+        if unknown:
+            raise ValueError(f"알 수 없는 설정 키: {', '.join(sorted(unknown))}")
+        config.update(user_config)
+
+    unknown_sources = set(config['sources']) - set(SOURCES)
+    if unknown_sources:
+        raise ValueError(f"알 수 없는 출처: {', '.join(sorted(unknown_sources))} (가능: {', '.join(SOURCES)})")
+    config['metrics_file'] = config['metrics_file'] or os.path.join(config['output_dir'], 'crawler.prom')
+    config['profile_dir'] = config['profile_dir'] or os.path.join(config['output_dir'], 'profiles')
+    return config
+
+
+class CronSchedule:
+    """cron 5필드 일정 (분 시 일 월 요일, 요일 0=일요일, 7도 일요일)"""
+
+    def __init__(self, expr: str):
+        fields = expr.split()
+        if len(fields) != 5:
+            raise ValueError(f"cron 식은 5필드여야 함: {expr!r}")
+        self.expr = expr
+        self.minutes, self.hours, self.days, self.months, self.weekdays = (
+            self._parse(field, low, high) for field, (low, high) in zip(fields, CRON_FIELDS)
+        )
+        # cron 규칙: 일/요일이 둘 다 지정되면 둘 중 하나만 맞아도 실행
+        self.day_any = fields[2] == '*'
+        self.weekday_any = fields[4] == '*'
+
+    @staticmethod
+    def _parse(field: str, low: int, high: int) -> Set[int]:
+        values = set()
+        for part in field.split(','):
+            part, _, step = part.partition('/')
+            if part == '*':
+                start, end = low, high
+            elif '-' in part:
+                start, end = map(int, part.split('-'))
+            else:
+                start = end = int(part)
+                if step:  # 'a/n' = a부터 최댓값까지 n 간격
+                    end = high
+            if high == 6 and end == 7:  # 요일 7 = 일요일
+                values.add(0)
+                if start == 7:
+                    continue
+                end = 6
+            if start < low or end > high or start > end:
+                raise ValueError(f"cron 필드 범위 오류: {field!r}")
+            values.update(range(start, end + 1, int(step) if step else 1))
+        return values
+
+    def _day_matches(self, dt: datetime) -> bool:
+        day = dt.day in self.days
+        weekday = (dt.isoweekday() % 7) in self.weekdays
+        if self.day_any or self.weekday_any:
+            return day and weekday
+        return day or weekday
+
+    def next_after(self, dt: datetime) -> datetime:
+        """dt 이후(dt 제외) 처음으로 일정에 맞는 시각 (분 단위)"""
+        t = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = t + timedelta(days=366 * 5)
+        while t < limit:
+            if t.month not in self.months:
+                t = (t.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self._day_matches(t):
+                t = t.replace(hour=0, minute=0) + timedelta(days=1)
+            elif t.hour not in self.hours:
+                t = t.replace(minute=0) + timedelta(hours=1)
+            elif t.minute not in self.minutes:
+                t += timedelta(minutes=1)
+            else:
+                return t
+        raise ValueError(f"일정에 맞는 시각이 없음: {self.expr!r}")
+
+
+class RunProfiler:
+    """실행 하나를 프로파일링해 profile_dir에 저장 (with 문으로 사용)"""
+
+    def __init__(self, kind: str, profile_dir: str, top: int = 30):
+        self.kind = kind
+        self.profile_dir = profile_dir
+        self.top = top
+        self.paths = []
+        self._thread_profiles = []
+        self._lock = threading.Lock()
+        if kind == 'pyinstrument':
+            try:
+                import pyinstrument
+                self._profiler = pyinstrument.Profiler()
+            except ImportError:
+                print("⚠️  pyinstrument 미설치 → cProfile 사용 (pip install pyinstrument)")
+                self.kind = 'cprofile'
+        if self.kind == 'cprofile':
+            self._profiler = cProfile.Profile()
+
+    def _profile_thread(self, *_):
+        """새 스레드의 첫 이벤트에서 호출 - 그 스레드 전용 cProfile을 켬 (이후 이 훅은 대체됨)"""
+        profile = cProfile.Profile()
+        with self._lock:
+            self._thread_profiles.append(profile)
+        profile.enable()
+
+    def __enter__(self):
+        if self.kind == 'pyinstrument':
+            self._profiler.start()
+        else:
+            # 3.12 미만의 cProfile은 enable()한 스레드만 기록 → 이후 시작되는 스레드마다 따로 켜고 끝날 때 합산
+            # (3.12부터는 sys.monitoring 기반이라 한 번 켜면 모든 스레드가 기록됨)
+            if sys.version_info < (3, 12):
+                threading.setprofile(self._profile_thread)
+            self._profiler.enable()
+        return self
+
+    def __exit__(self, *exc):
+        os.makedirs(self.profile_dir, exist_ok=True)
+        base = os.path.join(self.profile_dir, f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        if self.kind == 'pyinstrument':
+            self._profiler.stop()
+            path = base + '.html'
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(self._profiler.output_html())
+            self.paths = [path]
+        else:
+            self._profiler.disable()
+            threading.setprofile(None)
+            text = io.StringIO()
+            stats = pstats.Stats(self._profiler, stream=text)
+            with self._lock:
+                for profile in self._thread_profiles:
+                    stats.add(profile)
+            stats.dump_stats(base + '.prof')
+            stats.sort_stats('cumulative').print_stats(self.top)
+            with open(base + '.txt', 'w', encoding='utf-8') as f:
+                f.write(text.getvalue())
+            self.paths = [base + '.prof', base + '.txt']
+        return False
+
+
+class CrawlScheduler:
+    def __init__(self, config: Dict, metrics: Optional[CrawlMetrics] = None):
+        self.config = config
+        self.schedule = CronSchedule(config['schedule'])
+        self.metrics = metrics or CrawlMetrics()
+        self._stop = threading.Event()
+
+    def stop(self, *_):
+        """다음 대기에서 종료 (실행 중인 크롤링은 끝까지 진행)"""
+        if not self._stop.is_set():
+            print("\n🛑 종료 요청 - 진행 중인 실행이 끝나면 종료")
+        self._stop.set()
+
+    def run_once(self) -> bool:
+        """크롤링 1회 실행 + 지표 파일 갱신 → 성공 여부"""
+        config = self.config
+        os.makedirs(config['output_dir'], exist_ok=True)
+        print("=" * 70)
+        print(f"🔍 정기 크롤링 시작 ({datetime.now():%Y-%m-%d %H:%M}) - 키워드 {len(config['keywords'])}개, "
+              f"출처 {', '.join(config['sources'])}")
+        print("=" * 70)
+
+        start = time.perf_counter()
+        ok, jobs = True, 0
+        profiler = RunProfiler(config['profile'], config['profile_dir']) if config['profile'] else None
+        try:
+            with profiler or nullcontext():
+                result = run_crawl(
+                    config['keywords'], config['output_dir'], sources=config['sources'],
+                    saramin_pages=config['saramin_pages'], wanted_limit=config['wanted_limit'],
+                    batch_size=config['batch_size'], metrics=self.metrics,
+                    max_workers=config['max_workers'], per_host=config['per_host'],
+                    min_interval=config['min_interval'],
+                )
+            jobs = result['total_jobs']
+        except Exception:
+            ok = False
+            traceback.print_exc()
+        if profiler:
+            print(f"🔬 프로파일 저장: {', '.join(profiler.paths)}")
+
+        elapsed = time.perf_counter() - start
+        self.metrics.record_run(ok, elapsed, jobs)
+        self.metrics.write(config['metrics_file'])
+        status = '✅ 완료' if ok else '❌ 실패'
+        print(f"{status} ({elapsed:.1f}초, 공고 {jobs}개) - 지표: {config['metrics_file']}")
+        return ok
+
+    def run_forever(self):
+        """cron 일정마다 run_once 반복 (SIGTERM/SIGINT로 종료)"""
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        if self.config['metrics_port']:
+            self.metrics.serve(self.config['metrics_port'])
+            print(f"📈 지표 엔드포인트: http://0.0.0.0:{self.config['metrics_port']}/metrics")
+
+        while not self._stop.is_set():
+            next_run = self.schedule.next_after(datetime.now())
+            print(f"⏰ 다음 실행: {next_run:%Y-%m-%d %H:%M} ({self.schedule.expr})")
+            # 시스템 시계가 바뀌어도 크게 어긋나지 않도록 최대 60초씩 나눠서 대기
+            while not self._stop.is_set():
+                remaining = (next_run - datetime.now()).total_seconds()
+                if remaining <= 0:
+                    break
+                self._stop.wait(min(remaining, 60))
+            if not self._stop.is_set():
+                self.run_once()
+        print("👋 스케줄러 종료")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='정기 크롤링 데몬 (cron 일정 + Prometheus 지표)')
+    parser.add_argument('--config', help='설정 파일 (JSON, 없으면 기본값)')
+    parser.add_argument('--once', action='store_true', help='일정과 관계없이 지금 한 번만 실행')
+    parser.add_argument('--schedule', help='cron 식 (설정 파일 값 대신 사용)')
+    parser.add_argument('--metrics-port', type=int, help='지표 HTTP 포트 (설정 파일 값 대신 사용)')
+    parser.add_argument('--profile', choices=['cprofile', 'pyinstrument'], help='실행마다 프로파일 저장')
+    args = parser.parse_args()
+
+    config = load_config(args.config)
+    for key in ('schedule', 'metrics_port', 'profile'):
+        if getattr(args, key) is not None:
+            config[key] = getattr(args, key)
+
+    scheduler = CrawlScheduler(config)
+    if args.once:
+        raise SystemExit(0 if scheduler.run_once() else 1)
+    scheduler.run_forever()
+
+
+if __name__ == '__main__':
+    main()
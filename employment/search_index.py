@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+공고 검색 인덱스 - 제목/자격요건/우대사항/주요업무 역색인(SQLite) + BM25 순위 + 패싯 필터
+
+- 토큰화: 영문/숫자는 단어 단위(kafka, c++, node.js), 한글은 글자 2-gram ('데이터' → 데이, 이터)
+  → 띄어쓰기/조사가 달라도 ('데이터엔지니어', '데이터 엔지니어를') 같은 토큰으로 매칭
+- 제목 토큰은 가중치 3 (BM25F 단순화), 점수 계산은 SQL 집계 한 번으로 처리
+- 검색어의 모든 토큰을 포함한 공고만 반환 (없으면 일부만 포함한 공고로 완화)
+- 패싯: 출처, 회사(정규화 회사명 앞부분 일치, '토스' → 토스뱅크/토스페이먼츠), 기술스택, 요구 경력
+- 증분 갱신: JobStore에서 마지막 동기화 이후 실행에 등장한 공고만 읽고, 내용 해시가 같으면 건너뜀
+
+사용법:
+    python search_index.py sync [--db jobs.sqlite]                 # 크롤링 후 증분 색인
+    python search_index.py import jobs_full_*.json jobs_*.jsonl    # 파일에서 색인
+    python search_index.py search kafka --company 토스 --max-years 5 [--tech Kafka] [--source 사람인]
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import re
+import sqlite3
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from dedup import normalize_company
+from requirement_extractor import experience_label, extract_requirements
+
+DEFAULT_INDEX = 'search_index.sqlite'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    doc_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_key TEXT NOT NULL UNIQUE,
+    source TEXT NOT NULL,
+    company TEXT NOT NULL DEFAULT '',
+    company_key TEXT NOT NULL DEFAULT '',
+    title TEXT NOT NULL DEFAULT '',
+    link TEXT,
+    min_years INTEGER,
+    max_years INTEGER,
+    length INTEGER NOT NULL,
+    content_hash TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_docs_source ON docs(source);
+
+CREATE TABLE IF NOT EXISTS terms (
+    term TEXT NOT NULL,
+    doc_id INTEGER NOT NULL,
+    tf INTEGER NOT NULL,
+    PRIMARY KEY (term, doc_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_terms_doc ON terms(doc_id);
+
+CREATE TABLE IF NOT EXISTS doc_techs (
+    tech TEXT NOT NULL,
+    doc_id INTEGER NOT NULL,
+    PRIMARY KEY (tech, doc_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value
+);
+"""
+
+# 색인 필드와 가중치 (원티드 이전 JSON의 상세 dict 섹션 이름 포함)
+FIELD_WEIGHTS = {'title': 3, 'qualifications': 1, 'preferred': 1, 'responsibilities': 1}
+WANTED_SECTIONS = {'qualifications': 'requirements', 'preferred': 'preferred_points',
+                   'responsibilities': 'main_tasks'}
+
+TOKEN_RE = re.compile(r'[a-z0-9][a-z0-9+#.]*|[가-힣]+')
+
+# BM25 파라미터
+K1 = 1.2
+B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    """영문/숫자 단어 + 한글 글자 2-gram (한 글자 한글은 그대로)"""
+    tokens = []
+    for word in TOKEN_RE.findall((text or '').lower()):
+        if word[0] < '가':
+            tokens.append(word.rstrip('.'))
+        elif len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def _field_texts(job: Dict) -> Dict[str, str]:
+    detail = job.get('full_description')
+    texts = {}
+    for field in FIELD_WEIGHTS:
+        value = job.get(field) or ''
+        if not value and isinstance(detail, dict) and field in WANTED_SECTIONS:
+            value = detail.get(WANTED_SECTIONS[field]) or ''
+        texts[field] = value
+    return texts
+
+
+def _int_or_none(value) -> Optional[int]:
+    return None if value is None or value == '' else int(value)
+
+
+class SearchIndex:
+    def __init__(self, path: str = DEFAULT_INDEX):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    # ------------------------------------------------------------------
+    # 색인
+    # ------------------------------------------------------------------
+
+    def index_jobs(self, jobs: Iterable[Dict]) -> Counter:
+        """공고 색인 (한 트랜잭션) → {'added', 'updated', 'unchanged'} 개수 (job_key가 있으면 그대로 사용)"""
+        from job_store import job_key
+
+        counts = Counter()
+        with self.conn:
+            for job in jobs:
+                key = job.get('job_key') or job_key(job)
+                texts = _field_texts(job)
+                techs = sorted(set(job.get('detail_tech_stack') or []))
+                # 구조화 필드가 없는 이전 JSON은 여기서 추출 (JobStore.upsert_jobs와 같은 방식)
+                requirements = job if 'min_years' in job else extract_requirements({**job, **texts})
+                min_years = _int_or_none(requirements.get('min_years'))
+                max_years = _int_or_none(requirements.get('max_years'))
+                content_hash = hashlib.sha1(json.dumps(
+                    [job.get('company', ''), job.get('link', ''), texts, techs, min_years, max_years],
+                    ensure_ascii=False,
+                ).encode('utf-8')).hexdigest()
+
+                row = self.conn.execute("SELECT doc_id, content_hash FROM docs WHERE job_key = ?", (key,)).fetchone()
+                if row and row[1] == content_hash:
+                    counts['unchanged'] += 1
+                    continue
+
+                tf = Counter()
+                for field, text in texts.items():
+                    for token in tokenize(text):
+                        tf[token] += FIELD_WEIGHTS[field]
+                values = (job.get('source', ''), job.get('company', ''), normalize_company(job.get('company', '')),
+                          job.get('title', ''), job.get('link', ''), min_years, max_years,
+                          sum(tf.values()), content_hash)
+
+                if row:
+                    doc_id = row[0]
+                    self.conn.execute("DELETE FROM terms WHERE doc_id = ?", (doc_id,))
+                    self.conn.execute("DELETE FROM doc_techs WHERE doc_id = ?", (doc_id,))
+                    self.conn.execute(
+                        """UPDATE docs SET source = ?, company = ?, company_key = ?, title = ?, link = ?,
+                               min_years = ?, max_years = ?, length = ?, content_hash = ? WHERE doc_id = ?""",
+                        (*values, doc_id),
+                    )
+                    counts['updated'] += 1
+                else:
+                    doc_id = self.conn.execute(
+                        """INSERT INTO docs (job_key, source, company, company_key, title, link,
+                                             min_years, max_years, length, content_hash)
+                           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                        (key, *values),
+                    ).lastrowid
+                    counts['added'] += 1
+
+                self.conn.executemany("INSERT INTO terms VALUES (?, ?, ?)",
+                                      [(term, doc_id, count) for term, count in tf.items()])
+                self.conn.executemany("INSERT INTO doc_techs VALUES (?, ?)", [(tech, doc_id) for tech in techs])
+
+            # 문서 수/평균 길이는 검색마다 세지 않도록 저장
+            doc_count, average_length = self.conn.execute("SELECT COUNT(*), AVG(length) FROM docs").fetchone()
+            self._set_meta('doc_count', doc_count)
+            self._set_meta('average_length', average_length or 0)
+        return counts
+
+    def sync(self, store) -> Counter:
+        """JobStore에서 마지막 동기화 이후 실행에 등장한 공고만 색인"""
+        synced_run = self._get_meta('synced_run_id', 0)
+        latest_run = store.latest_run_id() or 0
+        cur = store.conn.execute(
+            """SELECT job_id, job_key, source, company, title, link, qualifications, preferred,
+                      responsibilities, min_years, max_years
+               FROM jobs WHERE last_run_id > ?""",
+            (synced_run,),
+        )
+        columns = [d[0] for d in cur.description]
+        rows = [dict(zip(columns, row)) for row in cur.fetchall()]
+
+        techs = {}
+        for job_id, tech in store.conn.execute(
+            """SELECT t.job_id, t.tech FROM job_techs t JOIN jobs j USING (job_id)
+               WHERE t.scope = 'detail' AND j.last_run_id > ?""",
+            (synced_run,),
+        ):
+            techs.setdefault(job_id, []).append(tech)
+
+        for row in rows:
+            row['detail_tech_stack'] = techs.get(row.pop('job_id'), [])
+
+        counts = self.index_jobs(rows)
+        with self.conn:
+            self._set_meta('synced_run_id', latest_run)
+        return counts
+
+    def _get_meta(self, key: str, default=None):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def _set_meta(self, key: str, value):
+        self.conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, value))
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+
+    def search(self, query: str = '', source: Optional[str] = None, company: Optional[str] = None,
+               tech: Optional[str] = None, max_years: Optional[int] = None, years: Optional[int] = None,
+               limit: int = 20) -> List[Dict]:
+        """BM25 순위 검색 (query가 비면 패싯 필터만, 최근 색인 순)
+
+        max_years: 요구 최소 경력이 이 값 이하인 공고 ('5년 이하 요구')
+        years: 지원자 경력 (min_years <= years <= max_years 인 공고, JobStore.filter_jobs와 같은 의미)
+        """
+        clauses, params = [], []
+        if source:
+            clauses.append("d.source = ?")
+            params.append(source)
+        if company:
+            clauses.append("d.company_key LIKE ?")
+            params.append(f"{normalize_company(company)}%")
+        if tech:
+            clauses.append("d.doc_id IN (SELECT doc_id FROM doc_techs WHERE tech = ? COLLATE NOCASE)")
+            params.append(tech)
+        if max_years is not None:
+            clauses.append("d.min_years <= ?")
+            params.append(max_years)
+        if years is not None:
+            clauses.append("d.min_years <= ? AND (d.max_years IS NULL OR d.max_years >= ?)")
+            params += [years, years]
+
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+            rows = self.conn.execute(
+                f"""SELECT d.doc_id, d.source, d.company, d.title, d.link, d.min_years, d.max_years, 0
+                    FROM docs d {where} ORDER BY d.doc_id DESC LIMIT ?""",
+                (*params, limit),
+            ).fetchall()
+            return [self._result(row) for row in rows]
+
+        results = self._ranked(terms, clauses, params, limit, require_all=True)
+        if not results and len(terms) > 1:
+            results = self._ranked(terms, clauses, params, limit, require_all=False)
+        return results
+
+    def _ranked(self, terms: List[str], clauses: List[str], params: List, limit: int,
+                require_all: bool) -> List[Dict]:
+        doc_count = self._get_meta('doc_count', 0)
+        average_length = self._get_meta('average_length', 0) or 1
+        df = {term: self.conn.execute("SELECT COUNT(*) FROM terms WHERE term = ?", (term,)).fetchone()[0]
+              for term in terms}
+        terms = [term for term in terms if df[term]]
+        if not terms or (require_all and len(terms) < len(df)):
+            return []
+
+        idf = [(term, math.log(1 + (doc_count - df[term] + 0.5) / (df[term] + 0.5))) for term in terms]
+        query_values = ', '.join('(?, ?)' for _ in idf)
+        query_params = [value for pair in idf for value in pair]
+
+        where = list(clauses)
+        extra = []
+        rarest = min(terms, key=df.get)
+        if require_all and len(terms) > 1 and df[rarest] * 10 < doc_count:
+            # 드문 토큰이 있으면 그 토큰을 가진 공고로 후보를 먼저 좁힘 (흔한 토큰이면 오히려 느림)
+            where.append("t.doc_id IN (SELECT doc_id FROM terms WHERE term = ?)")
+            extra.append(rarest)
+        having = "HAVING COUNT(*) = ?" if require_all else ''
+
+        rows = self.conn.execute(
+            f"""WITH q(term, idf) AS (VALUES {query_values})
+                SELECT d.doc_id, d.source, d.company, d.title, d.link, d.min_years, d.max_years,
+                       SUM(q.idf * t.tf * {K1 + 1} / (t.tf + {K1} * ({1 - B} + {B} * d.length / ?))) AS score
+                FROM q JOIN terms t ON t.term = q.term JOIN docs d ON d.doc_id = t.doc_id
+                {f"WHERE {' AND '.join(where)}" if where else ''}
+                GROUP BY d.doc_id {having}
+                ORDER BY score DESC LIMIT ?""",
+            (*query_params, average_length, *params, *extra, *([len(terms)] if require_all else []), limit),
+        ).fetchall()
+        return [self._result(row) for row in rows]
+
+    def _result(self, row: Tuple) -> Dict:
+        doc_id, source, company, title, link, min_years, max_years, score = row
+        return {'doc_id': doc_id, 'source': source, 'company': company, 'title': title, 'link': link,
+                'min_years': min_years, 'max_years': max_years, 'score': round(score, 3)}
+
+    def close(self):
+        self.conn.close()
+
+
+def print_results(results: List[Dict], scored: bool = True, elapsed: Optional[float] = None):
+    """검색 결과 출력 (scored=False면 점수 생략 - 필터만 쓴 검색)"""
+    for result in results:
+        years = ''
+        if result['min_years'] is not None:
+            years = f" | {experience_label(result['min_years'], result['max_years'])}"
+        score = f"[{result['score']:6.2f}] " if scored else ''
+        print(f"  {score}[{result['source']}] {result['company']} | {result['title']}{years}")
+        if result['link']:
+            print(f"           {result['link']}")
+    took = f" ({elapsed * 1000:.1f}ms)" if elapsed is not None else ''
+    print(f"\n{len(results)}개 공고{took}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='공고 검색 인덱스')
+    parser.add_argument('--index', default=DEFAULT_INDEX, help=f'인덱스 경로 (기본: {DEFAULT_INDEX})')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sync_parser = sub.add_parser('sync', help='JobStore DB에서 증분 색인')
+    sync_parser.add_argument('--db', default='jobs.sqlite')
+    import_parser = sub.add_parser('import', help='jobs_full_*.json / jobs_*.jsonl / jobs_*.parquet 색인')
+    import_parser.add_argument('files', nargs='+')
+    search_parser = sub.add_parser('search', help='검색')
+    search_parser.add_argument('query', nargs='*', help='검색어 (생략하면 필터만)')
+    search_parser.add_argument('--source', help='출처 (사람인/원티드/잡코리아)')
+    search_parser.add_argument('--company', help='회사명 (앞부분 일치, 법인 표기 무시)')
+    search_parser.add_argument('--tech', help='기술스택 (예: Kafka)')
+    search_parser.add_argument('--max-years', type=int, help='요구 경력 N년 이하')
+    search_parser.add_argument('--years', type=int, help='내 경력 연차 (지원 가능한 공고)')
+    search_parser.add_argument('--limit', type=int, default=20)
+    args = parser.parse_args()
+
+    index = SearchIndex(args.index)
+    start = time.perf_counter()
+
+    if args.command == 'sync':
+        from job_store import JobStore
+        store = JobStore(args.db)
+        counts = index.sync(store)
+        store.close()
+        print(f"🔎 색인 갱신: 추가 {counts['added']}개 / 변경 {counts['updated']}개 / "
+              f"유지 {counts['unchanged']}개 ({time.perf_counter() - start:.2f}초)")
+    elif args.command == 'import':
+        from batch_analysis import load_corpus
+        parquet_paths = [path for path in args.files if path.endswith('.parquet')]
+        jobs = load_corpus([path for path in args.files if not path.endswith('.parquet')])
+        if parquet_paths:
+            from job_record import read_parquet
+            jobs.extend(read_parquet(parquet_paths).to_pylist())
+        counts = index.index_jobs(jobs)
+        print(f"🔎 색인: 추가 {counts['added']}개 / 변경 {counts['updated']}개 / "
+              f"유지 {counts['unchanged']}개 ({time.perf_counter() - start:.2f}초)")
+    elif args.command == 'search':
+        results = index.search(' '.join(args.query), source=args.source, company=args.company,
+                               tech=args.tech, max_years=args.max_years, years=args.years, limit=args.limit)
+        print_results(results, scored=bool(args.query), elapsed=time.perf_counter() - start)
+
+    index.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,246 @@
+"""
+수집 이력 인덱스 - 이미 본 공고(사람인 rec_idx, 원티드 job_id 등)를 SQLite에 기록해 증분 크롤링
+
+- 목록 단계: 한 페이지의 공고가 모두 이미 본(변경 없는) 공고면 이후 페이지 수집 중단
+- 상세 단계: 신규/변경 공고만 상세 요청, 변경 없는 공고는 저장된 상세 정보 재사용
+  (재사용한 공고는 detail_reused 표시, detail_max_age일이 지난 상세는 다시 요청해 내용 변경을 확인)
+- 실행 결과: 신규/변경/유지/마감 건수 (expire_days 동안 목록에서 안 보인 공고를 마감 처리)
+  마감 처리는 이번 실행에서 모든 키워드를 끝까지 훑은 출처만 (조기 중단한 페이지 뒤의 공고는 안 보였을 뿐이므로)
+  → full_scan_days마다 한 번은 조기 중단 없이 훑어서 마감 공고를 확인
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+# 사이트 어댑터(sources.py) parse_detail이 채우는 필드
+DETAIL_FIELDS = [
+    'qualifications', 'preferred', 'responsibilities', 'benefits', 'salary',
+    'detail_tech_stack', 'experience_years', 'education', 'full_description',
+    'min_years', 'max_years', 'education_level', 'salary_min', 'salary_max',
+]
+
+LINK_ID_PATTERNS = [
+    ('saramin', re.compile(r'rec_idx=(\d+)')),
+    ('jobkorea', re.compile(r'GI_Read/(\d+)')),
+    ('wanted', re.compile(r'/wd/(\d+)')),
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS postings (
+    key TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    detail TEXT,
+    detail_at REAL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    removed_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_postings_source_seen ON postings(source, last_seen);
+
+CREATE TABLE IF NOT EXISTS source_scans (
+    source TEXT PRIMARY KEY,
+    full_scan_at REAL NOT NULL
+);
+"""
+
+
+def posting_key(job: Dict) -> Optional[str]:
+    """출처별 공고 고유 키 ('saramin:52351669', 'wanted:123456' 등)"""
+    if job.get('rec_idx'):
+        return f"saramin:{job['rec_idx']}"
+    if job.get('job_id'):
+        return f"wanted:{job['job_id']}"
+    link = job.get('link', '')
+    for source, pattern in LINK_ID_PATTERNS:
+        match = pattern.search(link)
+        if match:
+            return f"{source}:{match.group(1)}"
+    return None
+
+
+def listing_signature(job: Dict) -> str:
+    """목록에서 보이는 정보(제목/회사/조건)의 해시 - 바뀌면 상세를 다시 수집"""
+    raw = '\x1f'.join([job.get('title', ''), job.get('company', ''), '|'.join(job.get('conditions', []))])
+    return hashlib.md5(raw.encode('utf-8')).hexdigest()
+
+
+def has_detail(job: Dict) -> bool:
+    return bool(job.get('qualifications') or job.get('full_description'))
+
+
+class SeenIndex:
+    def __init__(self, path: str, expire_days: float = 3, detail_max_age: float = 3, full_scan_days: float = 3):
+        self.path = path
+        self.expire_days = expire_days
+        self.detail_max_age = detail_max_age
+        self.full_scan_days = full_scan_days
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+        self.run_started = time.time()
+        self.counts = Counter()
+        self._run_keys = set()
+        self._run_sources = set()
+        self._partial_sources = set()
+
+    def _migrate(self):
+        """이전 버전 DB에 상세 수집 시각 컬럼 추가 (기존 상세는 다음 실행에서 한 번 다시 요청)"""
+        existing = {row[1] for row in self.conn.execute("PRAGMA table_info(postings)")}
+        if 'detail_at' not in existing:
+            with self.conn:
+                self.conn.execute("ALTER TABLE postings ADD COLUMN detail_at REAL")
+
+    def _lookup(self, key: str):
+        return self.conn.execute(
+            "SELECT signature, detail, removed_at, detail_at FROM postings WHERE key = ?", (key,)
+        ).fetchone()
+
+    def status(self, job: Dict) -> str:
+        """'new' / 'changed' / 'unchanged' (키를 알 수 없는 공고는 'new')"""
+        key = posting_key(job)
+        row = self._lookup(key) if key else None
+        if row is None:
+            return 'new'
+        return 'unchanged' if row[0] == listing_signature(job) else 'changed'
+
+    def is_page_known(self, jobs: List[Dict]) -> bool:
+        """페이지의 모든 공고가 이전 실행에서 본 공고이고 변경이 없으면 True (이후 페이지 생략 판단용)
+
+        이번 실행에서 다른 키워드로 처음 본 공고는 제외 - 키워드가 겹친다고 페이지를 건너뛰지 않도록
+        """
+        if not jobs:
+            return False
+        for job in jobs:
+            key = posting_key(job)
+            row = self.conn.execute(
+                "SELECT signature, first_seen FROM postings WHERE key = ?", (key,)
+            ).fetchone() if key else None
+            if row is None or row[0] != listing_signature(job) or row[1] >= self.run_started:
+                return False
+        return True
+
+    def allows_early_stop(self, source: str) -> bool:
+        """출처의 마지막 전체 확인이 full_scan_days 안이면 True (아니면 이번 실행은 조기 중단 없이 훑음)"""
+        row = self.conn.execute("SELECT full_scan_at FROM source_scans WHERE source = ?", (source,)).fetchone()
+        return row is not None and row[0] >= self.run_started - self.full_scan_days * 86400
+
+    def mark_scanned(self, source: str, complete: bool):
+        """목록 수집 한 번(키워드 × 출처)의 결과 - 조기 중단/실패 페이지가 있었으면 그 출처는 마감 처리 제외"""
+        if not complete:
+            self._partial_sources.add(source)
+
+    def resume_run(self, started_at: float, partial_sources: Iterable[str] = ()):
+        """중단된 실행 이어가기 - 원래 시작 시각 기준으로 비교 (중단 전에 처음 본 공고를 이전 실행 것으로 보고 조기 중단하지 않도록)"""
+        self.run_started = started_at
+        self._partial_sources.update(partial_sources)
+
+    @property
+    def partial_sources(self) -> set:
+        """이번 실행에서 조기 중단/실패 페이지가 있었던 출처 (체크포인트 저장용)"""
+        return set(self._partial_sources)
+
+    @property
+    def complete_sources(self) -> set:
+        """이번 실행에서 모든 목록을 끝까지 훑은 출처 (마감 판단 대상)"""
+        return self._run_sources - self._partial_sources
+
+    def cached_detail(self, job: Dict) -> Optional[Dict]:
+        """변경 없는 공고의 저장된 상세 정보 (없거나 detail_max_age일보다 오래됐으면 None)"""
+        key = posting_key(job)
+        row = self._lookup(key) if key else None
+        if row is None or row[0] != listing_signature(job) or not row[1]:
+            return None
+        if not row[3] or row[3] < self.run_started - self.detail_max_age * 86400:
+            return None
+        return json.loads(row[1])
+
+    def split_for_details(self, jobs: List[Dict]) -> List[Dict]:
+        """저장된 상세를 재사용할 수 있는 공고는 채워 넣고(detail_reused 표시), 상세 요청이 필요한 공고만 반환"""
+        to_fetch = []
+        for job in jobs:
+            detail = self.cached_detail(job)
+            if detail is None:
+                to_fetch.append(job)
+            else:
+                job.update(detail)
+                job['detail_reused'] = True
+        return to_fetch
+
+    def record(self, jobs: List[Dict]):
+        """이번 실행에서 본 공고 기록 (신규/변경/유지 집계, 상세 정보 저장)"""
+        now = time.time()
+        for job in jobs:
+            key = posting_key(job)
+            if not key or key in self._run_keys:
+                continue
+            self._run_keys.add(key)
+            source = key.split(':', 1)[0]
+            self._run_sources.add(source)
+
+            status = self.status(job)
+            self.counts[status] += 1
+
+            # 재사용한 상세는 다시 저장하지 않음 (수집 시각이 갱신되면 max age가 의미 없어지므로)
+            detail = detail_at = None
+            if has_detail(job) and not job.get('detail_reused'):
+                detail = json.dumps({f: job[f] for f in DETAIL_FIELDS if f in job}, ensure_ascii=False)
+                detail_at = now
+
+            self.conn.execute(
+                """
+                INSERT INTO postings (key, source, signature, detail, detail_at, first_seen, last_seen, removed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, NULL)
+                ON CONFLICT(key) DO UPDATE SET
+                    detail = CASE WHEN postings.signature = excluded.signature
+                                  THEN COALESCE(excluded.detail, postings.detail)
+                                  ELSE excluded.detail END,
+                    detail_at = CASE WHEN postings.signature = excluded.signature
+                                     THEN COALESCE(excluded.detail_at, postings.detail_at)
+                                     ELSE excluded.detail_at END,
+                    signature = excluded.signature,
+                    last_seen = excluded.last_seen,
+                    removed_at = NULL
+                """,
+                (key, source, listing_signature(job), detail, detail_at, now, now),
+            )
+        self.conn.commit()
+
+    def store_details(self, jobs: List[Dict]):
+        """이미 record한 공고의 상세 정보만 나중에 저장 (실행 끝에 재시도해서 받은 상세)"""
+        now = time.time()
+        for job in jobs:
+            key = posting_key(job)
+            if not key or not has_detail(job):
+                continue
+            detail = json.dumps({f: job[f] for f in DETAIL_FIELDS if f in job}, ensure_ascii=False)
+            self.conn.execute(
+                "UPDATE postings SET detail = ?, detail_at = ? WHERE key = ? AND signature = ?",
+                (detail, now, key, listing_signature(job)),
+            )
+        self.conn.commit()
+
+    def finish_run(self) -> Dict[str, int]:
+        """이번 실행 집계 반환 - 끝까지 훑은 출처에서 expire_days 동안 안 보인 공고는 마감 처리"""
+        expire_before = self.run_started - self.expire_days * 86400
+        removed = 0
+        for source in self.complete_sources:
+            removed += self.conn.execute(
+                "UPDATE postings SET removed_at = ? WHERE source = ? AND last_seen < ? AND removed_at IS NULL",
+                (self.run_started, source, expire_before),
+            ).rowcount
+            self.conn.execute(
+                "INSERT OR REPLACE INTO source_scans (source, full_scan_at) VALUES (?, ?)",
+                (source, self.run_started),
+            )
+        self.conn.commit()
+        self.counts['removed'] = removed
+        return {k: self.counts[k] for k in ('new', 'changed', 'unchanged', 'removed')}
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+스킬셋 매칭 점수 - 내 기술 프로필(기술별 가중치 + 경력 연차)로 저장된 공고를 점수화하고 상위 K개 추천
+
+- 공고마다 자격요건 기술 / 우대사항 기술을 TECH_MATCHER 기술 순서의 비트 벡터로 미리 계산해 보관
+  (np.packbits로 기술 8개당 1바이트, 10만 건이면 기술 72개 × 2종 ≈ 2MB)
+- 점수 = (보유한 자격요건 가중치 + 0.5 × 보유한 우대사항 가중치) / (전체 자격요건 + 0.5 × 전체 우대사항)
+  - 보유 기술은 프로필 가중치, 없는 기술은 1로 계산 → 부족한 필수 기술이 많을수록 점수 하락
+  - 비트 행렬 × 가중치 벡터 행렬곱 한 번으로 전체 공고 점수 계산
+- 경력 보정: 요구 최소 연차보다 부족하면 1년당 20% 감점, 최대 연차를 넘으면 10% 감점
+- 상위 K개는 최소 힙으로 유지 → 새 공고가 들어오면 새 공고만 점수를 매겨 힙 갱신
+
+프로필 (JSON):
+    {"skills": {"Python": 3, "AWS": 2, "Docker": 1}, "years": 3}
+
+사용법:
+    python skill_match.py --profile profile.json [--db jobs.sqlite] [--top 20]
+    python skill_match.py --skills Python:3 AWS:2 Docker --years 3 --files jobs_*.parquet
+"""
+
+import argparse
+import heapq
+import json
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from tech_matcher import load_matcher
+
+PREFERRED_WEIGHT = 0.5
+UNDER_EXPERIENCE_PENALTY = 0.2   # 요구 최소 연차보다 1년 부족할 때마다
+OVER_EXPERIENCE_PENALTY = 0.1    # 요구 최대 연차 초과 시
+SCORE_BLOCK = 16384              # 비트 행렬을 풀어서 계산할 행 단위 (메모리 상한)
+
+# 기술스택 별칭 사전 (크롤러와 같은 사전, 크롤러 모듈을 불러오지 않고 직접 로드)
+TECH_MATCHER = load_matcher()
+TECH_INDEX = {tech: i for i, tech in enumerate(TECH_MATCHER.techs)}
+
+
+class SkillProfile:
+    """기술별 가중치(숙련도/선호도, 기본 1)와 경력 연차"""
+
+    def __init__(self, skills: Dict[str, float], years: Optional[int] = None):
+        unknown = [tech for tech in skills if tech not in TECH_INDEX]
+        if unknown:
+            print(f"⚠️  기술 사전에 없는 기술은 무시: {', '.join(unknown)}")
+        self.skills = {tech: float(weight) for tech, weight in skills.items() if tech in TECH_INDEX}
+        self.years = years
+
+        # 보유 기술은 가중치, 미보유 기술은 0 (분자) / 1 (분모)
+        self.have = np.zeros(len(TECH_INDEX), dtype=np.float32)
+        for tech, weight in self.skills.items():
+            self.have[TECH_INDEX[tech]] = weight
+        self.need = np.where(self.have > 0, self.have, 1).astype(np.float32)
+
+    @classmethod
+    def load(cls, path: str) -> 'SkillProfile':
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data.get('skills', {}), data.get('years'))
+
+    @classmethod
+    def parse(cls, specs: List[str], years: Optional[int] = None) -> 'SkillProfile':
+        """['Python:3', 'AWS:2', 'Docker'] → 프로필 (가중치 생략 시 1)"""
+        skills = {}
+        for spec in specs:
+            tech, _, weight = spec.rpartition(':') if ':' in spec else (spec, '', '1')
+            skills[tech] = float(weight)
+        return cls(skills, years)
+
+
+def tech_bits(techs: Iterable[str]) -> np.ndarray:
+    """기술 목록 → 기술 순서 불리언 벡터"""
+    row = np.zeros(len(TECH_INDEX), dtype=bool)
+    for tech in techs:
+        index = TECH_INDEX.get(tech)
+        if index is not None:
+            row[index] = True
+    return row
+
+
+def posting_techs(job: Dict) -> Tuple[List[str], List[str]]:
+    """(자격요건 기술, 우대사항 기술) - 자격요건 텍스트가 없는 공고는 상세 기술스택을 자격요건으로"""
+    qualifications, preferred = job.get('qualifications') or '', job.get('preferred') or ''
+    detail = job.get('full_description')
+    if not qualifications and isinstance(detail, dict):  # 이전 원티드 JSON: 섹션 dict
+        qualifications, preferred = detail.get('requirements') or '', detail.get('preferred_points') or ''
+    required = TECH_MATCHER.find(qualifications)
+    preferred = TECH_MATCHER.find(preferred)
+    if not required and not preferred:
+        required = list(job.get('detail_tech_stack') or [])
+    return required, [tech for tech in preferred if tech not in required]
+
+
+class SkillRanker:
+    """공고 비트 벡터 보관 + 프로필 점수 + 상위 K개 힙"""
+
+    def __init__(self, profile: SkillProfile, top: int = 20):
+        self.profile = profile
+        self.top = top
+        self.postings = []                  # (출처, 회사, 제목, 링크, 자격요건 기술, 우대사항 기술)
+        self._required_blocks = []          # packbits된 (공고 수 × 기술/8) 블록
+        self._preferred_blocks = []
+        self._years = []                    # (min_years, max_years), 모르면 -1
+        self._heap = []                     # (점수, 공고 번호) 최소 힙, 크기 ≤ top
+
+    def __len__(self):
+        return len(self.postings)
+
+    # ------------------------------------------------------------------
+    # 공고 추가
+    # ------------------------------------------------------------------
+
+    def add(self, jobs: Iterable[Dict]) -> int:
+        """공고 추가 후 새 공고만 점수를 매겨 상위 K 힙 갱신, 추가한 공고 수 반환"""
+        start = len(self.postings)
+        required_rows, preferred_rows, years = [], [], []
+        for job in jobs:
+            required, preferred = posting_techs(job)
+            self.postings.append((job.get('source', ''), job.get('company', ''), job.get('title', ''),
+                                  job.get('link', ''), required, preferred))
+            required_rows.append(tech_bits(required))
+            preferred_rows.append(tech_bits(preferred))
+            years.append((_int_or(job.get('min_years')), _int_or(job.get('max_years'))))
+
+        if not years:
+            return 0
+        required = np.packbits(np.array(required_rows), axis=1)
+        preferred = np.packbits(np.array(preferred_rows), axis=1)
+        years = np.array(years, dtype=np.int16).reshape(-1, 2)
+        self._required_blocks.append(required)
+        self._preferred_blocks.append(preferred)
+        self._years.append(years)
+
+        self._push(start, self._score(required, preferred, years))
+        return len(years)
+
+    # ------------------------------------------------------------------
+    # 점수
+    # ------------------------------------------------------------------
+
+    def _score(self, required: np.ndarray, preferred: np.ndarray, years: np.ndarray) -> np.ndarray:
+        """packbits 블록 → 공고별 점수 (0~1)"""
+        tech_count = len(TECH_INDEX)
+        have, need = self.profile.have, self.profile.need
+        scores = np.empty(len(required), dtype=np.float32)
+
+        for lo in range(0, len(required), SCORE_BLOCK):
+            hi = lo + SCORE_BLOCK
+            r = np.unpackbits(required[lo:hi], axis=1, count=tech_count).astype(np.float32)
+            p = np.unpackbits(preferred[lo:hi], axis=1, count=tech_count).astype(np.float32)
+            matched = r @ have + PREFERRED_WEIGHT * (p @ have)
+            total = r @ need + PREFERRED_WEIGHT * (p @ need)
+            scores[lo:hi] = matched / np.maximum(total, 1e-9)
+
+        if self.profile.years is not None:
+            min_years, max_years = years[:, 0], years[:, 1]
+            shortage = np.where(min_years >= 0, np.maximum(min_years - self.profile.years, 0), 0)
+            factor = np.maximum(1 - UNDER_EXPERIENCE_PENALTY * shortage, 0)
+            factor[(max_years >= 0) & (self.profile.years > max_years)] *= 1 - OVER_EXPERIENCE_PENALTY
+            scores *= factor
+        return scores
+
+    def _push(self, offset: int, scores: np.ndarray):
+        """새 점수 중 현재 K번째보다 높은 것만 힙에 반영"""
+        threshold = self._heap[0][0] if len(self._heap) >= self.top else 0.0
+        for index in np.flatnonzero(scores > threshold):
+            item = (float(scores[index]), -(offset + int(index)))   # 동점이면 먼저 들어온 공고 우선
+            if len(self._heap) < self.top:
+                heapq.heappush(self._heap, item)
+            elif item > self._heap[0]:
+                heapq.heapreplace(self._heap, item)
+
+    def scores(self) -> np.ndarray:
+        """전체 공고 점수 (추가 순서)"""
+        if not self.postings:
+            return np.empty(0, dtype=np.float32)
+        return self._score(np.concatenate(self._required_blocks), np.concatenate(self._preferred_blocks),
+                           np.concatenate(self._years))
+
+    def set_profile(self, profile: SkillProfile):
+        """프로필이 바뀌면 전체 재계산 (블록을 하나로 합쳐 이후 계산도 한 번에)"""
+        self.profile = profile
+        self._heap = []
+        if self.postings:
+            self._required_blocks = [np.concatenate(self._required_blocks)]
+            self._preferred_blocks = [np.concatenate(self._preferred_blocks)]
+            self._years = [np.concatenate(self._years)]
+            self._push(0, self.scores())
+
+    def ranking(self) -> List[Dict]:
+        """상위 K개 공고 (점수 내림차순), 보유/부족 기술 포함"""
+        results = []
+        for score, negative_index in sorted(self._heap, reverse=True):
+            source, company, title, link, required, preferred = self.postings[-negative_index]
+            results.append({
+                'score': round(score * 100, 1),
+                'source': source,
+                'company': company,
+                'title': title,
+                'link': link,
+                'matched': [tech for tech in required + preferred if tech in self.profile.skills],
+                'missing': [tech for tech in required if tech not in self.profile.skills],
+            })
+        return results
+
+
+def _int_or(value, default: int = -1) -> int:
+    return default if value is None or value == '' else int(value)
+
+
+def load_postings(db_path: Optional[str] = None, files: Optional[List[str]] = None) -> List[Dict]:
+    """JobStore DB 또는 jobs_full_*.json / jobs_*.jsonl / jobs_*.parquet 파일에서 공고 로드"""
+    if files:
+        parquet_paths = [path for path in files if path.endswith('.parquet')]
+        jobs = []
+        if parquet_paths:
+            from job_record import read_parquet
+            columns = ['source', 'company', 'title', 'link', 'qualifications', 'preferred',
+                       'detail_tech_stack', 'min_years', 'max_years']
+            jobs.extend(read_parquet(parquet_paths, columns=columns).to_pylist())
+        other = [path for path in files if not path.endswith('.parquet')]
+        if other:
+            from batch_analysis import load_corpus
+            jobs.extend(load_corpus(other))
+        return jobs
+
+    from job_store import JobStore
+    store = JobStore(db_path)
+    jobs = store.load_jobs()
+    store.close()
+    return jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description='내 스킬셋 매칭 점수로 공고 순위 매기기')
+    parser.add_argument('--profile', help='프로필 JSON ({"skills": {"Python": 3}, "years": 3})')
+    parser.add_argument('--skills', nargs='+', default=[], help='기술[:가중치] 목록 (예: Python:3 AWS Docker)')
+    parser.add_argument('--years', type=int, help='내 경력 연차 (프로필 값보다 우선)')
+    parser.add_argument('--db', default='jobs.sqlite', help='JobStore DB 경로 (기본: jobs.sqlite)')
+    parser.add_argument('--files', nargs='+', help='DB 대신 공고 파일 사용 (json/jsonl/parquet)')
+    parser.add_argument('--top', type=int, default=20)
+    args = parser.parse_args()
+
+    if args.profile:
+        profile = SkillProfile.load(args.profile)
+        if args.years is not None:
+            profile.years = args.years
+    elif args.skills:
+        profile = SkillProfile.parse(args.skills, args.years)
+    else:
+        parser.error('--profile 또는 --skills 필요')
+
+    jobs = load_postings(args.db, args.files)
+    ranker = SkillRanker(profile, top=args.top)
+    start = time.perf_counter()
+    ranker.add(jobs)
+    elapsed = time.perf_counter() - start
+
+    print("=" * 70)
+    print(f"🎯 스킬셋 매칭: 공고 {len(ranker):,}개 ({elapsed:.2f}초)")
+    print(f"   내 기술: {', '.join(f'{t}({w:g})' for t, w in profile.skills.items())}"
+          f"{f' / 경력 {profile.years}년' if profile.years is not None else ''}")
+    print("=" * 70)
+    for rank, job in enumerate(ranker.ranking(), 1):
+        print(f"\n{rank:2}. [{job['score']:5.1f}점] [{job['source']}] {job['company']} | {job['title']}")
+        print(f"    ✅ 보유: {', '.join(job['matched']) or '-'}")
+        if job['missing']:
+            print(f"    ❌ 부족: {', '.join(job['missing'])}")
+        if job['link']:
+            print(f"    🔗 {job['link']}")
+
+
+if __name__ == '__main__':
+    main()
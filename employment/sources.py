@@ -0,0 +1,250 @@
+"""
+채용 사이트 어댑터 - 사이트마다 다른 부분(목록 URL, 목록 파싱, 상세 URL, 상세 파싱)만 모은 클래스
+
+요청/재시도/동시성 제한은 fetch_engine.FetchEngine이 공통으로 처리하므로
+새 사이트는 SourceAdapter를 상속한 클래스를 만들어 ADAPTERS에 추가하면 됨 (엔진 수정 불필요)
+
+어댑터가 반환하는 공고 dict
+- 목록: source, title, company, link, conditions, sector, raw_text (+ 출처 ID: rec_idx / job_id)
+- 상세: qualifications, preferred, responsibilities, benefits, salary, experience_years, education,
+        full_description, detail_tech_stack
+"""
+
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+# 상세 섹션 제목 → 필드 (앞에서부터 먼저 맞는 필드)
+SECTION_FIELDS = [
+    ('qualifications', ['자격요건', '자격 요건', '필수', '지원자격']),
+    ('preferred', ['우대', '선호', '가산점']),
+    ('responsibilities', ['담당업무', '업무내용', '주요업무', '담당 업무']),
+    ('benefits', ['복리후생', '혜택', '복지']),
+]
+
+
+def classify_sections(sections: List[Tuple[str, str]]) -> Dict[str, str]:
+    """(제목, 내용) 섹션 목록 → 자격요건/우대사항/담당업무/복리후생 필드"""
+    fields = {field: '' for field, _ in SECTION_FIELDS}
+    for header, content in sections:
+        for field, keywords in SECTION_FIELDS:
+            if any(k in header for k in keywords):
+                fields[field] = content
+                break
+    return fields
+
+
+class SourceAdapter:
+    """사이트 어댑터 기본 클래스"""
+
+    name = ''               # 공고 dict의 source 값
+    key = ''                # 공고 키 접두어 (seen_index.posting_key의 'saramin:…' 등)
+    domain = ''             # 요청 속도 제한 단위 (비동기 백엔드의 토큰 버킷 키)
+    base_url = ''
+    list_format = 'html'    # 'html' | 'json'
+    detail_format = 'html'
+    concurrency = None      # 동시 요청 수 (None이면 엔진 기본값)
+    min_interval = None     # 요청 시작 간격(초) (None이면 엔진 기본값)
+    list_window = 1         # 목록 페이지를 몇 개씩 동시에 요청할지 (1이면 순서대로 하나씩)
+    detail_pattern = None   # 상세 요청 URL 정규식 - 이 URL만 HTTP 캐시에 저장 (목록/검색은 매번 새로 요청)
+
+    def __init__(self, parser, extract_tech_stack: Callable[[str], List[str]], base_url: Optional[str] = None):
+        self.parser = parser
+        self.extract_tech_stack = extract_tech_stack
+        if base_url:
+            self.base_url = base_url
+
+    def list_urls(self, keyword: str, pages: int, limit: int) -> List[str]:
+        """검색 목록 요청 URL (페이지 순서)"""
+        raise NotImplementedError
+
+    def parse_list(self, body) -> Tuple[List[Dict], int]:
+        """목록 응답 → (공고 목록, 응답 안의 항목 수)"""
+        raise NotImplementedError
+
+    def is_last_page(self, body, item_count: int) -> bool:
+        """이 목록 응답 이후로 더 요청할 페이지가 없는지 (페이지 수만큼 요청하는 사이트는 항상 False)"""
+        return False
+
+    def detail_url(self, job: Dict) -> Optional[str]:
+        """상세 요청 URL (상세를 지원하지 않거나 ID가 없으면 None)"""
+        return None
+
+    def is_detail_url(self, url: str) -> bool:
+        return bool(self.detail_pattern and re.search(self.detail_pattern, url))
+
+    def parse_detail(self, body) -> Dict:
+        """상세 응답 → 상세 필드 dict"""
+        raise NotImplementedError
+
+    def _detail_fields(self, sections: List[Tuple[str, str]], parsed: Dict) -> Dict:
+        """HTML 상세 파서 결과 → 상세 필드 (섹션 분류 + 기술스택 추출)"""
+        detail = classify_sections(sections)
+        detail.update({
+            'salary': parsed['salary'],
+            'experience_years': parsed['career'],
+            'education': parsed['education'],
+            'full_description': parsed['full_description'],
+        })
+        full_text = (f"{detail['qualifications']} {detail['preferred']} {detail['responsibilities']} "
+                     f"{detail['full_description']}")
+        detail['detail_tech_stack'] = self.extract_tech_stack(full_text)
+        return detail
+
+
+class SaraminAdapter(SourceAdapter):
+    name = '사람인'
+    key = 'saramin'
+    domain = 'saramin.co.kr'
+    base_url = 'https://www.saramin.co.kr'
+    detail_pattern = r'/zf_user/jobs/relay/view\?'
+
+    def list_urls(self, keyword: str, pages: int, limit: int) -> List[str]:
+        return [f"{self.base_url}/zf_user/search/recruit?searchType=search&searchword={quote(keyword)}"
+                f"&recruitPage={page}" for page in range(1, pages + 1)]
+
+    def parse_list(self, body: str) -> Tuple[List[Dict], int]:
+        items = self.parser.saramin_list(body)
+        jobs = []
+        for item in items:
+            if item['href'] is None:
+                continue
+            job = {
+                'source': self.name,
+                'title': item['title'],
+                'company': item['company'],
+                'link': self.base_url + item['href'],
+                'conditions': item['conditions'],
+                'sector': item['sector'],
+                'raw_text': item['raw_text'],
+            }
+            # rec_idx가 있으면 상세 페이지 주소로 정규화
+            match = re.search(r'rec_idx=(\d+)', item['href'])
+            if match:
+                job['rec_idx'] = match.group(1)
+                job['link'] = f"{self.base_url}/zf_user/jobs/relay/view?rec_idx={match.group(1)}"
+            jobs.append(job)
+        return jobs, len(items)
+
+    def detail_url(self, job: Dict) -> Optional[str]:
+        return job.get('link') or None
+
+    def parse_detail(self, body: str) -> Dict:
+        parsed = self.parser.saramin_detail(body)
+        return self._detail_fields(parsed['sections'], parsed)
+
+
+class JobKoreaAdapter(SourceAdapter):
+    name = '잡코리아'
+    key = 'jobkorea'
+    domain = 'jobkorea.co.kr'
+    base_url = 'https://www.jobkorea.co.kr'
+    detail_pattern = r'/Recruit/GI_Read_Comt_Ifrm\?'
+
+    def list_urls(self, keyword: str, pages: int, limit: int) -> List[str]:
+        return [f"{self.base_url}/Search/?stext={quote(keyword)}&tabType=recruit&Page_No={page}"
+                for page in range(1, pages + 1)]
+
+    def parse_list(self, body: str) -> Tuple[List[Dict], int]:
+        items = self.parser.jobkorea_list(body)
+        jobs = [{
+            'source': self.name,
+            'title': item['title'],
+            'company': item['company'],
+            'link': self.base_url + item['href'],
+            'conditions': item['conditions'],
+            'sector': '',
+            'raw_text': item['raw_text'],
+        } for item in items if item['href'] is not None]
+        return jobs, len(items)
+
+    def detail_url(self, job: Dict) -> Optional[str]:
+        # 공고 페이지(GI_Read)의 상세요강은 프레임으로 따로 로드되므로 프레임 페이지를 직접 요청
+        match = re.search(r'GI_Read/(\d+)', job.get('link', ''))
+        return f"{self.base_url}/Recruit/GI_Read_Comt_Ifrm?Gno={match.group(1)}" if match else None
+
+    def parse_detail(self, body: str) -> Dict:
+        parsed = self.parser.jobkorea_detail(body)
+        return self._detail_fields(parsed['sections'], parsed)
+
+
+class WantedAdapter(SourceAdapter):
+    name = '원티드'
+    key = 'wanted'
+    domain = 'wanted.co.kr'
+    base_url = 'https://www.wanted.co.kr'
+    detail_pattern = r'/api/v4/jobs/\d+(?:\?|$)'
+    list_format = 'json'
+    detail_format = 'json'
+    list_window = 4
+    page_size = 50          # 목록 API 한 번에 받는 공고 수
+
+    def list_urls(self, keyword: str, pages: int, limit: int) -> List[str]:
+        # limit은 키워드당 최대 공고 수, page_size씩 offset을 옮겨가며 요청
+        return [f"{self.base_url}/api/v4/jobs?country=kr&job_sort=company.response_rate_order&years=-1"
+                f"&locations=all&query={quote(keyword)}&offset={offset}&limit={min(self.page_size, limit - offset)}"
+                for offset in range(0, limit, self.page_size)]
+
+    def parse_list(self, data: Dict) -> Tuple[List[Dict], int]:
+        items = data.get('data', [])
+        jobs = []
+        for item in items:
+            company = item.get('company', {}).get('name', '')
+            jobs.append({
+                'source': self.name,
+                'title': item.get('position', ''),
+                'company': company,
+                'job_id': item.get('id', ''),
+                'link': f"https://www.wanted.co.kr/wd/{item.get('id', '')}",
+                'conditions': [],
+                'sector': '',
+                'raw_text': f"{item.get('position', '')} {company}",
+            })
+        return jobs, len(items)
+
+    def is_last_page(self, data: Dict, item_count: int) -> bool:
+        # 다음 페이지가 있으면 links.next에 다음 offset 주소가 내려옴
+        return not (data.get('links') or {}).get('next') or item_count < self.page_size
+
+    def detail_url(self, job: Dict) -> Optional[str]:
+        return f"{self.base_url}/api/v4/jobs/{job['job_id']}" if job.get('job_id') else None
+
+    def parse_detail(self, data: Dict) -> Dict:
+        job_data = data.get('job', {})
+        # 실제 API는 job.detail 아래에 섹션별 dict로 내려옴 (requirements, main_tasks, intro, ...)
+        sections = job_data.get('detail')
+        if isinstance(sections, dict):
+            full_description = '\n'.join(v for v in sections.values() if isinstance(v, str) and v)
+        else:
+            sections, full_description = job_data, job_data.get('detail', '')
+
+        detail = {
+            'qualifications': sections.get('requirements', ''),
+            'preferred': sections.get('preferred_points') or sections.get('preferred', ''),
+            'responsibilities': sections.get('main_tasks') or sections.get('responsibilities', ''),
+            'benefits': sections.get('benefits', ''),
+            'salary': '',
+            'experience_years': '',
+            'education': '',
+            'full_description': full_description,
+        }
+
+        # 기술 태그 + 본문에서 추출한 기술스택
+        tags = [tag.get('title', '') for tag in job_data.get('skill_tags', [])]
+        full_text = f"{detail['qualifications']} {detail['preferred']} {detail['responsibilities']} {full_description}"
+        detail['detail_tech_stack'] = list(set(tags + self.extract_tech_stack(full_text)))
+        return detail
+
+
+# 등록된 사이트 (순서 = 크롤링 순서)
+ADAPTERS = [SaraminAdapter, JobKoreaAdapter, WantedAdapter]
+
+
+def build_adapters(parser, extract_tech_stack: Callable[[str], List[str]]) -> Dict[str, SourceAdapter]:
+    """출처 이름 → 어댑터 인스턴스"""
+    return {cls.name: cls(parser, extract_tech_stack) for cls in ADAPTERS}
+
+
+def detail_cache_rule(adapters: Dict[str, SourceAdapter]) -> Callable[[str], bool]:
+    """CachedSession의 cacheable 인자 - 어댑터의 상세 URL만 캐시"""
+    return lambda url: any(adapter.is_detail_url(url) for adapter in adapters.values())
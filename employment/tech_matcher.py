@@ -0,0 +1,200 @@
+"""
+기술스택 매처 - 별칭 사전(tech_aliases.json)의 모든 별칭을 정규식 하나로 컴파일해 텍스트 한 번 순회로 찾음
+
+기존 extract_tech_stack은 별칭마다 `in` 검색을 반복해 O(별칭 수 × 텍스트 길이)였고,
+'ts', 'js', 'mq' 같은 짧은 별칭이 다른 단어 안에서도 매칭되는 문제가 있었음.
+여기서는 별칭을 첫 글자 종류(영문자/숫자/한글/기타)별 트라이 모양 정규식으로 묶어 re(C 구현)가 한 번만 훑고,
+단어 경계는 별칭 앞뒤의 lookaround로 처리 (영문자↔숫자가 바뀌는 위치도 경계).
+- 'ts' → (?<![a-z_])ts(?![a-z_]) 이므로 'function'이나 'typescripts' 안에서는 매칭되지 않음
+- 한글은 ASCII 단어 문자가 아니므로 'python을', 'go언어' 처럼 조사/한글이 붙어도 매칭됨
+- 버전 숫자가 붙어도 매칭: 'Python3', 'Java8' → Python, Java ('k8s', 'ec2', 'es6'는 별칭 그대로 매칭)
+- 트라이로 묶지 않은 단순 alternation은 위치마다 별칭 전부를 시도해 수십 배 느림 → 첫 글자부터 공유
+  (benchmarks/bench_tech_matcher.py: 기존 substring 검색보다 빨라야 통과)
+
+별칭 해석 규칙
+- 최장 일치: 겹치는 매칭은 가장 왼쪽에서 시작하는 가장 긴 별칭만 인정 ('spring boot'는 Spring Boot만)
+  (트라이의 각 분기에서 더 긴 별칭을 먼저 시도하고, 경계 조건이 안 맞으면 짧은 별칭으로 되돌아감)
+- 한글 조사: 한글로 끝나는 별칭 뒤에 붙은 한글은 조사/접미어(KOREAN_TAIL)일 때만 허용
+  ('파이썬을', '카프카와'는 매칭, '자바스크립트' 안의 '자바', '깃발'의 '깃'은 매칭 안 됨)
+  한글로 시작하는 별칭은 앞 글자가 한글이 아니어야 함
+- 상위 기술(rollups): 'Spring Boot' → 'Spring', 'BigQuery' → 'GCP' 처럼 찾은 기술의 상위 기술은
+  find(rollup=True)로 명시했을 때만 함께 반환 (같은 별칭을 두 기술에 넣던 방식 대신)
+  공고에 저장하는 기술 목록은 찾은 기술만 - 상위 기술까지 넣으면 집계에서 'Spring'이 Spring Boot 공고마다 중복 집계됨
+
+사전은 load_matcher()가 컴파일하고 결과를 __pycache__/tech_aliases.pickle에 캐시
+(사전 파일 내용이나 COMPILE_VERSION이 바뀌면 다시 컴파일)
+
+사용법 (사전 수정 후 확인):
+    python tech_matcher.py "파이썬과 스프링부트 기반 MSA 경험" [--aliases tech_aliases.json] [--rollup]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import re
+from typing import Dict, List, Optional
+
+DEFAULT_ALIASES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tech_aliases.json')
+COMPILE_VERSION = '5'  # TechMatcher 내부 구조/매칭 규칙이 바뀌면 올려서 pickle 캐시 무효화
+
+# 한글 별칭 뒤에 붙어도 되는 접미어(선택) + 조사(0개 이상): '파이썬을', '스파크기반의', '카프카와', '애자일한'
+KOREAN_TAIL = re.compile(
+    r'(?:기반|개발자?|백엔드|경험|활용|사용|환경|엔지니어|프레임워크|한|하게|하고|적인?)?'
+    r'(?:으로|에서|이나|이랑|까지|부터|처럼|보다|에는|을|를|이|가|은|는|와|과|의|에|로|도|만|랑|나|및|등)*'
+)
+
+
+# 별칭 첫/끝 글자 종류별 경계 조건 - 같은 종류의 글자와 붙어 있으면 다른 단어의 일부
+_START_GUARDS = {'letter': r'(?<![a-z_])', 'digit': r'(?<![0-9_])', 'hangul': r'(?<![가-힣])', 'other': ''}
+_END_GUARDS = {'letter': r'(?![a-z_])', 'digit': r'(?![0-9_])',
+               'hangul': rf'(?=(?:{KOREAN_TAIL.pattern})(?![가-힣]))', 'other': ''}
+
+
+def _is_hangul(ch: str) -> bool:
+    return '가' <= ch <= '힣'
+
+
+def _char_kind(ch: str) -> str:
+    if 'a' <= ch <= 'z' or ch == '_':
+        return 'letter'
+    if '0' <= ch <= '9':
+        return 'digit'
+    return 'hangul' if _is_hangul(ch) else 'other'
+
+
+def _trie_pattern(aliases: List[str]) -> str:
+    """별칭 목록 → 공통 접두어를 묶은 정규식 (각 분기에서 긴 별칭 먼저, 끝에 경계 조건)"""
+    trie = {}
+    for alias in aliases:
+        node = trie
+        for ch in alias:
+            node = node.setdefault(ch, {})
+        node[''] = alias
+
+    def build(node: Dict) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if '' in node:
+            branches.append(_END_GUARDS[_char_kind(node[''][-1])])
+        return branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+
+    return build(trie)
+
+
+class TechMatcher:
+    def __init__(self, keywords: Dict[str, List[str]], rollups: Optional[Dict[str, List[str]]] = None,
+                 categories: Optional[Dict[str, str]] = None):
+        """keywords: 기술 → 별칭 목록, rollups: 기술 → 상위 기술 목록, categories: 기술 → 카테고리"""
+        self.keywords = keywords
+        self.techs = list(keywords)
+        self.categories = categories or {}
+        # 사전 내용 해시 - 추출 결과 캐시가 사전이 바뀌면 무효화되도록 키에 포함
+        self.fingerprint = hashlib.md5(json.dumps(
+            [keywords, rollups or {}, COMPILE_VERSION], ensure_ascii=False).encode('utf-8')).hexdigest()
+        tech_index = {tech: i for i, tech in enumerate(self.techs)}
+        self._rollups = self._expand_rollups(rollups or {}, tech_index)
+
+        # 별칭(소문자) → 기술 인덱스, 첫 글자 종류별 트라이 정규식 하나로 합침
+        self._owners = {}
+        groups = {kind: [] for kind in _START_GUARDS}
+        for index, (tech, aliases) in enumerate(keywords.items()):
+            for alias in aliases:
+                alias = alias.strip().lower()
+                if not alias:
+                    continue
+                if self._owners.setdefault(alias, index) != index:
+                    raise ValueError(f"별칭 '{alias}'이(가) {self.techs[self._owners[alias]]}, {tech} 두 기술에 있음")
+                groups[_char_kind(alias[0])].append(alias)
+        self._pattern = re.compile('|'.join(
+            _START_GUARDS[kind] + _trie_pattern(aliases) for kind, aliases in groups.items() if aliases))
+
+    def _expand_rollups(self, rollups: Dict[str, List[str]], tech_index: Dict[str, int]) -> List[tuple]:
+        """기술별 모든 상위 기술 인덱스 (여러 단계 rollup을 펼침, 순환은 무시)"""
+        for tech, parents in rollups.items():
+            unknown = [name for name in [tech, *parents] if name not in tech_index]
+            if unknown:
+                raise ValueError(f"rollups에 사전에 없는 기술: {', '.join(unknown)}")
+
+        expanded = []
+        for tech in self.techs:
+            seen, stack = set(), list(rollups.get(tech, []))
+            while stack:
+                parent = stack.pop()
+                if parent != tech and parent not in seen:
+                    seen.add(parent)
+                    stack.extend(rollups.get(parent, []))
+            expanded.append(tuple(sorted(tech_index[parent] for parent in seen)))
+        return expanded
+
+    def find(self, text: str, rollup: bool = False) -> List[str]:
+        """텍스트에 등장하는 기술 목록 (사전 정의 순서, rollup=True면 상위 기술 포함 - 저장용이 아닌 보기용)"""
+        owners = self._owners
+        found = {owners[alias] for alias in self._pattern.findall(text.lower())}
+        if rollup:
+            for index in list(found):
+                found.update(self._rollups[index])
+        return [self.techs[index] for index in sorted(found)]
+
+    def category(self, tech: str) -> str:
+        return self.categories.get(tech, '')
+
+
+def compile_aliases(data: Dict) -> TechMatcher:
+    """별칭 사전 dict ({'categories': {카테고리: {기술: [별칭]}}, 'rollups': {...}}) → TechMatcher"""
+    keywords, categories = {}, {}
+    for category, techs in data['categories'].items():
+        for tech, aliases in techs.items():
+            if tech in keywords:
+                raise ValueError(f"기술 '{tech}'이(가) 여러 카테고리에 있음")
+            keywords[tech] = aliases
+            categories[tech] = category
+    return TechMatcher(keywords, data.get('rollups'), categories)
+
+
+def load_matcher(path: str = DEFAULT_ALIASES, cache_path: Optional[str] = None) -> TechMatcher:
+    """별칭 사전 JSON → TechMatcher (컴파일 결과를 pickle로 캐시해 시작할 때 다시 컴파일하지 않음)"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.md5(raw + COMPILE_VERSION.encode()).hexdigest()
+    if cache_path is None:
+        name = os.path.splitext(os.path.basename(path))[0]
+        cache_path = os.path.join(os.path.dirname(os.path.abspath(path)), '__pycache__', f'{name}.pickle')
+
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_digest, matcher = pickle.load(f)
+        if cached_digest == digest:
+            return matcher
+    except Exception:
+        pass  # 캐시 없음/손상/이전 형식 → 다시 컴파일
+
+    matcher = compile_aliases(json.loads(raw.decode('utf-8')))
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((digest, matcher), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)  # 여러 프로세스가 동시에 써도 완성된 파일만 보이도록
+    except OSError:
+        pass  # 읽기 전용 설치 등 → 캐시 없이 사용
+    return matcher
+
+
+def main():
+    parser = argparse.ArgumentParser(description='기술스택 별칭 사전 확인')
+    parser.add_argument('text', nargs='*', help='기술을 찾을 텍스트 (생략하면 사전 검사만)')
+    parser.add_argument('--aliases', default=DEFAULT_ALIASES, help='별칭 사전 JSON 경로')
+    parser.add_argument('--rollup', action='store_true', help='상위 기술 포함')
+    args = parser.parse_args()
+
+    matcher = load_matcher(args.aliases)
+    alias_count = sum(len(aliases) for aliases in matcher.keywords.values())
+    print(f"📚 기술 {len(matcher.techs)}개 / 별칭 {alias_count}개 / 카테고리 {len(set(matcher.categories.values()))}개")
+    if args.text:
+        for tech in matcher.find(' '.join(args.text), rollup=args.rollup):
+            print(f"   - {tech} ({matcher.category(tech)})")
+
+
+if __name__ == '__main__':
+    main()
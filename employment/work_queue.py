@@ -0,0 +1,233 @@
+"""
+영속 작업 큐 (SQLite) - 여러 워커 프로세스가 작업을 임대(lease)해서 처리
+
+- enqueue: 작업 키(dedup_key)가 같으면 무시 → 같은 작업을 여러 번 넣어도 한 번만 처리 (멱등)
+- lease: 대기 작업 또는 임대 시간(visibility_timeout)이 지난 작업을 워커 하나에 배정
+  → 워커가 죽거나 멈추면 임대가 만료되어 다른 워커가 다시 가져감
+  (임대 만료도 시도 1회 - max_attempts번 만료된 작업은 워커를 계속 죽이는 작업으로 보고 'failed')
+- complete/fail: 임대한 워커만 완료/실패 처리 가능 (만료 후 다른 워커가 가져간 작업은 무시)
+  실패하면 retry_delay × 2^(시도-1) 후 재시도, max_attempts번 실패하면 'failed'
+- release: 요청하지 않고 돌려준 작업 (출처 차단기가 열림 등) → 시도 횟수에 넣지 않고 delay 후 다시 배정
+- cancel_after: 같은 그룹에서 seq가 더 큰 대기 작업 취소 (목록 마지막 페이지 이후 페이지)
+- meta: 실행 설정 공유용 키-값 (run_id, base_url 등)
+
+BEGIN IMMEDIATE로 임대를 직렬화하므로 한 디렉터리(또는 잠금을 지원하는 공유 볼륨)의 큐 파일을 여러 프로세스가 같이 씀
+"""
+
+import json
+import sqlite3
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    dedup_key TEXT NOT NULL UNIQUE,
+    grp TEXT,
+    seq INTEGER NOT NULL DEFAULT 0,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_until REAL,
+    available_at REAL NOT NULL,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_ready ON tasks(status, kind, available_at);
+CREATE INDEX IF NOT EXISTS idx_tasks_group ON tasks(grp, seq);
+
+CREATE TABLE IF NOT EXISTS queue_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+@dataclass
+class Task:
+    task_id: int
+    kind: str
+    dedup_key: str
+    grp: Optional[str]
+    seq: int
+    payload: Dict
+    attempts: int
+
+
+class WorkQueue:
+    def __init__(self, path: str, visibility_timeout: float = 120, max_attempts: int = 4, retry_delay: float = 2.0):
+        self.path = path
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        # isolation_level=None: 트랜잭션을 직접 BEGIN IMMEDIATE로 시작
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA busy_timeout=30000")
+        self.conn.executescript(SCHEMA)
+
+    def _write(self, sql: str, params: Sequence = ()) -> int:
+        """쓰기 한 건 (자동 커밋) → 바뀐 행 수"""
+        return self.conn.execute(sql, params).rowcount
+
+    # ------------------------------------------------------------------
+    # 넣기 / 설정
+    # ------------------------------------------------------------------
+
+    def enqueue(self, kind: str, dedup_key: str, payload: Dict, grp: Optional[str] = None, seq: int = 0) -> bool:
+        """작업 추가 → 새로 추가됐으면 True (같은 키가 이미 있으면 False)"""
+        return self.enqueue_many(kind, [(dedup_key, payload, grp, seq)]) == 1
+
+    def enqueue_many(self, kind: str, items: Iterable[tuple]) -> int:
+        """(dedup_key, payload, grp, seq) 여러 개를 한 트랜잭션으로 추가 → 새로 추가된 수"""
+        now = time.time()
+        rows = [(kind, key, grp, seq, json.dumps(payload, ensure_ascii=False), now, now)
+                for key, payload, grp, seq in items]
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            before = self.conn.total_changes
+            self.conn.executemany(
+                """INSERT OR IGNORE INTO tasks (kind, dedup_key, grp, seq, payload, available_at, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""", rows)
+            added = self.conn.total_changes - before
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return added
+
+    def clear(self):
+        """모든 작업/설정 삭제 (새 실행 시작 전, 이전 실행의 완료 작업 키가 새 작업을 막지 않도록)"""
+        self.conn.execute("BEGIN IMMEDIATE")
+        self.conn.execute("DELETE FROM tasks")
+        self.conn.execute("DELETE FROM queue_meta")
+        self.conn.execute("COMMIT")
+
+    def set_meta(self, **values):
+        for key, value in values.items():
+            self._write("INSERT OR REPLACE INTO queue_meta VALUES (?, ?)", (key, json.dumps(value)))
+
+    def meta(self) -> Dict:
+        return {key: json.loads(value) for key, value in self.conn.execute("SELECT key, value FROM queue_meta")}
+
+    # ------------------------------------------------------------------
+    # 임대 / 완료
+    # ------------------------------------------------------------------
+
+    def lease(self, owner: str, limit: int = 1, kinds: Optional[Sequence[str]] = None) -> List[Task]:
+        """처리할 작업을 최대 limit개 임대 (목록 작업 먼저, 같은 종류는 넣은 순서)"""
+        now = time.time()
+        kind_sql = f"AND kind IN ({', '.join('?' * len(kinds))})" if kinds else ''
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            # 시도 횟수를 다 쓰고 임대가 만료된 작업은 다시 배정하지 않고 실패 처리
+            self.conn.execute(
+                """UPDATE tasks SET status = 'failed', finished_at = ?, lease_owner = NULL, lease_until = NULL,
+                       last_error = '임대 만료 (워커 중단)'
+                   WHERE status = 'leased' AND lease_until < ? AND attempts >= ?""",
+                (now, now, self.max_attempts),
+            )
+            rows = self.conn.execute(
+                f"""SELECT task_id, kind, dedup_key, grp, seq, payload, attempts FROM tasks
+                    WHERE ((status = 'pending' AND available_at <= ?) OR (status = 'leased' AND lease_until < ?))
+                    {kind_sql}
+                    ORDER BY kind = 'detail', task_id LIMIT ?""",
+                (now, now, *(kinds or ()), limit),
+            ).fetchall()
+            self.conn.executemany(
+                """UPDATE tasks SET status = 'leased', lease_owner = ?, lease_until = ?, attempts = attempts + 1
+                   WHERE task_id = ?""",
+                [(owner, now + self.visibility_timeout, row[0]) for row in rows],
+            )
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return [Task(task_id, kind, key, grp, seq, json.loads(payload), attempts + 1)
+                for task_id, kind, key, grp, seq, payload, attempts in rows]
+
+    def extend(self, task: Task, owner: str) -> bool:
+        """오래 걸리는 작업의 임대 연장 → 아직 이 워커의 임대면 True"""
+        return self._write(
+            "UPDATE tasks SET lease_until = ? WHERE task_id = ? AND status = 'leased' AND lease_owner = ?",
+            (time.time() + self.visibility_timeout, task.task_id, owner),
+        ) == 1
+
+    def complete(self, task: Task, owner: str) -> bool:
+        """완료 처리 → 이 워커의 임대였으면 True (만료되어 다른 워커가 가져갔으면 False)"""
+        return self._write(
+            """UPDATE tasks SET status = 'done', finished_at = ?, lease_owner = NULL, lease_until = NULL
+               WHERE task_id = ? AND status = 'leased' AND lease_owner = ?""",
+            (time.time(), task.task_id, owner),
+        ) == 1
+
+    def fail(self, task: Task, owner: str, error: str, min_delay: float = 0) -> str:
+        """실패 처리 → 'pending'(재시도 예약) 또는 'failed'(시도 횟수 초과), 임대를 잃었으면 ''
+
+        min_delay: 재시도 대기 하한 (출처 차단기가 닫히기 전에 다시 시도해 횟수만 쓰지 않도록)
+        """
+        status = 'failed' if task.attempts >= self.max_attempts else 'pending'
+        delay = max(self.retry_delay * 2 ** (task.attempts - 1), min_delay)
+        now = time.time()
+        changed = self._write(
+            """UPDATE tasks SET status = ?, available_at = ?, last_error = ?, lease_owner = NULL, lease_until = NULL,
+                   finished_at = CASE WHEN ? = 'failed' THEN ? END
+               WHERE task_id = ? AND status = 'leased' AND lease_owner = ?""",
+            (status, now + delay, error[:500], status, now, task.task_id, owner),
+        )
+        return status if changed else ''
+
+    def release(self, task: Task, owner: str, delay: float) -> bool:
+        """처리하지 않고 임대 반납 (시도 횟수 되돌림), delay초 뒤 다시 배정 → 이 워커의 임대였으면 True"""
+        return self._write(
+            """UPDATE tasks SET status = 'pending', available_at = ?, attempts = attempts - 1,
+                   lease_owner = NULL, lease_until = NULL
+               WHERE task_id = ? AND status = 'leased' AND lease_owner = ?""",
+            (time.time() + delay, task.task_id, owner),
+        ) == 1
+
+    def cancel_after(self, grp: str, seq: int) -> int:
+        """같은 그룹에서 seq 이후의 대기 작업 취소 → 취소한 수"""
+        return self._write(
+            """UPDATE tasks SET status = 'done', last_error = 'skipped', finished_at = ?
+               WHERE grp = ? AND seq > ? AND status = 'pending'""",
+            (time.time(), grp, seq),
+        )
+
+    # ------------------------------------------------------------------
+    # 상태
+    # ------------------------------------------------------------------
+
+    def counts(self) -> Dict[str, Counter]:
+        """종류별 상태 건수 {'list': Counter({'done': 12, ...}), 'detail': ...}"""
+        counts = {}
+        for kind, status, count in self.conn.execute(
+            "SELECT kind, status, COUNT(*) FROM tasks GROUP BY kind, status"
+        ):
+            counts.setdefault(kind, Counter())[status] = count
+        return counts
+
+    def is_drained(self) -> bool:
+        """대기/임대 중인 작업이 없는지"""
+        row = self.conn.execute("SELECT 1 FROM tasks WHERE status IN ('pending', 'leased') LIMIT 1").fetchone()
+        return row is None
+
+    def failed_payloads(self, kind: str) -> List[Dict]:
+        """끝내 실패한 작업의 payload (마감 때 목록 정보만이라도 저장)"""
+        return [json.loads(payload) for (payload,) in self.conn.execute(
+            "SELECT payload FROM tasks WHERE kind = ? AND status = 'failed' ORDER BY task_id", (kind,)
+        )]
+
+    def failures(self, limit: int = 20) -> List[tuple]:
+        return self.conn.execute(
+            "SELECT kind, dedup_key, attempts, last_error FROM tasks WHERE status = 'failed' ORDER BY task_id LIMIT ?",
+            (limit,),
+        ).fetchall()
+
+    def close(self):
+        self.conn.close()